@@ -0,0 +1,101 @@
+"""Microbenchmark: allocation latency and team balance, random vs skill-balanced.
+
+Allocates AP (3v3) and BP rounds from 8, 16 and 32 queued debaters with random
+Elo ratings, a third of AP debaters in 2-person parties. Run from the repo root:
+    python -m benchmarks.bench_allocation [--trials 200]
+"""
+import argparse
+import random
+import statistics
+import time
+
+from benchmarks.synthetic import make_members
+from cogs.matchmaking import Matchmaking
+from config import Config
+from utils.models import Party, RoundType
+
+
+def _legacy_allocation(cog: Matchmaking, debaters: list, team_sizes: list) -> list:
+    """The pre-balancing allocator: shuffle the units, first-fit them into teams."""
+    units = cog._build_allocation_units(debaters)
+    random.shuffle(units)
+    teams = [[] for _ in team_sizes]
+    for unit in units:
+        for team, size in zip(teams, team_sizes):
+            if len(team) + len(unit) <= size:
+                team.extend(unit)
+                break
+    return teams
+
+
+def _gap(teams: list, ratings: dict) -> float:
+    averages = [sum(ratings[m.id] for m in team) / len(team) for team in teams if team]
+    return max(averages) - min(averages)
+
+
+def _round_teams(debate_round) -> list:
+    teams = [debate_round.government.members, debate_round.opposition.members]
+    if debate_round.cg:
+        teams += [debate_round.cg.members, debate_round.co.members]
+    return teams
+
+
+def _setup(queued: int, with_parties: bool, rng: random.Random):
+    cog = Matchmaking(bot=None)
+    debaters = make_members(queued)
+    ratings = {m.id: rng.gauss(Config.ELO_DEFAULT, 150) for m in debaters}
+    if with_parties:
+        for i in range(0, queued // 3 * 2, 6):
+            host, partner = debaters[i], debaters[i + 1]
+            cog.parties[host.id] = Party(host=host, members=[host, partner])
+            cog.member_to_party[host.id] = host.id
+            cog.member_to_party[partner.id] = host.id
+    return cog, debaters, ratings
+
+
+def _bench(round_type: RoundType, team_sizes: list, queued: int, trials: int) -> dict:
+    rng = random.Random(queued)
+    judges = make_members(1, start_id=9000)
+    legacy_times, legacy_gaps, balanced_times, balanced_gaps = [], [], [], []
+    for _ in range(trials):
+        cog, debaters, ratings = _setup(queued, round_type != RoundType.BP, rng)
+
+        start = time.perf_counter()
+        teams = _legacy_allocation(cog, debaters, team_sizes)
+        legacy_times.append(time.perf_counter() - start)
+        legacy_gaps.append(_gap(teams, ratings))
+
+        start = time.perf_counter()
+        debate_round = cog.create_round_allocation(debaters, judges, round_type, ratings)
+        balanced_times.append(time.perf_counter() - start)
+        balanced_gaps.append(_gap(_round_teams(debate_round), ratings))
+
+    def p95(samples):
+        return sorted(samples)[int(len(samples) * 0.95) - 1]
+
+    return {
+        "legacy_ms": statistics.mean(legacy_times) * 1000,
+        "legacy_gap": statistics.mean(legacy_gaps),
+        "balanced_ms": statistics.mean(balanced_times) * 1000,
+        "balanced_p95_ms": p95(balanced_times) * 1000,
+        "balanced_gap": statistics.mean(balanced_gaps),
+    }
+
+
+def main(trials: int):
+    print(f"Allocation from N queued debaters, {trials} trials each (Elo ~ N(1000, 150))")
+    print(f"  {'round':<10}{'queued':>7}{'random ms':>11}{'random gap':>12}"
+          f"{'balanced ms':>13}{'p95 ms':>9}{'balanced gap':>14}")
+    for label, round_type, team_sizes in (("AP 3v3", RoundType.STANDARD, [3, 3]),
+                                          ("BP", RoundType.BP, [2, 2, 2, 2])):
+        for queued in (8, 16, 32):
+            r = _bench(round_type, team_sizes, queued, trials)
+            print(f"  {label:<10}{queued:>7}{r['legacy_ms']:>11.3f}{r['legacy_gap']:>12.1f}"
+                  f"{r['balanced_ms']:>13.3f}{r['balanced_p95_ms']:>9.3f}{r['balanced_gap']:>14.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--trials", type=int, default=200)
+    args = parser.parse_args()
+    main(args.trials)
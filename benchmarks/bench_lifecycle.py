@@ -0,0 +1,241 @@
+"""End-to-end benchmark: full round lifecycles against a fake Discord (benchmarks/fake_discord.py).
+
+Drives the real Matchmaking and Rounds cogs through every phase of N
+concurrent rounds: queue (joins, draw, confirmation prompts), confirm (every
+participant clicks, channels come from the pool or are created, room DMs,
+voice moves), motion (chair enters motions; AP adds the veto), prep end,
+ballot (results DMs, log_round) and teardown. Every API call takes a fixed
+round trip and may be rate limited. Reports wall-clock time per phase and
+API calls per round; the database is a throwaway file. Run from the repo
+root:
+    python -m benchmarks.bench_lifecycle [--format AP] [--rounds 8] [--latency-ms 50] [--rate-limit 0.02]
+"""
+import argparse
+import asyncio
+import logging
+import os
+import tempfile
+import time
+
+from benchmarks.fake_discord import FakeAPI, FakeBot, FakeContext, FakeGuild, FakeInteraction
+from cogs.matchmaking import Matchmaking
+from cogs.rounds import (
+    ChairJudgeControlView, ParticipantConfirmationView, PostBallotRoundCompleteView, Rounds, SubmitBallotView,
+)
+from config import Config
+from utils import database
+from utils.channel_pool import RoundChannelPool
+from utils.models import Ballot, BPBallot, RoundType, SpeakerScore
+from utils.scheduler import get_scheduler
+
+# Debaters per round for each format (AP rounds are drawn as 3v3 since every debater queues first)
+DEBATERS_PER_ROUND = {"1v1": 2, "AP": 6, "BP": 8}
+
+
+class _Phases:
+    """Wall-clock time and API calls per phase."""
+
+    def __init__(self, api: FakeAPI):
+        self.api = api
+        self.rows = []
+
+    async def run(self, name: str, coro):
+        calls = self.api.total
+        start = time.perf_counter()
+        result = await coro
+        self.rows.append((name, time.perf_counter() - start, self.api.total - calls))
+        return result
+
+
+def _views(channel, view_type) -> list:
+    return [m.view for m in channel.messages if isinstance(m.view, view_type)]
+
+
+async def _confirm(api: FakeAPI, guild: FakeGuild, view: ParticipantConfirmationView):
+    """Every participant clicks Confirm at once."""
+    await asyncio.gather(*(
+        view.confirm_button.callback(FakeInteraction(api, member, guild, view.message.channel, view.message))
+        for member in view.debate_round.get_all_participants()
+    ))
+
+
+async def _submit_modal(modal, interaction: FakeInteraction, *values):
+    for item, value in zip(modal.children, values):
+        item.value = value
+    await modal.callback(interaction)
+
+
+async def _motion(api: FakeAPI, guild: FakeGuild, rounds: Rounds, debate_round):
+    """The chair sets the motion and starts prep; for AP, three motions, release and both vetoes."""
+    chair_view: ChairJudgeControlView = rounds._chair_views[debate_round.round_id]
+    chair = debate_round.judges.chair
+
+    def interaction(user, message):
+        return FakeInteraction(api, user, guild, message.channel, message)
+
+    async def open_modal(user, button, message):
+        clicked = interaction(user, message)
+        await button.callback(clicked)
+        return clicked.response.modal
+
+    if debate_round.format_label == "AP":
+        for i, button in enumerate(chair_view._motion_buttons):
+            modal = await open_modal(chair, button, chair_view.message)
+            await _submit_modal(modal, interaction(chair, chair_view.message), f"THW benchmark motion {i}")
+        await chair_view._release_btn.callback(interaction(chair, chair_view.message))
+        veto_view = rounds._veto_views[debate_round.round_id]
+        for team, button in ((debate_round.government, veto_view.gov_btn), (debate_round.opposition, veto_view.opp_btn)):
+            modal = await open_modal(team.members[0], button, veto_view.message)
+            # Both teams veto motion 3 and prefer motion 1, so there's no coin toss
+            await _submit_modal(modal, interaction(team.members[0], veto_view.message), "1", "2", "3")
+        return
+
+    modal = await open_modal(chair, chair_view.children[0], chair_view.message)
+    await _submit_modal(modal, interaction(chair, chair_view.message), "THW benchmark motion")
+    await chair_view.children[0].callback(interaction(chair, chair_view.message))
+
+
+async def _end_prep(guild: FakeGuild, rounds: Rounds, debate_round):
+    """Fire the prep timer now instead of waiting it out."""
+    get_scheduler().cancel(("prep", debate_round.round_id))
+    await rounds.run_prep_timer(guild, debate_round, guild.get_channel(debate_round.prep_channel_id))
+
+
+def _scores(team, score: int) -> list:
+    return [SpeakerScore(member, team.get_position_name(i), score) for i, member in enumerate(team.members)]
+
+
+async def _ballot(api: FakeAPI, guild: FakeGuild, rounds: Rounds, debate_round):
+    """The chair's ballot, handed to finalize_ballot as the last ballot modal would."""
+    chair = debate_round.judges.chair
+    judges_text = guild.get_channel(debate_round.channel_ids["judges_text"])
+    ballot_view = _views(judges_text, SubmitBallotView)[0]
+    interaction = FakeInteraction(api, chair, guild, judges_text)
+    if debate_round.round_type == RoundType.BP:
+        positions = {
+            "og": Config.BP_OG_POSITIONS, "oo": Config.BP_OO_POSITIONS,
+            "cg": Config.BP_CG_POSITIONS, "co": Config.BP_CO_POSITIONS,
+        }
+        teams = {"og": debate_round.government, "oo": debate_round.opposition,
+                 "cg": debate_round.cg, "co": debate_round.co}
+        bp_ballot = BPBallot(
+            judge=chair, rankings={"og": 1, "oo": 2, "cg": 3, "co": 4},
+            team_scores={
+                key: [SpeakerScore(m, positions[key][i], 78 - rank) for i, m in enumerate(teams[key].members)]
+                for rank, key in enumerate(teams)
+            },
+        )
+        await rounds.finalize_bp_ballot(interaction, debate_round, bp_ballot, ballot_view)
+        return
+
+    gov, opp = debate_round.government, debate_round.opposition
+    replies = {}
+    if debate_round.round_type != RoundType.PM_LO:
+        replies = {
+            "gov_reply": SpeakerScore(gov.members[0], gov.get_position_name(0), 38),
+            "opp_reply": SpeakerScore(opp.members[0], opp.get_position_name(0), 37),
+        }
+    ballot = Ballot(
+        judge=chair, winner="Government", gov_scores=_scores(gov, 76), opp_scores=_scores(opp, 74), **replies
+    ).freeze()
+    await rounds.finalize_ballot(interaction, debate_round, ballot, ballot_view)
+
+
+async def _teardown(api: FakeAPI, guild: FakeGuild, rounds: Rounds, debate_round):
+    """The chair marks the round complete and confirms the deletion."""
+    chair = debate_round.judges.chair
+    text_channel = guild.get_channel(debate_round.channel_ids["text"])
+    complete_view = _views(text_channel, PostBallotRoundCompleteView)[0]
+    interaction = FakeInteraction(api, chair, guild, text_channel)
+    await complete_view.complete_callback(interaction)
+    confirm_view = interaction.response.view
+    await confirm_view.confirm_button.callback(FakeInteraction(api, chair, guild, text_channel))
+
+
+async def _each(rounds_list: list, step, *args):
+    await asyncio.gather(*(step(*args, debate_round) for debate_round in rounds_list))
+
+
+async def run(debate_format: str, count: int, api: FakeAPI, pool: bool) -> tuple:
+    guild = FakeGuild(api)
+    lobby = guild.add_text_channel("lobby")
+    standby = guild.add_voice_channel("waiting-room")
+    bot = FakeBot(guild, lobby)
+    matchmaking, rounds = Matchmaking(bot), Rounds(bot)
+    if not pool:
+        rounds.channel_pool = RoundChannelPool(sizes={})
+    bot.add_cog(matchmaking)
+    bot.add_cog(rounds)
+
+    debaters = [guild.add_member(f"debater{i}") for i in range(count * DEBATERS_PER_ROUND[debate_format])]
+    judges = [guild.add_member(f"judge{i}") for i in range(count)]
+    for member in debaters + judges:
+        await member.move_to(standby)
+    api.calls.clear()
+    api.rate_limited = 0
+
+    phases = _Phases(api)
+    await phases.run("setup", asyncio.gather(matchmaking.initialize_lobby(), rounds.channel_pool.warm(guild)))
+
+    def join(members: list, role: str):
+        return asyncio.gather(*(
+            matchmaking.join_command.callback(matchmaking, FakeContext(api, m, guild, lobby), role, debate_format)
+            for m in members
+        ))
+
+    async def queue():
+        await join(debaters, "debater")
+        # A draw deals out every queued judge (surplus ones as panelists), so judges
+        # arrive one draw's worth at a time to give each round a single chair
+        for i in range(0, count, Config.MAX_ROUNDS_PER_DRAW):
+            await join(judges[i:i + Config.MAX_ROUNDS_PER_DRAW], "judge")
+
+    await phases.run("queue", queue())
+    confirmations = _views(lobby, ParticipantConfirmationView)
+    await phases.run("confirm", asyncio.gather(*(_confirm(api, guild, view) for view in confirmations)))
+    started = list(matchmaking.active_rounds.values())
+
+    await phases.run("motion", _each(started, _motion, api, guild, rounds))
+    await phases.run("prep end", _each(started, _end_prep, guild, rounds))
+    await phases.run("ballot", _each(started, _ballot, api, guild, rounds))
+    await phases.run("teardown", _each(started, _teardown, api, guild, rounds))
+
+    logged = sum(r.db_round_id is not None for r in started)
+    left = len(matchmaking.active_rounds) + len(matchmaking.pending_rounds)
+    return phases.rows, len(started), logged, left
+
+
+async def main(debate_format: str, count: int, latency_ms: float, rate_limit: float, retry_after: float, pool: bool):
+    # The cogs log every step; keep the table readable
+    logging.basicConfig(level=logging.WARNING)
+    api = FakeAPI(latency_ms / 1000, rate_limit, retry_after)
+    with tempfile.TemporaryDirectory() as tmp:
+        await database.init_db(os.path.join(tmp, "lifecycle.db"))
+        try:
+            rows, started, logged, left = await run(debate_format, count, api, pool)
+        finally:
+            await database.close_db()
+
+    print(f"{count} {debate_format} rounds, {latency_ms:.0f}ms per API call, "
+          f"{rate_limit:.0%} rate-limited (retry after {retry_after:.1f}s), pool {'on' if pool else 'off'}")
+    print(f"  {'phase':<12}{'wall ms':>10}{'API calls':>11}{'calls/round':>13}")
+    for name, seconds, calls in rows:
+        print(f"  {name:<12}{seconds * 1000:>10.0f}{calls:>11}{calls / max(started, 1):>13.1f}")
+    total_seconds = sum(seconds for _, seconds, _ in rows)
+    total_calls = sum(calls for _, _, calls in rows)
+    print(f"  {'total':<12}{total_seconds * 1000:>10.0f}{total_calls:>11}{total_calls / max(started, 1):>13.1f}")
+    print(f"  {started} rounds started, {logged} logged, {left} left open; {api.rate_limited} requests rate limited")
+    print("  busiest routes: " + ", ".join(f"{route} {n}" for route, n in api.calls.most_common(5)))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--format", dest="debate_format", choices=list(DEBATERS_PER_ROUND), default="AP")
+    parser.add_argument("--rounds", type=int, default=8)
+    parser.add_argument("--latency-ms", type=float, default=50)
+    parser.add_argument("--rate-limit", type=float, default=0.02, help="chance that a request gets a 429")
+    parser.add_argument("--retry-after", type=float, default=0.5)
+    parser.add_argument("--pool", action=argparse.BooleanOptionalAction, default=True,
+                        help="pre-warm the round channel pool (Config.CHANNEL_POOL_SIZES)")
+    args = parser.parse_args()
+    asyncio.run(main(args.debate_format, args.rounds, args.latency_ms, args.rate_limit, args.retry_after, args.pool))
@@ -0,0 +1,237 @@
+"""Load generator: Poisson arrivals of users through the real Matchmaking cog on a fake Discord.
+
+Users arrive at a steady rate (exponential gaps) and /queue for 1v1, AP or
+BP as debaters or judges; some AP/BP debaters bring a party (/invite, then
+Accept in DMs). Everyone reacts to confirmation prompts after a short delay,
+a share of prompts get declined, and users who wait past their patience
+/leave, unless the bot's queue timeout removes them first. Simulated time
+runs `speed` times faster than real time (queue timeout included), while API
+latency and event-loop lag are real. Reports join latency percentiles (until
+the ephemeral reply, and for the whole handler including the draw), rounds
+drawn and started per simulated minute, time to match (arrival to round
+start) and event-loop lag. Policy knobs (--max-per-draw, --budget-ms) map to
+the Config values of the same name. Run from the repo root:
+    python -m benchmarks.bench_load [--users 2000] [--rate 120] [--speed 60]
+"""
+import argparse
+import asyncio
+import logging
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from benchmarks.fake_discord import FakeAPI, FakeBot, FakeContext, FakeGuild, FakeInteraction
+from cogs.matchmaking import Matchmaking, PartyInviteView
+from cogs.rounds import ParticipantConfirmationView, Rounds
+from config import Config
+from utils import database
+
+# Share of arrivals per format, and of each format's arrivals who judge (one chair per round)
+FORMAT_MIX = {"1v1": 0.3, "AP": 0.45, "BP": 0.25}
+JUDGE_SHARE = {"1v1": 1 / 3, "AP": 1 / 7, "BP": 1 / 9}
+MAX_PARTY_SIZE = {"AP": 3, "BP": 2}
+
+
+def _percentiles(values: list) -> tuple:
+    """(p50, p95, p99), or zeros if there's too little data."""
+    if len(values) < 2:
+        return (values[0],) * 3 if values else (0.0, 0.0, 0.0)
+    cuts = statistics.quantiles(values, n=100)
+    return cuts[49], cuts[94], cuts[98]
+
+
+class LoadGenerator:
+    def __init__(self, api: FakeAPI, args):
+        self.api = api
+        self.args = args
+        self.rng = random.Random(args.seed)
+        self.guild = FakeGuild(api)
+        self.lobby = self.guild.add_text_channel("lobby")
+        self.lobby.on_send = self._on_lobby_message
+        self.bot = FakeBot(self.guild, self.lobby)
+        self.matchmaking, self.rounds = Matchmaking(self.bot), Rounds(self.bot)
+        self.bot.add_cog(self.matchmaking)
+        self.bot.add_cog(self.rounds)
+
+        self.start = 0.0
+        self.tasks: set = set()
+        self.arrived: dict = {}   # member_id → simulated arrival time
+        self.settled: dict = {}   # member_id → asyncio.Event, set once their round starts or they decline one
+        self.ack_ms, self.handler_ms, self.waits, self.lags = [], [], [], []
+        self.drawn, self.started, self.declined, self.left, self.timed_out = 0, 0, 0, 0, 0
+
+    def sim_now(self) -> float:
+        """Simulated seconds since the run started."""
+        return (time.monotonic() - self.start) * self.args.speed
+
+    def sim_sleep(self, seconds: float):
+        return asyncio.sleep(seconds / self.args.speed)
+
+    def _spawn(self, coro):
+        task = asyncio.create_task(coro)
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+
+    def _new_member(self, name: str):
+        member = self.guild.add_member(name)
+        self.arrived[member.id] = self.sim_now()
+        self.settled[member.id] = asyncio.Event()
+        return member
+
+    async def _monitor_lag(self, interval: float = 0.02):
+        while True:
+            before = time.perf_counter()
+            await asyncio.sleep(interval)
+            self.lags.append((time.perf_counter() - before - interval) * 1000)
+
+    async def _party(self, host, size: int):
+        """The host invites size - 1 new users, who accept from their DMs."""
+        for i in range(size - 1):
+            friend = self._new_member(f"{host.name}-friend{i}")
+            await self.matchmaking.invite_command.callback(
+                self.matchmaking, FakeContext(self.api, host, self.guild), friend
+            )
+            invite = friend.dm_channel.messages[-1]
+            if isinstance(invite.view, PartyInviteView):
+                await invite.view.accept_button.callback(FakeInteraction(self.api, friend, self.guild, message=invite))
+
+    async def _user(self, index: int):
+        """One arrival: queue (with a party, maybe), then wait to be matched or give up."""
+        debate_format = self.rng.choices(list(FORMAT_MIX), weights=list(FORMAT_MIX.values()))[0]
+        role = "judge" if self.rng.random() < JUDGE_SHARE[debate_format] * self.args.judge_ratio else "debater"
+        member = self._new_member(f"user{index}")
+        if role == "debater" and debate_format in MAX_PARTY_SIZE and self.rng.random() < self.args.party_share:
+            await self._party(member, self.rng.randint(2, MAX_PARTY_SIZE[debate_format]))
+
+        ctx = FakeContext(self.api, member, self.guild, self.lobby)
+        started = time.perf_counter()
+        await self.matchmaking.join_command.callback(self.matchmaking, ctx, role, debate_format)
+        self.handler_ms.append((time.perf_counter() - started) * 1000)
+        self.ack_ms.append((ctx.responded_at - started) * 1000)
+
+        # Patience past the queue timeout never matters: the bot removes them first
+        patience = min(self.rng.expovariate(1 / (self.args.patience * 60)), Config.QUEUE_TIMEOUT + 60)
+        try:
+            await asyncio.wait_for(self.settled[member.id].wait(), patience / self.args.speed)
+            return
+        except asyncio.TimeoutError:
+            pass
+        # Someone mid-confirmation sees it through
+        while member.id in self.matchmaking.pending_members:
+            await asyncio.sleep(0.01)
+        if self.settled[member.id].is_set():
+            return
+        if member.id in self.matchmaking.queue_index:
+            self.left += 1
+            await self.matchmaking.leave_command.callback(self.matchmaking, FakeContext(self.api, member, self.guild))
+        elif member.id not in self.matchmaking.round_index:
+            self.timed_out += 1
+
+    def _on_lobby_message(self, message):
+        if isinstance(message.view, ParticipantConfirmationView):
+            self.drawn += 1
+            self._spawn(self._confirm(message.view))
+
+    async def _confirm(self, view: ParticipantConfirmationView):
+        """Participants react to a prompt after a short delay; sometimes one declines."""
+        participants = view.debate_round.get_all_participants()
+        decliner = self.rng.choice(participants) if self.rng.random() < self.args.decline_share else None
+
+        async def react(member):
+            await self.sim_sleep(self.rng.expovariate(1 / self.args.reaction))
+            if view.declined:
+                return
+            interaction = FakeInteraction(self.api, member, self.guild, self.lobby, view.message)
+            if member is decliner:
+                await view.decline_button.callback(interaction)
+            else:
+                await view.confirm_button.callback(interaction)
+
+        await asyncio.gather(*(react(member) for member in participants))
+        if decliner is not None and view.declined:
+            self.declined += 1
+            self.settled[decliner.id].set()
+        elif view.debate_round.confirmed:
+            self.started += 1
+            now = self.sim_now()
+            for member in participants:
+                self.waits.append(now - self.arrived[member.id])
+                self.settled[member.id].set()
+
+    async def run(self):
+        await self.matchmaking.initialize_lobby()
+        await self.rounds.channel_pool.warm(self.guild)
+        self.api.calls.clear()
+        self.start = time.monotonic()
+        monitor = asyncio.create_task(self._monitor_lag())
+
+        for index in range(self.args.users):
+            await self.sim_sleep(self.rng.expovariate(self.args.rate / 60))
+            self._spawn(self._user(index))
+        arrivals_end = self.sim_now()
+        while self.tasks:
+            await asyncio.gather(*list(self.tasks))
+        monitor.cancel()
+        return arrivals_end
+
+
+async def main(args):
+    logging.basicConfig(level=logging.ERROR)
+    # Compress the bot's clock along with the simulation: queue timeouts and timer resolution
+    Config.QUEUE_TIMEOUT /= args.speed
+    Config.TIMER_TICK = min(Config.TIMER_TICK, 0.05)
+    if args.max_per_draw is not None:
+        Config.MAX_ROUNDS_PER_DRAW = args.max_per_draw
+    if args.budget_ms is not None:
+        Config.ALLOCATION_TIME_BUDGET = args.budget_ms / 1000
+
+    api = FakeAPI(args.latency_ms / 1000, args.rate_limit, seed=args.seed)
+    generator = LoadGenerator(api, args)
+    with tempfile.TemporaryDirectory() as tmp:
+        await database.init_db(os.path.join(tmp, "load.db"))
+        try:
+            arrivals_end = await generator.run()
+        finally:
+            await database.close_db()
+
+    g = generator
+    minutes = g.sim_now() / 60
+    print(f"{len(g.arrived)} users ({args.users} arrivals at {args.rate:.0f}/min over {arrivals_end / 60:.1f} "
+          f"simulated minutes, {minutes:.1f} in all), {args.speed:.0f}x time, {args.latency_ms:.0f}ms per API call")
+    print(f"  policy: MAX_ROUNDS_PER_DRAW={Config.MAX_ROUNDS_PER_DRAW}, "
+          f"ALLOCATION_TIME_BUDGET={Config.ALLOCATION_TIME_BUDGET * 1000:.0f}ms")
+    print(f"  {'join latency':<14}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}")
+    for label, values in (("reply", g.ack_ms), ("handler", g.handler_ms)):
+        print(f"  {label:<14}" + "".join(f"{v:>9.1f}" for v in _percentiles(values)))
+    print(f"  rounds: {g.drawn} drawn ({g.drawn / minutes:.1f}/min), {g.started} started "
+          f"({g.started / minutes:.1f}/min), {g.declined} declined")
+    if g.waits:
+        p50, p95, _ = _percentiles(g.waits)
+        print(f"  time to match: mean {statistics.mean(g.waits) / 60:.1f} min, p50 {p50 / 60:.1f}, "
+              f"p95 {p95 / 60:.1f} ({len(g.waits)} players matched)")
+    print(f"  gave up: {g.left} left the queue, {g.timed_out} timed out; "
+          f"{len(g.matchmaking.queue_index)} still queued")
+    lag = _percentiles(g.lags)
+    print(f"  event-loop lag: p50 {lag[0]:.1f}ms, p99 {lag[2]:.1f}ms, max {max(g.lags, default=0):.1f}ms")
+    print(f"  API calls: {api.total} ({api.total / max(g.started, 1):.0f} per round started), "
+          f"{api.rate_limited} rate limited")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=2000, help="arrivals (party members come on top)")
+    parser.add_argument("--rate", type=float, default=120, help="arrivals per simulated minute")
+    parser.add_argument("--speed", type=float, default=60, help="simulated seconds per real second")
+    parser.add_argument("--party-share", type=float, default=0.15, help="AP/BP debaters arriving with a party")
+    parser.add_argument("--judge-ratio", type=float, default=1.0, help="scales each format's share of judges")
+    parser.add_argument("--decline-share", type=float, default=0.05, help="confirmation prompts that get declined")
+    parser.add_argument("--reaction", type=float, default=15, help="mean seconds to answer a prompt")
+    parser.add_argument("--patience", type=float, default=8, help="mean minutes a user waits before /leave")
+    parser.add_argument("--latency-ms", type=float, default=50)
+    parser.add_argument("--rate-limit", type=float, default=0.0, help="chance that a request gets a 429")
+    parser.add_argument("--max-per-draw", type=int, default=None)
+    parser.add_argument("--budget-ms", type=float, default=None)
+    parser.add_argument("--seed", type=int, default=1)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,104 @@
+"""Microbenchmark: lobby message edits during a queue rush, edit-per-change vs debounced.
+
+Members join and leave the queues at a fixed rate against a fake lobby
+message whose edits take a fixed round trip; queue changes are journaled to
+a throwaway database as they would be live. Run from the repo root:
+    python -m benchmarks.bench_lobby [--changes 300] [--rate 50] [--edit-ms 80]
+"""
+import argparse
+import asyncio
+import os
+import random
+import tempfile
+import time
+
+from benchmarks.synthetic import make_members
+from cogs.matchmaking import Matchmaking
+from utils import database
+from utils.embeds import EmbedBuilder
+from utils.models import FormatType
+
+
+class _FakeLobbyMessage:
+    def __init__(self, edit_seconds: float):
+        self.edit_seconds = edit_seconds
+        self.edits = 0
+
+    async def edit(self, **kwargs):
+        self.edits += 1
+        await asyncio.sleep(self.edit_seconds)
+
+
+def _changes(count: int, rng: random.Random) -> list:
+    """A join/leave sequence: mostly joins, some leaves and re-joins (which change nothing net)."""
+    members = make_members(count)
+    formats = list(FormatType)
+    joined, changes = [], []
+    for member in members:
+        if joined and rng.random() < 0.3:
+            changes.append(("leave", joined.pop(rng.randrange(len(joined))), None))
+        else:
+            changes.append(("join", member, rng.choice(formats)))
+            joined.append(member)
+    return changes
+
+
+def _apply(cog: Matchmaking, change):
+    action, member, format_type = change
+    if action == "leave":
+        cog._remove_from_queues(member)
+    else:
+        queue = {FormatType.ONE_V_ONE: cog.queue_1v1, FormatType.AP: cog.queue_ap, FormatType.BP: cog.queue_bp}
+        queue[format_type].add_debater(member)
+
+
+async def _legacy(changes: list, rate: float, edit_seconds: float):
+    """The pre-debounce lobby: every change awaits a full re-render and edit."""
+    cog = Matchmaking(bot=None)
+    cog.lobby_message = message = _FakeLobbyMessage(edit_seconds)
+    start = time.perf_counter()
+    for change in changes:
+        _apply(cog, change)
+        embed = EmbedBuilder.create_lobby_embed(cog.queue_1v1, cog.queue_ap, cog.queue_bp)
+        await message.edit(embed=embed)
+        await asyncio.sleep(1 / rate)
+    return message.edits, time.perf_counter() - start
+
+
+async def _debounced(changes: list, rate: float, edit_seconds: float):
+    cog = Matchmaking(bot=None)
+    cog.lobby_message = message = _FakeLobbyMessage(edit_seconds)
+    start = time.perf_counter()
+    for change in changes:
+        _apply(cog, change)
+        await cog.update_lobby_display()
+        await asyncio.sleep(1 / rate)
+    # Let the last coalesced render land
+    await asyncio.sleep(cog.lobby_renderer.window + edit_seconds * 2)
+    return message.edits, time.perf_counter() - start, cog.lobby_renderer.skipped
+
+
+async def main(count: int, rate: float, edit_ms: float):
+    changes = _changes(count, random.Random(count))
+    edit_seconds = edit_ms / 1000
+    legacy_edits, legacy_time = await _legacy(changes, rate, edit_seconds)
+    with tempfile.TemporaryDirectory() as tmp:
+        await database.init_db(os.path.join(tmp, "lobby.db"))
+        try:
+            edits, elapsed, skipped = await _debounced(changes, rate, edit_seconds)
+        finally:
+            await database.close_db()
+
+    print(f"{count} queue changes at {rate:.0f}/s, {edit_ms:.0f}ms per lobby edit")
+    print(f"  {'path':<16}{'edits':>8}{'edits/s':>10}{'seconds':>10}")
+    print(f"  {'per change':<16}{legacy_edits:>8}{legacy_edits / legacy_time:>10.1f}{legacy_time:>10.2f}")
+    print(f"  {'debounced':<16}{edits:>8}{edits / elapsed:>10.1f}{elapsed:>10.2f}  ({skipped} unchanged renders skipped)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--changes", type=int, default=300)
+    parser.add_argument("--rate", type=float, default=50)
+    parser.add_argument("--edit-ms", type=float, default=80)
+    args = parser.parse_args()
+    asyncio.run(main(args.changes, args.rate, args.edit_ms))
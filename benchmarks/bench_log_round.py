@@ -0,0 +1,102 @@
+"""Microbenchmark: rounds logged per second, per-row legacy path vs batched log_round.
+
+Run from the repo root:
+    python -m benchmarks.bench_log_round [--rounds 500]
+"""
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+
+import aiosqlite
+
+from benchmarks.synthetic import make_rounds
+from utils import database
+
+
+async def _legacy_log_round(db_path: str, debate_round) -> int:
+    """The pre-batching log_round: fresh connection, one awaited statement per row."""
+    async with aiosqlite.connect(db_path) as db:
+        is_bp = debate_round.bp_ballot is not None
+        ballot = debate_round.bp_ballot if is_bp else debate_round.ballot
+        if is_bp:
+            winner, bp_rankings, gov_total, opp_total = None, json.dumps(ballot.rankings), None, None
+        else:
+            winner, bp_rankings = ballot.winner, None
+            gov_total, opp_total = ballot.gov_total, ballot.opp_total
+        cursor = await db.execute(
+            """INSERT INTO rounds (format_type, round_type, motion, infoslide, winner,
+                                   bp_rankings, chair_id, chair_username, gov_total, opp_total)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            (debate_round.format_label.lower(), debate_round.round_type.value, debate_round.motion,
+             debate_round.infoslide, winner, bp_rankings, ballot.judge.id, ballot.judge.name,
+             gov_total, opp_total)
+        )
+        db_round_id = cursor.lastrowid
+        for judge in debate_round.judges.get_all_judges():
+            await db.execute(database._UPSERT_PARTICIPANT_SQL, (judge.id, judge.name))
+        for participant_id, username, team_key, position, score, is_reply in database._speaker_score_rows(debate_round):
+            if not is_reply:
+                await db.execute(database._UPSERT_PARTICIPANT_SQL, (participant_id, username))
+            await db.execute(
+                database._INSERT_SPEAKER_SCORE_SQL,
+                (db_round_id, participant_id, username, team_key, position, score, is_reply)
+            )
+        await db.commit()
+        return db_round_id
+
+
+async def _legacy_log_judge_ratings(db_path: str, db_round_id: int, debate_round):
+    async with aiosqlite.connect(db_path) as db:
+        ballot = debate_round.bp_ballot or debate_round.ballot
+        for rating in debate_round.judge_ratings:
+            await db.execute(database._UPSERT_PARTICIPANT_SQL, (rating.debater.id, rating.debater.name))
+            await db.execute(
+                database._INSERT_JUDGE_RATING_SQL,
+                (db_round_id, ballot.judge.id, rating.debater.id, rating.debater.name,
+                 rating.score, rating.feedback)
+            )
+        await db.commit()
+
+
+async def _run_legacy(db_path: str, rounds: list) -> float:
+    await database.init_db(db_path)
+    await database.close_db()
+    start = time.perf_counter()
+    for debate_round in rounds:
+        db_round_id = await _legacy_log_round(db_path, debate_round)
+        await _legacy_log_judge_ratings(db_path, db_round_id, debate_round)
+    return time.perf_counter() - start
+
+
+async def _run_batched(db_path: str, rounds: list) -> float:
+    await database.init_db(db_path)
+    start = time.perf_counter()
+    for debate_round in rounds:
+        db_round_id = await database.log_round(debate_round)
+        await database.log_judge_ratings(db_round_id, debate_round)
+    elapsed = time.perf_counter() - start
+    await database.close_db()
+    return elapsed
+
+
+async def main(round_count: int):
+    rounds = make_rounds(round_count)
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy = await _run_legacy(os.path.join(tmp, "legacy.db"), rounds)
+        batched = await _run_batched(os.path.join(tmp, "batched.db"), rounds)
+
+    print(f"log_round + log_judge_ratings, {round_count} synthetic rounds (AP/BP mix)")
+    print(f"  {'path':<28}{'seconds':>10}{'rounds/s':>12}")
+    print(f"  {'per-row (before)':<28}{legacy:>10.3f}{round_count / legacy:>12.1f}")
+    print(f"  {'batched executemany (after)':<28}{batched:>10.3f}{round_count / batched:>12.1f}")
+    print(f"  speedup: {legacy / batched:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=500)
+    args = parser.parse_args()
+    asyncio.run(main(args.rounds))
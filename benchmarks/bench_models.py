@@ -0,0 +1,57 @@
+"""Microbenchmark: memory held per round by the core models (utils/models.py).
+
+Builds N rounds from a shared member pool (members aren't counted: the rounds
+only reference them, as they reference the guild's cached members) and
+measures bytes per round with tracemalloc, for rounds in play (teams, panel,
+channels) and archived rounds (plus the ballot and judge ratings). Also shows
+the size of each round's live-state journal snapshot. Run from the repo root:
+    python -m benchmarks.bench_models [--rounds 1000 10000]
+"""
+import argparse
+import json
+import random
+import tracemalloc
+
+from benchmarks.synthetic import make_ap_round, make_bp_round, make_members
+from utils.persistence import round_state
+
+_CHANNEL_KEYS = ("text", "debate", "gov_prep", "opp_prep", "judges", "judges_text")
+
+
+def _make_round(round_id: int, pool: list, rng: random.Random, archived: bool):
+    make = make_bp_round if rng.random() < 0.3 else make_ap_round
+    debate_round = make(round_id, pool, rng)
+    debate_round.category_id = 10 ** 17 + round_id
+    debate_round.channel_ids = {key: 10 ** 17 + round_id * 10 + i for i, key in enumerate(_CHANNEL_KEYS)}
+    if not archived:
+        debate_round.ballot = debate_round.bp_ballot = None
+        debate_round.judge_ratings = []
+    return debate_round
+
+
+def _measure(count: int, archived: bool) -> tuple:
+    rng = random.Random(count)
+    pool = make_members(500)
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    rounds = [_make_round(i, pool, rng, archived) for i in range(1, count + 1)]
+    held = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    snapshot = sum(len(json.dumps(round_state(r))) for r in rounds) / count
+    return held / count, snapshot
+
+
+def main(sizes: list):
+    print("memory per round (members excluded)")
+    print(f"  {'rounds':>7}  {'state':<10}{'bytes/round':>13}{'snapshot bytes':>16}")
+    for count in sizes:
+        for label, archived in (("active", False), ("archived", True)):
+            per_round, snapshot = _measure(count, archived)
+            print(f"  {count:>7}  {label:<10}{per_round:>13.0f}{snapshot:>16.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, nargs="+", default=[1000, 10000])
+    args = parser.parse_args()
+    main(args.rounds)
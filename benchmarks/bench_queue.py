@@ -0,0 +1,109 @@
+"""Microbenchmark: MatchmakingQueue operations at thousands of queued users, list vs dict.
+
+Run from the repo root:
+    python -m benchmarks.bench_queue [--sizes 1000 5000 10000]
+"""
+import argparse
+import random
+import time
+from dataclasses import dataclass, field
+from typing import List
+
+from benchmarks.synthetic import make_members
+from utils.models import FormatType, MatchmakingQueue
+
+
+@dataclass
+class _ListQueue:
+    """The pre-index MatchmakingQueue: plain lists, linear membership scans."""
+    format_type: FormatType = FormatType.AP
+    debaters: List = field(default_factory=list)
+    judges: List = field(default_factory=list)
+
+    def add_debater(self, user) -> bool:
+        if user in self.judges:
+            self.judges.remove(user)
+        if user not in self.debaters:
+            self.debaters.append(user)
+            return True
+        return False
+
+    def add_judge(self, user) -> bool:
+        if user in self.debaters:
+            self.debaters.remove(user)
+        if user not in self.judges:
+            self.judges.append(user)
+            return True
+        return False
+
+    def remove_user(self, user) -> bool:
+        removed = False
+        if user in self.debaters:
+            self.debaters.remove(user)
+            removed = True
+        if user in self.judges:
+            self.judges.remove(user)
+            removed = True
+        return removed
+
+    def is_in_queue(self, user) -> bool:
+        return user in self.debaters or user in self.judges
+
+
+def _run(queues: list, in_any_queue, members: list, rng: random.Random) -> dict:
+    """Time a join / lookup / leave cycle for every member, spread over the format queues."""
+    timings = {}
+
+    start = time.perf_counter()
+    for i, member in enumerate(members):
+        queue = queues[i % len(queues)]
+        if i % 5 == 0:
+            queue.add_judge(member)
+        else:
+            queue.add_debater(member)
+    timings["join"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for member in members:
+        in_any_queue(member)
+    timings["in any queue"] = time.perf_counter() - start
+
+    leavers = members[:]
+    rng.shuffle(leavers)
+    start = time.perf_counter()
+    for member in leavers:
+        for queue in queues:
+            if queue.is_in_queue(member):
+                queue.remove_user(member)
+                break
+    timings["leave"] = time.perf_counter() - start
+    return timings
+
+
+def main(sizes: list):
+    print("join / 'in any queue' / leave for every user, spread over 3 format queues (ms)")
+    print(f"  {'users':>7}  {'operation':<14}{'list':>10}{'dict':>10}{'speedup':>9}")
+    for size in sizes:
+        members = make_members(size)
+
+        legacy = [_ListQueue(format_type=f) for f in FormatType]
+
+        def legacy_in_any(member):
+            return any(member in q.debaters or member in q.judges for q in legacy)
+
+        legacy_times = _run(legacy, legacy_in_any, members, random.Random(size))
+
+        index = {}
+        indexed = [MatchmakingQueue(format_type=f, index=index) for f in FormatType]
+        indexed_times = _run(indexed, lambda member: member.id in index, members, random.Random(size))
+
+        for op in legacy_times:
+            before, after = legacy_times[op] * 1000, indexed_times[op] * 1000
+            print(f"  {size:>7}  {op:<14}{before:>10.1f}{after:>10.1f}{before / after:>8.0f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000, 10000])
+    args = parser.parse_args()
+    main(args.sizes)
@@ -0,0 +1,69 @@
+"""Microbenchmark: full Elo replay over a logged history, per-round vs single-pass.
+
+Run from the repo root:
+    python -m benchmarks.bench_ratings [--rounds 2000]
+"""
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+
+from benchmarks.synthetic import make_rounds
+from config import Config
+from utils import database
+from utils.ratings import team_ranks
+
+
+async def _replay_per_round() -> float:
+    """Replay the way log_round applies results: one read + one update per round."""
+    pool = await database._get_pool()
+    start = time.perf_counter()
+    async with pool.transaction() as db:
+        await db.execute("UPDATE participants SET elo = ?", (Config.ELO_DEFAULT,))
+        cursor = await db.execute("SELECT id, winner, bp_rankings FROM rounds ORDER BY id")
+        for round_id, winner, bp_rankings in await cursor.fetchall():
+            ranks = team_ranks(winner, json.loads(bp_rankings) if bp_rankings else None)
+            if not ranks:
+                continue
+            cursor = await db.execute(
+                "SELECT participant_id, team_key FROM speaker_scores WHERE round_id = ? AND is_reply = 0",
+                (round_id,)
+            )
+            teams = {}
+            for participant_id, team_key in await cursor.fetchall():
+                teams.setdefault(team_key, []).append(participant_id)
+            await database._apply_rating_deltas(db, teams, ranks)
+    return time.perf_counter() - start
+
+
+async def _replay_single_pass() -> float:
+    start = time.perf_counter()
+    await database.rebuild_ratings()
+    return time.perf_counter() - start
+
+
+async def main(round_count: int):
+    with tempfile.TemporaryDirectory() as tmp:
+        await database.init_db(os.path.join(tmp, "ratings.db"))
+        try:
+            for debate_round in make_rounds(round_count):
+                await database.log_round(debate_round)
+            per_round = await _replay_per_round()
+            single_pass = await _replay_single_pass()
+        finally:
+            await database.close_db()
+
+    print(f"Elo replay over {round_count} synthetic rounds (AP/BP mix)")
+    print(f"  {'path':<28}{'seconds':>10}{'rounds/s':>12}")
+    print(f"  {'per-round (log_round path)':<28}{per_round:>10.3f}{round_count / per_round:>12.1f}")
+    print(f"  {'single pass (rebuild)':<28}{single_pass:>10.3f}{round_count / single_pass:>12.1f}")
+    print(f"  speedup: {per_round / single_pass:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=2000)
+    args = parser.parse_args()
+    asyncio.run(main(args.rounds))
@@ -0,0 +1,73 @@
+"""Microbenchmark: queue-timeout churn, one sleeping task per user vs the timer wheel.
+
+Schedules a 15-minute timeout for N queued users, restarts each one (a
+requeue), then cancels them all, measuring time and peak memory. Run from the
+repo root:
+    python -m benchmarks.bench_timers [--users 500 5000 20000]
+"""
+import argparse
+import asyncio
+import time
+import tracemalloc
+
+from utils.scheduler import TimerWheel
+
+
+async def _expire(user_id: int):
+    pass
+
+
+async def _sleeping_task(user_id: int):
+    await asyncio.sleep(900)
+    await _expire(user_id)
+
+
+async def _tasks(users: int) -> tuple:
+    """The pre-wheel approach: a task per user, cancelled and recreated on requeue."""
+    timeouts = {}
+    start = time.perf_counter()
+    for _ in range(2):
+        for user_id in range(users):
+            task = timeouts.pop(user_id, None)
+            if task:
+                task.cancel()
+            timeouts[user_id] = asyncio.create_task(_sleeping_task(user_id))
+        await asyncio.sleep(0)  # let the tasks start sleeping
+    peak = tracemalloc.get_traced_memory()[1]
+    for task in timeouts.values():
+        task.cancel()
+    await asyncio.gather(*timeouts.values(), return_exceptions=True)
+    return time.perf_counter() - start, peak
+
+
+async def _wheel(users: int) -> tuple:
+    wheel = TimerWheel()
+    start = time.perf_counter()
+    for _ in range(2):
+        for user_id in range(users):
+            wheel.schedule(("queue", user_id), 900, _expire, user_id)
+        await asyncio.sleep(0)
+    peak = tracemalloc.get_traced_memory()[1]
+    for user_id in range(users):
+        wheel.cancel(("queue", user_id))
+    elapsed = time.perf_counter() - start
+    wheel._runner.cancel()
+    return elapsed, peak
+
+
+async def main(sizes: list):
+    print("schedule + restart + cancel a 15-minute timeout per queued user")
+    print(f"  {'users':>7}  {'path':<8}{'ms':>10}{'peak MiB':>10}")
+    for users in sizes:
+        for label, run in (("tasks", _tasks), ("wheel", _wheel)):
+            tracemalloc.start()
+            elapsed, peak = await run(users)
+            tracemalloc.stop()
+            print(f"  {users:>7}  {label:<8}{elapsed * 1000:>10.1f}{peak / 2 ** 20:>10.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, nargs="+", default=[500, 5000, 20000])
+    args = parser.parse_args()
+    asyncio.run(main(args.users))
@@ -0,0 +1,397 @@
+"""An offline stand-in for the parts of Discord the cogs touch, for benchmarks.
+
+Every API call goes through one FakeAPI, which counts calls per route, adds a
+configurable round trip and can answer with 429s. Rate-limited calls behave
+the way py-cord handles them: the client waits out retry_after and retries,
+so the caller only sees the extra latency (and the extra call in the counts).
+Tests can also queue errors for a route with FakeAPI.fail(), which the next
+calls on it raise to the caller, as py-cord raises HTTP errors.
+
+Guild, members, channels, messages, interactions and slash-command contexts
+keep just enough state for the Matchmaking and Rounds cogs to run unchanged.
+Channels subclass the real discord.TextChannel / VoiceChannel /
+CategoryChannel so isinstance checks behave; they never touch py-cord's
+connection state.
+"""
+import asyncio
+import itertools
+import random
+import time
+from collections import Counter, deque
+from datetime import datetime, timezone
+from typing import Callable, Optional
+
+import discord
+
+from config import Config
+
+
+class FakeAPI:
+    """Latency, 429 and error injection, and call counting, shared by every fake object."""
+
+    def __init__(self, latency: float = 0.05, rate_limit: float = 0.0, retry_after: float = 0.5, seed: int = 0):
+        self.latency = latency
+        self.rate_limit = rate_limit      # chance that any one request gets a 429
+        self.retry_after = retry_after
+        self.calls: Counter = Counter()   # route → requests made (429s included)
+        self.rate_limited = 0
+        self._rng = random.Random(seed)
+        self._failures: dict = {}         # route → errors the next calls raise, in order
+        # Snowflakes dated now, so created_at (and the orphan sweeper's TTL) behave
+        self._ids = itertools.count(discord.utils.time_snowflake(datetime.now(timezone.utc)))
+
+    @property
+    def total(self) -> int:
+        return sum(self.calls.values())
+
+    def next_id(self) -> int:
+        return next(self._ids)
+
+    def fail(self, route: str, *errors: Exception):
+        """Make the next len(errors) calls on route raise these errors, one each."""
+        self._failures.setdefault(route, deque()).extend(errors)
+
+    async def request(self, route: str):
+        while True:
+            self.calls[route] += 1
+            await asyncio.sleep(self.latency)
+            failures = self._failures.get(route)
+            if failures:
+                raise failures.popleft()
+            if self._rng.random() >= self.rate_limit:
+                return
+            self.rate_limited += 1
+            await asyncio.sleep(self.retry_after)
+
+
+class FakeVoiceState:
+    def __init__(self, channel):
+        self.channel = channel
+
+
+class FakeMember:
+    """A guild member. Equal (and hashed) by id, like discord.Member."""
+
+    def __init__(self, api: FakeAPI, guild: 'FakeGuild', member_id: int, name: str, bot: bool = False):
+        self.api = api
+        self.guild = guild
+        self.id = member_id
+        self.name = name
+        self.display_name = name
+        self.bot = bot
+        self.voice: Optional[FakeVoiceState] = None
+        self.dm_channel = FakeDMChannel(api, self)
+
+    @property
+    def mention(self) -> str:
+        return f"<@{self.id}>"
+
+    def __eq__(self, other):
+        return getattr(other, "id", None) == self.id
+
+    def __hash__(self):
+        return hash(self.id)
+
+    async def send(self, content=None, **kwargs):
+        return await self.dm_channel.send(content, **kwargs)
+
+    async def move_to(self, channel, reason=None):
+        await self.api.request("move_member")
+        if self.voice and self.voice.channel:
+            self.voice.channel.connected.discard(self)
+        self.voice = FakeVoiceState(channel) if channel else None
+        if channel:
+            channel.connected.add(self)
+
+
+class FakeRole:
+    def __init__(self, role_id: int, name: str):
+        self.id = role_id
+        self.name = name
+
+    def __hash__(self):
+        return hash(self.id)
+
+
+class FakeMessage:
+    def __init__(self, api: FakeAPI, channel, content=None, embed=None, view=None):
+        self.api = api
+        self.id = api.next_id()
+        self.channel = channel
+        self.content = content
+        self.embed = embed
+        self.view = view
+        self.deleted = False
+
+    async def edit(self, **kwargs):
+        await self.api.request("edit_message")
+        self.embed = kwargs.get("embed", self.embed)
+        self.view = kwargs.get("view", self.view)
+        return self
+
+    async def delete(self, **kwargs):
+        await self.api.request("delete_message")
+        self.deleted = True
+
+
+class _Messageable:
+    """send() and partial messages for text and DM channels."""
+
+    on_send: Optional[Callable] = None  # called with each message sent here, e.g. to react to prompts
+
+    async def send(self, content=None, *, embed=None, view=None, **kwargs):
+        await self.api.request("send_message")
+        message = FakeMessage(self.api, self, content, embed, view)
+        self.messages.append(message)
+        if view is not None:
+            view.message = message
+        if self.on_send:
+            self.on_send(message)
+        return message
+
+    def get_partial_message(self, message_id: int) -> FakeMessage:
+        for message in self.messages:
+            if message.id == message_id:
+                return message
+        message = FakeMessage(self.api, self)
+        message.id = message_id
+        return message
+
+
+class FakeDMChannel(_Messageable):
+    def __init__(self, api: FakeAPI, recipient: FakeMember):
+        self.api = api
+        self.id = api.next_id()
+        self.recipient = recipient
+        self.messages: list = []
+
+
+class _GuildChannel:
+    """Shared state and endpoints of fake guild channels (mixed into the discord classes)."""
+
+    def _init(self, api: FakeAPI, guild: 'FakeGuild', name: str, category_id: Optional[int],
+              position: int, overwrites: Optional[dict]):
+        self.api = api
+        self.guild = guild
+        self.id = api.next_id()
+        self.name = name
+        self.category_id = category_id
+        self.position = position
+        self.fake_overwrites = dict(overwrites or {})
+        guild.channels_by_id[self.id] = self
+
+    async def edit(self, *, name=None, overwrites=None, **kwargs):
+        await self.api.request("edit_channel")
+        if name is not None:
+            self.name = name
+        if overwrites is not None:
+            self.fake_overwrites = dict(overwrites)
+        return self
+
+    async def set_permissions(self, target, *, overwrite=None, **kwargs):
+        await self.api.request("edit_permissions")
+        self.fake_overwrites[target] = overwrite
+
+    async def delete(self, *, reason=None):
+        await self.api.request("delete_channel")
+        if self.guild.channels_by_id.pop(self.id, None) is None:
+            raise discord.NotFound(_FakeResponse(404), "Unknown Channel")
+
+
+class FakeTextChannel(_GuildChannel, _Messageable, discord.TextChannel):
+    def __init__(self, api, guild, name, category_id=None, position=0, overwrites=None):
+        self._init(api, guild, name, category_id, position, overwrites)
+        self.messages: list = []
+
+
+class FakeVoiceChannel(_GuildChannel, discord.VoiceChannel):
+    def __init__(self, api, guild, name, category_id=None, position=0, overwrites=None):
+        self._init(api, guild, name, category_id, position, overwrites)
+        self.connected: set = set()
+
+    @property
+    def members(self) -> list:
+        return list(self.connected)
+
+
+class FakeCategory(_GuildChannel, discord.CategoryChannel):
+    def __init__(self, api, guild, name, overwrites=None):
+        self._init(api, guild, name, None, 0, overwrites)
+
+    @property
+    def channels(self) -> list:
+        return [c for c in self.guild.channels_by_id.values() if c.category_id == self.id]
+
+    async def _create(self, channel_type, name: str, position: int = 0, overwrites=None, **kwargs):
+        await self.api.request("create_channel")
+        return channel_type(self.api, self.guild, name, self.id, position, overwrites)
+
+    def create_text_channel(self, name: str, **kwargs):
+        return self._create(FakeTextChannel, name, **kwargs)
+
+    def create_voice_channel(self, name: str, **kwargs):
+        return self._create(FakeVoiceChannel, name, **kwargs)
+
+
+class _FakeResponse:
+    """Just enough of aiohttp's response for discord.HTTPException."""
+
+    def __init__(self, status: int):
+        self.status = status
+        self.reason = "Fake"
+
+
+def http_error(status: int, message: str = "") -> discord.HTTPException:
+    """The exception py-cord raises for an HTTP error status, for FakeAPI.fail()."""
+    if status == 403:
+        return discord.Forbidden(_FakeResponse(status), message)
+    if status == 404:
+        return discord.NotFound(_FakeResponse(status), message)
+    if status >= 500:
+        return discord.DiscordServerError(_FakeResponse(status), message)
+    return discord.HTTPException(_FakeResponse(status), message)
+
+
+class FakeGuild:
+    def __init__(self, api: FakeAPI, guild_id: Optional[int] = None, name: str = "Fake Guild"):
+        self.api = api
+        self.id = Config.GUILD_ID if guild_id is None else guild_id
+        self.name = name
+        self.channels_by_id: dict = {}
+        self.members_by_id: dict = {}
+        self.default_role = FakeRole(self.id, "@everyone")
+        self.me = self.add_member("debate-bot", bot=True)
+
+    @property
+    def categories(self) -> list:
+        return [c for c in self.channels_by_id.values() if isinstance(c, FakeCategory)]
+
+    def get_channel(self, channel_id: Optional[int]):
+        return self.channels_by_id.get(channel_id)
+
+    def get_member(self, member_id: int) -> Optional[FakeMember]:
+        return self.members_by_id.get(member_id)
+
+    def add_member(self, name: str, bot: bool = False) -> FakeMember:
+        member = FakeMember(self.api, self, self.api.next_id(), name, bot)
+        self.members_by_id[member.id] = member
+        return member
+
+    def add_text_channel(self, name: str) -> FakeTextChannel:
+        """A standing channel (e.g. the lobby), created without an API call."""
+        return FakeTextChannel(self.api, self, name)
+
+    def add_voice_channel(self, name: str) -> FakeVoiceChannel:
+        return FakeVoiceChannel(self.api, self, name)
+
+    async def create_category(self, name: str, overwrites=None, **kwargs) -> FakeCategory:
+        await self.api.request("create_channel")
+        return FakeCategory(self.api, self, name, overwrites)
+
+
+class FakeInteractionResponse:
+    def __init__(self, interaction: 'FakeInteraction'):
+        self.interaction = interaction
+        self.modal = None   # the last modal or view sent in response, for the caller to drive
+        self.view = None
+        self._done = False
+
+    def is_done(self) -> bool:
+        return self._done
+
+    async def _respond(self):
+        await self.interaction.api.request("interaction_response")
+        self._done = True
+
+    async def send_message(self, content=None, *, embed=None, view=None, **kwargs):
+        await self._respond()
+        self.view = view
+        if view is not None:
+            view.message = FakeMessage(self.interaction.api, self.interaction.channel, content, embed, view)
+
+    async def edit_message(self, **kwargs):
+        await self._respond()
+        if self.interaction.message:
+            self.interaction.message.embed = kwargs.get("embed", self.interaction.message.embed)
+
+    async def defer(self, **kwargs):
+        await self._respond()
+
+    async def send_modal(self, modal):
+        await self._respond()
+        self.modal = modal
+
+
+class FakeInteraction:
+    """A component or modal interaction from `user` in `channel`."""
+
+    def __init__(self, api: FakeAPI, user: FakeMember, guild: FakeGuild, channel=None,
+                 message: Optional[FakeMessage] = None, data: Optional[dict] = None):
+        self.api = api
+        self.user = user
+        self.guild = guild
+        self.channel = channel
+        self.message = message
+        self.data = data or {}
+        self.response = FakeInteractionResponse(self)
+        self.followup = _Followup(api, channel)
+
+    async def edit_original_response(self, **kwargs):
+        await self.api.request("edit_message")
+
+
+class _Followup(_Messageable):
+    def __init__(self, api: FakeAPI, channel):
+        self.api = api
+        self.channel = channel
+        self.messages: list = []
+
+
+class FakeContext:
+    """A slash-command invocation (discord.ApplicationContext) by `author`."""
+
+    def __init__(self, api: FakeAPI, author: FakeMember, guild: FakeGuild, channel=None):
+        self.api = api
+        self.author = author
+        self.user = author
+        self.guild = guild
+        self.channel = channel
+        self.responses: list = []
+        self.responded_at: Optional[float] = None  # time.perf_counter() of the first response
+
+    async def respond(self, content=None, *, embed=None, **kwargs):
+        await self.api.request("interaction_response")
+        self.responses.append(embed or content)
+        if self.responded_at is None:
+            self.responded_at = time.perf_counter()
+
+    async def defer(self, **kwargs):
+        await self.api.request("interaction_response")
+
+
+class FakeBot:
+    """The bits of commands.Bot the cogs call: cog and channel lookups, add_view."""
+
+    def __init__(self, guild: FakeGuild, lobby_channel: FakeTextChannel):
+        self.guild = guild
+        self.lobby_channel = lobby_channel
+        self.user = guild.me
+        self.cogs: dict = {}
+        self.views: list = []
+
+    def add_cog(self, cog):
+        self.cogs[type(cog).__name__] = cog
+
+    def get_cog(self, name: str):
+        return self.cogs.get(name)
+
+    def get_guild(self, guild_id: int) -> FakeGuild:
+        return self.guild
+
+    def get_channel(self, channel_id: int):
+        if channel_id == Config.LOBBY_CHANNEL_ID:
+            return self.lobby_channel
+        return self.guild.get_channel(channel_id)
+
+    def add_view(self, view, message_id: Optional[int] = None):
+        self.views.append(view)
@@ -0,0 +1,141 @@
+"""Synthetic rounds and ballots for benchmarks (no Discord connection needed)."""
+import random
+from dataclasses import dataclass
+
+from config import Config
+from utils.models import (
+    DebateRound, DebateTeam, JudgePanel, TeamType, RoundType,
+    SpeakerScore, Ballot, BPBallot, JudgeRating
+)
+
+
+@dataclass(eq=False)
+class SyntheticMember:
+    """Just enough of discord.Member for the models, embeds and database layer."""
+    id: int
+    name: str
+
+    @property
+    def display_name(self) -> str:
+        return self.name
+
+    @property
+    def mention(self) -> str:
+        return f"<@{self.id}>"
+
+    def __eq__(self, other):
+        return getattr(other, "id", None) == self.id
+
+    def __hash__(self):
+        return hash(self.id)
+
+
+def make_members(count: int, start_id: int = 1000) -> list:
+    """Create `count` synthetic members with sequential ids."""
+    return [SyntheticMember(id=start_id + i, name=f"user{start_id + i}") for i in range(count)]
+
+
+def make_ap_round(round_id: int, pool: list, rng: random.Random) -> DebateRound:
+    """A scored STANDARD (3v3) AP round drawn from `pool` (needs 7+ members)."""
+    picked = rng.sample(pool, 7)
+    gov = DebateTeam("Government", TeamType.FULL, picked[0:3])
+    opp = DebateTeam("Opposition", TeamType.FULL, picked[3:6])
+    judges = JudgePanel()
+    judges.add_judge(picked[6])
+
+    gov_positions = Config.TEAM_POSITIONS["gov"]
+    opp_positions = Config.TEAM_POSITIONS["opp"]
+    gov_scores = [SpeakerScore(m, gov_positions[i], rng.randint(70, 80)) for i, m in enumerate(gov.members)]
+    opp_scores = [SpeakerScore(m, opp_positions[i], rng.randint(70, 80)) for i, m in enumerate(opp.members)]
+    gov_reply = SpeakerScore(gov.members[0], gov_positions[0], rng.randint(35, 40))
+    opp_reply = SpeakerScore(opp.members[0], opp_positions[0], rng.randint(35, 40))
+    gov_total = sum(s.score for s in gov_scores) + gov_reply.score
+    opp_total = sum(s.score for s in opp_scores) + opp_reply.score
+    if gov_total == opp_total:
+        gov_reply.score += 1
+        gov_total += 1
+
+    debate_round = DebateRound(
+        round_id=round_id, round_type=RoundType.STANDARD,
+        government=gov, opposition=opp, judges=judges,
+        motion="This House would benchmark everything", format_label="AP",
+    )
+    debate_round.ballot = Ballot(
+        judge=judges.chair,
+        winner="Government" if gov_total > opp_total else "Opposition",
+        gov_scores=gov_scores, opp_scores=opp_scores,
+        gov_reply=gov_reply, opp_reply=opp_reply,
+    ).freeze()
+    debate_round.judge_ratings = [
+        JudgeRating(m, rng.randint(5, 10), rng.choice([None, "Clear RFD."]))
+        for m in gov.members + opp.members
+    ]
+    return debate_round
+
+
+def make_1v1_round(round_id: int, pool: list, rng: random.Random) -> DebateRound:
+    """A scored PM_LO (1v1) round drawn from `pool` (needs 3+ members)."""
+    picked = rng.sample(pool, 3)
+    gov = DebateTeam("Government", TeamType.SOLO, picked[0:1])
+    opp = DebateTeam("Opposition", TeamType.SOLO, picked[1:2])
+    judges = JudgePanel()
+    judges.add_judge(picked[2])
+
+    gov_score, opp_score = rng.sample(range(70, 81), 2)
+    debate_round = DebateRound(
+        round_id=round_id, round_type=RoundType.PM_LO,
+        government=gov, opposition=opp, judges=judges,
+        motion="This House would benchmark everything", format_label="1v1",
+    )
+    debate_round.ballot = Ballot(
+        judge=judges.chair,
+        winner="Government" if gov_score > opp_score else "Opposition",
+        gov_scores=[SpeakerScore(gov.members[0], gov.get_position_name(0), gov_score)],
+        opp_scores=[SpeakerScore(opp.members[0], opp.get_position_name(0), opp_score)],
+    ).freeze()
+    return debate_round
+
+
+def make_bp_round(round_id: int, pool: list, rng: random.Random) -> DebateRound:
+    """A scored BP round (4 teams of 2) drawn from `pool` (needs 9+ members)."""
+    picked = rng.sample(pool, 9)
+    names = ("Opening Government", "Opening Opposition", "Closing Government", "Closing Opposition")
+    teams = [DebateTeam(name, TeamType.IRON, picked[i * 2:i * 2 + 2]) for i, name in enumerate(names)]
+    judges = JudgePanel()
+    judges.add_judge(picked[8])
+
+    positions = {
+        "og": Config.BP_OG_POSITIONS, "oo": Config.BP_OO_POSITIONS,
+        "cg": Config.BP_CG_POSITIONS, "co": Config.BP_CO_POSITIONS,
+    }
+    ranks = [1, 2, 3, 4]
+    rng.shuffle(ranks)
+    team_keys = ("og", "oo", "cg", "co")
+
+    debate_round = DebateRound(
+        round_id=round_id, round_type=RoundType.BP,
+        government=teams[0], opposition=teams[1], cg=teams[2], co=teams[3],
+        judges=judges, motion="This House would benchmark everything", format_label="BP",
+    )
+    debate_round.bp_ballot = BPBallot(
+        judge=judges.chair,
+        rankings=dict(zip(team_keys, ranks)),
+        team_scores={
+            key: [SpeakerScore(m, positions[key][i], rng.randint(70, 80)) for i, m in enumerate(team.members)]
+            for key, team in zip(team_keys, teams)
+        },
+    )
+    debate_round.judge_ratings = [
+        JudgeRating(m, rng.randint(5, 10), None) for team in teams for m in team.members
+    ]
+    return debate_round
+
+
+def make_rounds(count: int, population: int = 200, bp_share: float = 0.3, seed: int = 7) -> list:
+    """A reproducible mix of AP and BP rounds played by `population` members."""
+    rng = random.Random(seed)
+    pool = make_members(population)
+    return [
+        make_bp_round(i, pool, rng) if rng.random() < bp_share else make_ap_round(i, pool, rng)
+        for i in range(1, count + 1)
+    ]
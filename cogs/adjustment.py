@@ -4,6 +4,7 @@ from typing import Optional
 
 from utils.models import DebateRound, TeamType
 from utils.embeds import EmbedBuilder
+from utils.tracing import traced_interaction
 
 
 class AllocationAdjustmentView(discord.ui.View):
@@ -26,12 +27,14 @@ class AllocationAdjustmentView(discord.ui.View):
                 pass
 
     @discord.ui.button(label="Swap Members", style=discord.ButtonStyle.primary, row=0)
+    @traced_interaction()
     async def swap_members_button(self, button: discord.ui.Button, interaction: discord.Interaction):
         """Open modal to swap two members."""
         modal = SwapMembersModal(self, self.debate_round)
         await interaction.response.send_modal(modal)
 
     @discord.ui.button(label="Toggle Team Type", style=discord.ButtonStyle.secondary, row=0)
+    @traced_interaction()
     async def toggle_team_type_button(self, button: discord.ui.Button, interaction: discord.Interaction):
         """Toggle between Full and Iron team types."""
         view = ToggleTeamTypeView(self, self.debate_round)
@@ -42,6 +45,7 @@ class AllocationAdjustmentView(discord.ui.View):
         )
 
     @discord.ui.button(label="Move to Judge", style=discord.ButtonStyle.secondary, row=1)
+    @traced_interaction()
     async def move_to_judge_button(self, button: discord.ui.Button, interaction: discord.Interaction):
         """Move a debater to judge role."""
         view = MoveToJudgeView(self, self.debate_round)
@@ -52,6 +56,7 @@ class AllocationAdjustmentView(discord.ui.View):
         )
 
     @discord.ui.button(label="Move to Debater", style=discord.ButtonStyle.secondary, row=1)
+    @traced_interaction()
     async def move_to_debater_button(self, button: discord.ui.Button, interaction: discord.Interaction):
         """Move a judge to debater role."""
         view = MoveToDebaterView(self, self.debate_round)
@@ -62,15 +67,17 @@ class AllocationAdjustmentView(discord.ui.View):
         )
 
     @discord.ui.button(label="✅ Confirm & Start Round", style=discord.ButtonStyle.success, row=2)
+    @traced_interaction()
     async def confirm_button(self, button: discord.ui.Button, interaction: discord.Interaction):
         """Confirm allocations and start the round."""
         modal = MotionInputModal(self, self.debate_round)
         await interaction.response.send_modal(modal)
 
     @discord.ui.button(label="❌ Cancel", style=discord.ButtonStyle.danger, row=2)
+    @traced_interaction()
     async def cancel_button(self, button: discord.ui.Button, interaction: discord.Interaction):
         """Cancel the round."""
-        self.matchmaking_cog.current_round = None
+        self.matchmaking_cog.release_pending_round(self.debate_round.round_id)
         await interaction.response.send_message("❌ Round cancelled.", ephemeral=True)
         self.stop()
         for item in self.children:
@@ -108,6 +115,7 @@ class SwapMembersModal(discord.ui.Modal):
         self.add_item(self.member1_input)
         self.add_item(self.member2_input)
 
+    @traced_interaction()
     async def callback(self, interaction: discord.Interaction):
         # Parse member IDs
         member1_id = self._parse_member_id(self.member1_input.value)
@@ -163,11 +171,13 @@ class ToggleTeamTypeView(discord.ui.View):
         self.debate_round = debate_round
 
     @discord.ui.button(label="Toggle Government", style=discord.ButtonStyle.primary)
+    @traced_interaction()
     async def toggle_gov_button(self, button: discord.ui.Button, interaction: discord.Interaction):
         """Toggle Government team type."""
         await self._toggle_team(interaction, self.debate_round.government)
 
     @discord.ui.button(label="Toggle Opposition", style=discord.ButtonStyle.primary)
+    @traced_interaction()
     async def toggle_opp_button(self, button: discord.ui.Button, interaction: discord.Interaction):
         """Toggle Opposition team type."""
         await self._toggle_team(interaction, self.debate_round.opposition)
@@ -235,6 +245,7 @@ class MoveToJudgeView(discord.ui.View):
             select.callback = self.select_callback
             self.add_item(select)
 
+    @traced_interaction()
     async def select_callback(self, interaction: discord.Interaction):
         """Handle debater selection."""
         value = interaction.data["values"][0]
@@ -292,6 +303,7 @@ class MoveToDebaterView(discord.ui.View):
         # Add team selection buttons
         self.selected_judge_id = None
 
+    @traced_interaction()
     async def select_callback(self, interaction: discord.Interaction):
         """Handle judge selection."""
         member_id = int(interaction.data["values"][0])
@@ -316,11 +328,13 @@ class TeamSelectionView(discord.ui.View):
         self.member_id = member_id
 
     @discord.ui.button(label="Join Government", style=discord.ButtonStyle.primary)
+    @traced_interaction()
     async def join_gov_button(self, button: discord.ui.Button, interaction: discord.Interaction):
         """Join Government team."""
         await self._move_to_team(interaction, self.debate_round.government)
 
     @discord.ui.button(label="Join Opposition", style=discord.ButtonStyle.primary)
+    @traced_interaction()
     async def join_opp_button(self, button: discord.ui.Button, interaction: discord.Interaction):
         """Join Opposition team."""
         await self._move_to_team(interaction, self.debate_round.opposition)
@@ -370,6 +384,7 @@ class MotionInputModal(discord.ui.Modal):
 
         self.add_item(self.motion_input)
 
+    @traced_interaction()
     async def callback(self, interaction: discord.Interaction):
         motion = self.motion_input.value.strip()
 
@@ -399,8 +414,8 @@ class MotionInputModal(discord.ui.Modal):
         except:
             pass
 
-        # Clear current round
-        self.parent_view.matchmaking_cog.current_round = None
+        # Release the round's members from pending
+        self.parent_view.matchmaking_cog.release_pending_round(self.debate_round.round_id)
 
 
 class Adjustment(commands.Cog):
@@ -2,6 +2,7 @@ import asyncio
 import discord
 from discord.ext import commands
 import random
+import time
 from typing import Optional
 import logging
 
@@ -13,7 +14,20 @@ from utils.models import (
     TeamType, RoundType, FormatType, Party
 )
 
+from utils.allocation import balance_teams, plan_draw, select_units, split_judges
+from utils.database import apply_live_parties, apply_live_queue, get_ratings
+from utils.debounce import DebouncedRenderer
+from utils.dm import get_dispatcher
 from utils.embeds import EmbedBuilder
+from utils.metrics import ACTIVE_ROUNDS, PENDING_ROUNDS, QUEUE_DEPTH
+from utils.scheduler import get_scheduler
+from utils.tracing import traced, traced_interaction
+
+
+def _queue_timeout_text() -> str:
+    """Config.QUEUE_TIMEOUT for messages, e.g. "15 minutes"."""
+    minutes = Config.QUEUE_TIMEOUT / 60
+    return f"{minutes:g} minute{'' if minutes == 1 else 's'}"
 
 
 class PartyInviteView(discord.ui.View):
@@ -35,6 +49,7 @@ class PartyInviteView(discord.ui.View):
                 pass
 
     @discord.ui.button(label="Accept", style=discord.ButtonStyle.success)
+    @traced_interaction()
     async def accept_button(self, button: discord.ui.Button, interaction: discord.Interaction):
         """Accept the party invitation."""
         # Check if user is already in a party
@@ -84,6 +99,7 @@ class PartyInviteView(discord.ui.View):
             pass
 
     @discord.ui.button(label="Decline", style=discord.ButtonStyle.danger)
+    @traced_interaction()
     async def decline_button(self, button: discord.ui.Button, interaction: discord.Interaction):
         """Decline the party invitation."""
         for item in self.children:
@@ -121,6 +137,7 @@ class ObserveRequestView(discord.ui.View):
             pass
 
     @discord.ui.button(label="Accept", style=discord.ButtonStyle.success)
+    @traced_interaction()
     async def accept_button(self, button: discord.ui.Button, interaction: discord.Interaction):
         await interaction.response.defer()
         for item in self.children:
@@ -166,6 +183,7 @@ class ObserveRequestView(discord.ui.View):
         self.stop()
 
     @discord.ui.button(label="Decline", style=discord.ButtonStyle.danger)
+    @traced_interaction()
     async def decline_button(self, button: discord.ui.Button, interaction: discord.Interaction):
         await interaction.response.defer()
         for item in self.children:
@@ -190,20 +208,18 @@ class ObserveRequestView(discord.ui.View):
 class LobbyView(discord.ui.View):
     """Persistent view for a lobby with a leave button."""
 
-    def __init__(self, cog, lobby_name: str):
+    def __init__(self, cog):
         super().__init__(timeout=None)
         self.cog = cog
-        self.lobby_name = lobby_name
 
     @discord.ui.button(label="Leave Queue", style=discord.ButtonStyle.danger, custom_id="leave_queue")
+    @traced_interaction()
     async def leave_button(self, button: discord.ui.Button, interaction: discord.Interaction):
         """Handle leave queue button press."""
-        removed_1v1 = self.cog.queue_1v1.remove_user(interaction.user)
-        removed_ap = self.cog.queue_ap.remove_user(interaction.user)
-        removed_bp = self.cog.queue_bp.remove_user(interaction.user)
+        removed = self.cog._remove_from_queues(interaction.user)
         self.cog._cancel_queue_timeout(interaction.user.id)
 
-        if removed_1v1 or removed_ap or removed_bp:
+        if removed:
             await interaction.response.send_message("You have left the queue.", ephemeral=True)
             await self.cog.update_lobby_display()
             await self.cog.check_matchmaking_threshold()
@@ -216,20 +232,49 @@ class Matchmaking(commands.Cog):
 
     def __init__(self, bot):
         self.bot = bot
-        self.queue_1v1 = MatchmakingQueue(format_type=FormatType.ONE_V_ONE)
-        self.queue_ap = MatchmakingQueue(format_type=FormatType.AP)
-        self.queue_bp = MatchmakingQueue(format_type=FormatType.BP)
+        # member_id → the queue they're in, shared by all three format queues
+        self.queue_index: dict[int, MatchmakingQueue] = {}
+        self.queue_1v1 = MatchmakingQueue(
+            format_type=FormatType.ONE_V_ONE, index=self.queue_index, on_change=self._queue_changed
+        )
+        self.queue_ap = MatchmakingQueue(format_type=FormatType.AP, index=self.queue_index, on_change=self._queue_changed)
+        self.queue_bp = MatchmakingQueue(format_type=FormatType.BP, index=self.queue_index, on_change=self._queue_changed)
+        # Live-state journal bookkeeping: queue changes not yet written (member_id → moved to
+        # the back of a line), each journaled member's FIFO sequence number, and the parties
+        # as last written
+        self._queue_journal: dict[int, bool] = {}
+        self._queue_seqs: dict[int, int] = {}
+        self._queue_seq = 0
+        self._journaled_parties: dict[int, list] = {}
         self.lobby_message: Optional[discord.Message] = None
-        self.current_round: Optional[DebateRound] = None
+        # One persistent view for the lobby message (created with it); edits keep its components
+        self.lobby_view: Optional[LobbyView] = None
+        self.lobby_renderer = DebouncedRenderer(
+            self._render_lobby, self._publish_lobby, Config.LOBBY_RENDER_INTERVAL
+        )
+        # Rounds allocated but still waiting on participant confirmation
+        self.pending_rounds: dict[int, DebateRound] = {}   # round_id → DebateRound
+        self.pending_members: dict[int, int] = {}          # member_id → pending round_id
+        # Serializes round formation per format; formats don't block each other
+        self.formation_locks: dict[str, asyncio.Lock] = {
+            "1v1": asyncio.Lock(), "AP": asyncio.Lock(), "BP": asyncio.Lock()
+        }
         self.round_counter = 0
         self.active_rounds: dict[int, DebateRound] = {}
+        # member_id → (round_id, role) for every participant of an active round
+        self.round_index: dict[int, tuple] = {}
         # Party system
         self.parties: dict[int, Party] = {}        # host_id -> Party
         self.member_to_party: dict[int, int] = {}  # member_id -> host_id
         # Observer system
         self.pending_observers: dict[int, list] = {}  # observed_user_id → [observer Members]
-        # Queue timeouts
-        self.queue_timeouts: dict[int, asyncio.Task] = {}  # user_id → running timeout task
+
+        # Read by /metrics when scraped
+        for label, queue in (("1v1", self.queue_1v1), ("AP", self.queue_ap), ("BP", self.queue_bp)):
+            QUEUE_DEPTH.labels(label, "debater").set_function(queue.debater_count)
+            QUEUE_DEPTH.labels(label, "judge").set_function(queue.judge_count)
+        PENDING_ROUNDS.set_function(lambda: len(self.pending_rounds))
+        ACTIVE_ROUNDS.set_function(lambda: len(self.active_rounds))
 
     def _get_queue(self, format_name: str) -> MatchmakingQueue:
         """Get the queue for a given format."""
@@ -258,52 +303,63 @@ class Matchmaking(commands.Cog):
     def add_active_round(self, debate_round: DebateRound):
         """Track an active round."""
         self.active_rounds[debate_round.round_id] = debate_round
+        debate_round.attach_index(self.round_index)
 
     def remove_active_round(self, round_id: int):
         """Remove a completed round."""
-        self.active_rounds.pop(round_id, None)
+        debate_round = self.active_rounds.pop(round_id, None)
+        if debate_round:
+            debate_round.detach_index()
+
+    def add_pending_round(self, debate_round: DebateRound):
+        """Hold a freshly allocated round (and its members) until it's confirmed or cancelled."""
+        self.pending_rounds[debate_round.round_id] = debate_round
+        for member in debate_round.get_all_participants():
+            self.pending_members[member.id] = debate_round.round_id
+
+    def release_pending_round(self, round_id: int):
+        """Stop holding a pending round's members (confirmed, cancelled or timed out)."""
+        debate_round = self.pending_rounds.pop(round_id, None)
+        if debate_round:
+            for member in debate_round.get_all_participants():
+                if self.pending_members.get(member.id) == round_id:
+                    del self.pending_members[member.id]
 
     def _is_member_in_queue(self, member: discord.Member) -> bool:
         """Check if a member is in any queue."""
-        return (member in self.queue_1v1.debaters or
-                member in self.queue_1v1.judges or
-                member in self.queue_ap.debaters or
-                member in self.queue_ap.judges or
-                member in self.queue_bp.debaters or
-                member in self.queue_bp.judges)
+        return member.id in self.queue_index
+
+    def _remove_from_queues(self, member: discord.Member, keep: Optional[MatchmakingQueue] = None) -> bool:
+        """Remove a member from whichever queue they're in (unless it's `keep`)."""
+        queue = self.queue_index.get(member.id)
+        if queue is None or queue is keep:
+            return False
+        return queue.remove_user(member)
 
     def _find_member_active_round(self, member: discord.Member):
         """Return the active DebateRound the member is in, or None."""
-        for debate_round in self.active_rounds.values():
-            if member in debate_round.get_all_participants():
-                return debate_round
-        return None
+        entry = self.round_index.get(member.id)
+        return self.active_rounds.get(entry[0]) if entry else None
 
-    def _start_queue_timeout(self, member: discord.Member):
-        """Start (or restart) a 15-minute queue timeout task for a member."""
-        self._cancel_queue_timeout(member.id)
-        task = self.bot.loop.create_task(self._queue_timeout_task(member))
-        self.queue_timeouts[member.id] = task
+    def _start_queue_timeout(self, member: discord.Member, delay: Optional[float] = None):
+        """Start (or restart) a member's queue timeout (Config.QUEUE_TIMEOUT unless delay is given)."""
+        delay = Config.QUEUE_TIMEOUT if delay is None else delay
+        get_scheduler().schedule(("queue", member.id), delay, self._expire_queued_member, member)
+        self._queue_changed(member.id, False)
 
     def _cancel_queue_timeout(self, member_id: int):
-        """Cancel a member's queue timeout task if one is running."""
-        task = self.queue_timeouts.pop(member_id, None)
-        if task:
-            task.cancel()
-
-    async def _queue_timeout_task(self, member: discord.Member):
-        """Background task: removes a user from the queue after 15 minutes of inactivity."""
-        await asyncio.sleep(900)  # 15 minutes
-
-        # Guard against race condition where task was cancelled but not yet GC'd
-        if not (self.queue_1v1.is_in_queue(member) or self.queue_ap.is_in_queue(member)
-                or self.queue_bp.is_in_queue(member)):
+        """Cancel a member's queue timeout if one is pending."""
+        get_scheduler().cancel(("queue", member_id))
+
+    async def _expire_queued_member(self, member: discord.Member):
+        """Queue timeout: removes a user from the queue after Config.QUEUE_TIMEOUT without a match."""
+        # They may have left or been drawn into a round without the timer being cancelled
+        if not self._is_member_in_queue(member):
             return
 
-        self.queue_1v1.remove_user(member)
-        self.queue_ap.remove_user(member)
-        self.queue_bp.remove_user(member)
-        self.queue_timeouts.pop(member.id, None)
+        self._remove_from_queues(member)
+
+        dms = []
 
         # Party handling
         party_host_id = self.member_to_party.get(member.id)
@@ -311,20 +367,16 @@ class Matchmaking(commands.Cog):
             # User is the party host — remove all other party members too
             party = self.parties.get(party_host_id)
             if party:
+                removed_embed = EmbedBuilder.create_error_embed(
+                    "Removed from Queue",
+                    f"Your party host **{member.display_name}**'s queue timed out after {_queue_timeout_text()}. "
+                    "Use `/queue` again when you're ready."
+                )
                 for m in list(party.members):
                     if m.id != member.id:
-                        self.queue_1v1.remove_user(m)
-                        self.queue_ap.remove_user(m)
-                        self.queue_bp.remove_user(m)
+                        self._remove_from_queues(m)
                         self._cancel_queue_timeout(m.id)
-                        try:
-                            await m.send(embed=EmbedBuilder.create_error_embed(
-                                "Removed from Queue",
-                                f"Your party host **{member.display_name}**'s queue timed out after 15 minutes. "
-                                "Use `/queue` again when you're ready."
-                            ))
-                        except discord.Forbidden:
-                            pass
+                        dms.append((m, {"embed": removed_embed}))
         elif party_host_id:
             # User is a non-host party member — remove from party too
             party = self.parties.get(party_host_id)
@@ -332,14 +384,12 @@ class Matchmaking(commands.Cog):
                 party.remove_member(member)
             self.member_to_party.pop(member.id, None)
 
-        try:
-            await member.send(embed=EmbedBuilder.create_error_embed(
-                "Queue Timed Out",
-                "You have been in the queue for 15 minutes without finding a match. "
-                "Use `/queue` again when you're ready to play."
-            ))
-        except discord.Forbidden:
-            pass
+        dms.append((member, {"embed": EmbedBuilder.create_error_embed(
+            "Queue Timed Out",
+            f"You have been in the queue for {_queue_timeout_text()} without finding a match. "
+            "Use `/queue` again when you're ready to play."
+        )}))
+        await get_dispatcher().send_many(dms)
 
         await self.update_lobby_display()
         await self.check_matchmaking_threshold()
@@ -383,63 +433,211 @@ class Matchmaking(commands.Cog):
                 except:
                     pass
 
-            embed = EmbedBuilder.create_lobby_embed(self.queue_1v1, self.queue_ap, self.queue_bp)
-            view = LobbyView(self)
-            self.lobby_message = await lobby_channel.send(embed=embed, view=view)
+            if self.lobby_view is None:
+                self.lobby_view = LobbyView(self)
+            embed = self._render_lobby()
+            self.lobby_message = await lobby_channel.send(embed=embed, view=self.lobby_view)
+            self.lobby_renderer.mark_published(embed)
             logger.info("Lobby embed created successfully")
 
         except Exception as e:
             logger.error(f"Error initializing lobby: {e}", exc_info=True)
 
+    @traced()
     async def update_lobby_display(self):
-        """Update the lobby embed with current queue status."""
+        """Journal queue changes, then mark the lobby embed as out of date.
+
+        The edit itself happens on the lobby renderer's next tick, coalesced
+        with any other queue changes in the meantime, and is skipped if the
+        embed comes out the same.
+        """
+        await self.journal_queues()
         if not self.lobby_message:
             await self.initialize_lobby()
             return
+        self.lobby_renderer.mark_dirty()
+
+    def _queue_changed(self, member_id: int, moved: bool):
+        self._queue_journal[member_id] = self._queue_journal.get(member_id, False) or moved
+
+    def _queue_label(self, queue: MatchmakingQueue) -> str:
+        return {FormatType.ONE_V_ONE: "1v1", FormatType.AP: "AP", FormatType.BP: "BP"}[queue.format_type]
+
+    @traced()
+    async def journal_queues(self):
+        """Write queue and party changes made since the last call to the live-state journal."""
+        changed, self._queue_journal = self._queue_journal, {}
+        now = time.time()
+        upserts, deletes = [], []
+        for member_id, moved in changed.items():
+            queue = self.queue_index.get(member_id)
+            if queue is None:
+                if self._queue_seqs.pop(member_id, None) is not None:
+                    deletes.append(member_id)
+                continue
+            if moved or member_id not in self._queue_seqs:
+                self._queue_seq += 1
+                self._queue_seqs[member_id] = self._queue_seq
+            remaining = get_scheduler().remaining(("queue", member_id))
+            upserts.append((
+                member_id, self._queue_label(queue), queue.get_user_role(discord.Object(id=member_id)),
+                self._queue_seqs[member_id], None if remaining is None else now + remaining
+            ))
+
+        parties = {host_id: [m.id for m in party.members] for host_id, party in self.parties.items()}
+        party_upserts = [(h, ids) for h, ids in parties.items() if self._journaled_parties.get(h) != ids]
+        party_deletes = [h for h in self._journaled_parties if h not in parties]
 
         try:
-            embed = EmbedBuilder.create_lobby_embed(self.queue_1v1, self.queue_ap, self.queue_bp)
-            view = LobbyView(self)
-            await self.lobby_message.edit(embed=embed, view=view)
+            await apply_live_queue(upserts, deletes)
+            await apply_live_parties(party_upserts, party_deletes)
+            self._journaled_parties = parties
+        except Exception as e:
+            logger.error(f"Failed to journal queue state: {e}")
+            # Retry these on the next call
+            for member_id, moved in changed.items():
+                self._queue_changed(member_id, moved)
+
+    def restore_queues(self, state: dict, get_member) -> int:
+        """Rebuild parties and queues (in FIFO order, with their timeouts) from load_live_state()."""
+        for host_id, member_ids in state["parties"].items():
+            members = [m for m in map(get_member, member_ids) if m is not None]
+            host = get_member(host_id)
+            if host is None or len(members) < 2:
+                continue
+            self.parties[host_id] = Party(host=host, members=members)
+            for member in members:
+                self.member_to_party[member.id] = host_id
+        self._journaled_parties = {h: [m.id for m in p.members] for h, p in self.parties.items()}
+
+        now = time.time()
+        restored = 0
+        for member_id, format_label, role, seq, expires_at in state["queue"]:
+            member = get_member(member_id)
+            self._queue_seqs[member_id] = seq
+            if member is None:
+                # Left the guild while the bot was down; drop their row on the next journal write
+                self._queue_changed(member_id, False)
+                continue
+            queue = self._get_queue(format_label)
+            if role == "debater":
+                queue.add_debater(member)
+            else:
+                queue.add_judge(member)
+            self._start_queue_timeout(member, None if expires_at is None else max(0.0, expires_at - now))
+            self._queue_journal.pop(member_id, None)
+            restored += 1
+        self._queue_seq = max(self._queue_seqs.values(), default=0)
+        return restored
+
+    def _render_lobby(self) -> discord.Embed:
+        return EmbedBuilder.create_lobby_embed(self.queue_1v1, self.queue_ap, self.queue_bp)
+
+    async def _publish_lobby(self, embed: discord.Embed):
+        try:
+            await self.lobby_message.edit(embed=embed)
         except discord.NotFound:
             await self.initialize_lobby()
-        except Exception as e:
-            print(f"Error updating lobby display: {e}")
 
+    @traced()
     async def check_matchmaking_threshold(self):
-        """Check if either queue has reached a matchmaking threshold and auto-start a round."""
-        if self.current_round:
-            return
+        """Start as many rounds as each format's queue can fill, and confirm them all at once.
 
+        Formats form rounds independently, so a round waiting on confirmation
+        in one format doesn't hold up the others. Members of a round are
+        tracked in pending_members until it's confirmed or cancelled.
+        """
+        formed = []
         for format_label, queue in [("1v1", self.queue_1v1), ("AP", self.queue_ap), ("BP", self.queue_bp)]:
-            max_party_size = self._get_max_party_size(queue) if format_label in ("AP", "BP") else 1
-            round_type = queue.get_threshold_type(max_party_size)
-            if round_type:
-                # Auto-create round with random allocation
-                debaters = list(queue.debaters)
-                judges = list(queue.judges)
-                debate_round = self.create_round_allocation(debaters, judges, round_type)
-                self.current_round = debate_round
-                debate_round.format_label = format_label
-                # Cancel timeouts before clearing so they don't fire during confirmation
-                for member in list(queue.debaters) + list(queue.judges):
-                    self._cancel_queue_timeout(member.id)
-                queue.clear()
+            formed.extend(await self._form_rounds(format_label, queue))
+        if not formed:
+            return
+        rounds_cog = self.bot.get_cog("Rounds")
+        # Journal the new rounds before the queue removals, so a crash in between requeues them
+        if rounds_cog:
+            await asyncio.gather(*(rounds_cog.save_round(r, pending=True) for r in formed))
+        await self.update_lobby_display()
+
+        # Send confirmations to lobby channel in parallel
+        lobby_channel = self.bot.get_channel(Config.LOBBY_CHANNEL_ID)
+        if not (rounds_cog and lobby_channel):
+            return
+        results = await asyncio.gather(
+            *(rounds_cog.send_participant_confirmation(lobby_channel, debate_round, self)
+              for debate_round in formed),
+            return_exceptions=True
+        )
+        for debate_round, result in zip(formed, results):
+            if isinstance(result, Exception):
+                logger.error(f"Could not send confirmation for round {debate_round.round_id}: {result}")
+                self.release_pending_round(debate_round.round_id)
+                self.requeue_participants(debate_round)
                 await self.update_lobby_display()
+                await rounds_cog.forget_round(debate_round.round_id)
+
+    def _plan_draw(self, format_label: str, queue: MatchmakingQueue) -> list:
+        """Round types the queue's free (not pending) members can fill right now."""
+        debaters = [m for m in queue.debaters if m.id not in self.pending_members]
+        judges = [m for m in queue.judges if m.id not in self.pending_members]
+        max_party_size = self._get_max_party_size(queue) if format_label in ("AP", "BP") else 1
+        return plan_draw(queue.format_type, len(debaters), len(judges), max_party_size)
+
+    @traced()
+    async def _form_rounds(self, format_label: str, queue: MatchmakingQueue) -> list:
+        """Allocate every round a queue can currently fill (see utils.allocation.plan_draw).
+
+        Allocated members leave the queue and are held as pending before the
+        format's lock is released, so concurrent checks can't book them twice.
+        Leftover debaters and judges stay queued.
+        """
+        async with self.formation_locks[format_label]:
+            if not self._plan_draw(format_label, queue):
+                return []
+            ratings = await self._fetch_ratings(queue.debaters)
+
+            # The queue may have changed while ratings were loading (/leave and
+            # queue timeouts don't take the lock), possibly below one round
+            plan = self._plan_draw(format_label, queue)
+            if not plan:
+                return []
+            debaters = [m for m in queue.debaters if m.id not in self.pending_members]
+            judges = [m for m in queue.judges if m.id not in self.pending_members]
+
+            formed = []
+            for round_type, panel in zip(plan, split_judges(judges, len(plan))):
+                debate_round = self.create_round_allocation(debaters, panel, round_type, ratings)
+                if not debate_round:
+                    break
+                debate_round.format_label = format_label
 
-                # Send confirmation to lobby channel
-                rounds_cog = self.bot.get_cog("Rounds")
-                lobby_channel = self.bot.get_channel(Config.LOBBY_CHANNEL_ID)
-                if rounds_cog and lobby_channel:
-                    await rounds_cog.send_participant_confirmation(
-                        lobby_channel, debate_round, self
-                    )
-                break  # Only start one round at a time
+                # Cancel timeouts so they don't fire during confirmation
+                for member in debate_round.get_all_participants():
+                    self._cancel_queue_timeout(member.id)
+                    queue.remove_user(member)
+                self.add_pending_round(debate_round)
+                allocated = {m.id for m in debate_round.get_all_participants()}
+                debaters = [m for m in debaters if m.id not in allocated]
+                formed.append(debate_round)
+
+            if formed:
+                logger.info(f"Drew {len(formed)} {format_label} round(s); "
+                            f"{queue.debater_count()} debaters and {queue.judge_count()} judges still queued")
+            return formed
+
+    @traced()
+    async def _fetch_ratings(self, members: list) -> dict:
+        """Stored Elo for the given members (missing or unreadable → default rating)."""
+        try:
+            return await get_ratings([m.id for m in members])
+        except Exception as e:
+            logger.warning(f"Could not load ratings for allocation: {e}")
+            return {}
 
     def _build_allocation_units(self, debaters: list) -> list:
         """Group debaters into allocation units. Party members stay together."""
         units = []
         assigned = set()
+        queued = {debater.id for debater in debaters}
 
         for debater in debaters:
             if debater.id in assigned:
@@ -447,7 +645,7 @@ class Matchmaking(commands.Cog):
             host_id = self.member_to_party.get(debater.id)
             if host_id and host_id in self.parties:
                 party = self.parties[host_id]
-                party_unit = [m for m in party.members if m in debaters and m.id not in assigned]
+                party_unit = [m for m in party.members if m.id in queued and m.id not in assigned]
                 for m in party_unit:
                     assigned.add(m.id)
                 if party_unit:
@@ -457,8 +655,58 @@ class Matchmaking(commands.Cog):
                 units.append([debater])
         return units
 
-    def create_round_allocation(self, debaters: list, judges: list, round_type: RoundType) -> DebateRound:
-        """Create a debate round allocation from queued debaters and judges."""
+    def _balanced_teams(self, units: list, team_sizes: list, ratings: dict) -> Optional[list]:
+        """Pick units in queue order, balance them by Elo and return each team's members."""
+        selected = select_units(units, team_sizes)
+        if selected is None:
+            return None
+        teams = balance_teams(selected, team_sizes, lambda m: ratings.get(m.id, Config.ELO_DEFAULT))
+        if teams is None:
+            return None
+
+        # Sides and speaking order stay random; only equally-sized teams can swap sides
+        if len(set(team_sizes)) == 1:
+            random.shuffle(teams)
+        members = []
+        for team_units in teams:
+            random.shuffle(team_units)
+            members.append([m for unit in team_units for m in unit])
+        return members
+
+    @traced()
+    def create_round_allocation(self, debaters: list, judges: list, round_type: RoundType,
+                                ratings: Optional[dict] = None) -> Optional[DebateRound]:
+        """Create a skill-balanced round allocation from queued debaters and judges.
+
+        Debaters are taken in queue order (parties kept together) until the round
+        is full, then packed into the teams with the smallest Elo gap. Returns
+        None if the queued units can't fill the round's seats exactly.
+        """
+        ratings = ratings or {}
+
+        if round_type == RoundType.PM_LO:
+            # 1v1: no parties
+            units = [[debater] for debater in debaters]
+            team_sizes = [1, 1]
+        elif round_type == RoundType.DOUBLE_IRON:
+            units = self._build_allocation_units(debaters)
+            team_sizes = [2, 2]
+        elif round_type == RoundType.SINGLE_IRON:
+            # 3v2 or 2v3
+            units = self._build_allocation_units(debaters)
+            team_sizes = random.choice([[2, 3], [3, 2]])
+        elif round_type == RoundType.BP:
+            units = self._build_allocation_units(debaters)
+            team_sizes = [2, 2, 2, 2]
+        else:  # STANDARD (3v3)
+            units = self._build_allocation_units(debaters)
+            team_sizes = [3, 3]
+
+        teams = self._balanced_teams(units, team_sizes, ratings)
+        if teams is None:
+            logger.warning(f"Could not fill a {round_type.value} round from {len(units)} queued units")
+            return None
+
         self.round_counter += 1
 
         # Shuffle judges for random chair assignment
@@ -470,72 +718,19 @@ class Matchmaking(commands.Cog):
         for judge in shuffled_judges:
             judge_panel.add_judge(judge)
 
-        if round_type == RoundType.PM_LO:
-            # 1v1: no parties, simple shuffle
-            shuffled_debaters = debaters.copy()
-            random.shuffle(shuffled_debaters)
-
-            gov_team = DebateTeam("Government", TeamType.SOLO)
-            opp_team = DebateTeam("Opposition", TeamType.SOLO)
-            gov_team.members = [shuffled_debaters[0]]
-            opp_team.members = [shuffled_debaters[1]]
-
-        elif round_type == RoundType.DOUBLE_IRON:
-            # 2v2: party-aware allocation
-            units = self._build_allocation_units(debaters)
-            random.shuffle(units)
-
-            gov_members, opp_members = [], []
-            for unit in units:
-                if len(gov_members) + len(unit) <= 2:
-                    gov_members.extend(unit)
-                elif len(opp_members) + len(unit) <= 2:
-                    opp_members.extend(unit)
-
-            gov_team = DebateTeam("Government", TeamType.IRON)
-            opp_team = DebateTeam("Opposition", TeamType.IRON)
-            gov_team.members = gov_members
-            opp_team.members = opp_members
-
-        elif round_type == RoundType.SINGLE_IRON:
-            # 3v2 or 2v3: party-aware allocation
-            gov_is_iron = random.choice([True, False])
-            gov_size = 2 if gov_is_iron else 3
-            opp_size = 3 if gov_is_iron else 2
-
-            units = self._build_allocation_units(debaters)
-            random.shuffle(units)
-
-            gov_members, opp_members = [], []
-            for unit in units:
-                if len(gov_members) + len(unit) <= gov_size:
-                    gov_members.extend(unit)
-                elif len(opp_members) + len(unit) <= opp_size:
-                    opp_members.extend(unit)
+        def team_type(size: int) -> TeamType:
+            return {1: TeamType.SOLO, 2: TeamType.IRON}.get(size, TeamType.FULL)
 
-            gov_team = DebateTeam("Government", TeamType.IRON if gov_is_iron else TeamType.FULL)
-            opp_team = DebateTeam("Opposition", TeamType.FULL if gov_is_iron else TeamType.IRON)
-            gov_team.members = gov_members
-            opp_team.members = opp_members
-
-        elif round_type == RoundType.BP:
-            # BP: party-aware allocation into 4 teams of 2
-            units = self._build_allocation_units(debaters)
-            random.shuffle(units)
-
-            # Flatten units into ordered list (party members stay consecutive)
-            ordered = []
-            for unit in units:
-                ordered.extend(unit)
-
-            og_team = DebateTeam("Opening Government", TeamType.IRON)
-            oo_team = DebateTeam("Opening Opposition", TeamType.IRON)
-            cg_team = DebateTeam("Closing Government", TeamType.IRON)
-            co_team = DebateTeam("Closing Opposition", TeamType.IRON)
-            og_team.members = ordered[0:2]
-            oo_team.members = ordered[2:4]
-            cg_team.members = ordered[4:6]
-            co_team.members = ordered[6:8]
+        if round_type == RoundType.BP:
+            bp_teams = []
+            for name, members in zip(
+                ["Opening Government", "Opening Opposition", "Closing Government", "Closing Opposition"],
+                teams
+            ):
+                team = DebateTeam(name, TeamType.IRON)
+                team.members = members
+                bp_teams.append(team)
+            og_team, oo_team, cg_team, co_team = bp_teams
 
             return DebateRound(
                 round_id=self.round_counter,
@@ -547,21 +742,10 @@ class Matchmaking(commands.Cog):
                 judges=judge_panel
             )
 
-        else:  # STANDARD (3v3)
-            units = self._build_allocation_units(debaters)
-            random.shuffle(units)
-
-            gov_members, opp_members = [], []
-            for unit in units:
-                if len(gov_members) + len(unit) <= 3:
-                    gov_members.extend(unit)
-                elif len(opp_members) + len(unit) <= 3:
-                    opp_members.extend(unit)
-
-            gov_team = DebateTeam("Government", TeamType.FULL)
-            opp_team = DebateTeam("Opposition", TeamType.FULL)
-            gov_team.members = gov_members
-            opp_team.members = opp_members
+        gov_team = DebateTeam("Government", team_type(team_sizes[0]))
+        opp_team = DebateTeam("Opposition", team_type(team_sizes[1]))
+        gov_team.members = teams[0]
+        opp_team.members = teams[1]
 
         return DebateRound(
             round_id=self.round_counter,
@@ -573,64 +757,6 @@ class Matchmaking(commands.Cog):
 
     # ─── Slash Commands ────────────────────────────────────────────
 
-    # ── /createqueue (alias /cq) ─────────────────────────────────────
-
-    @discord.slash_command(
-        name="createqueue",
-        description="Create a new matchmaking lobby (Host only)",
-        default_member_permissions=None
-    )
-    async def createqueue_command(
-        self,
-        ctx: discord.ApplicationContext,
-        name: str = discord.Option(description="Name for the lobby", required=True)
-    ):
-        """Create a new named lobby."""
-        await self._do_createqueue(ctx, name)
-
-    @discord.slash_command(
-        name="cq",
-        description="Create a new matchmaking lobby — shorthand for /createqueue (Host only)",
-        default_member_permissions=None
-    )
-    async def cq_command(
-        self,
-        ctx: discord.ApplicationContext,
-        name: str = discord.Option(description="Name for the lobby", required=True)
-    ):
-        """Shorthand alias for /createqueue."""
-        await self._do_createqueue(ctx, name)
-
-    async def _do_createqueue(self, ctx: discord.ApplicationContext, name: str):
-        """Shared implementation for /createqueue and /cq."""
-        logger.info(f"User {ctx.author} ({ctx.author.id}) used /createqueue with name={name}")
-
-        # Try to create lobby — anyone can create, and they become the host
-        lobby = self.lobby_manager.create_lobby(name, ctx.author)
-        if lobby is None:
-            await ctx.respond(
-                embed=EmbedBuilder.create_error_embed(
-                    "Lobby Already Exists",
-                    f"A lobby named **{name}** already exists. Choose a different name."
-                ),
-                ephemeral=False
-            )
-            return
-
-        # Post lobby embed in the current channel
-        embed = EmbedBuilder.create_lobby_embed(lobby)
-        view = LobbyView(self, lobby.name)
-        lobby.lobby_message = await ctx.channel.send(embed=embed, view=view)
-
-        await ctx.respond(
-            embed=EmbedBuilder.create_success_embed(
-                "Lobby Created",
-                f"**{ctx.author.display_name}** started a queue: **{name}**\n"
-                f"Use `/join {name} <debater|judge>` to participate!"
-            ),
-            ephemeral=False
-        )
-
     # ── /join ────────────────────────────────────────────────────────
 
     @discord.slash_command(
@@ -641,7 +767,6 @@ class Matchmaking(commands.Cog):
     async def join_command(
         self,
         ctx: discord.ApplicationContext,
-        name: str = discord.Option(description="Name of the lobby to join", required=True, autocomplete=lobby_name_autocomplete),
         role: str = discord.Option(
             description="Join as a debater or judge",
             choices=["debater", "judge"],
@@ -657,6 +782,16 @@ class Matchmaking(commands.Cog):
         """Join the matchmaking queue as debater or judge for a specific format."""
         logger.info(f"User {ctx.author} ({ctx.author.id}) used /queue as {role} for {debate_format}")
 
+        if ctx.author.id in self.pending_members:
+            await ctx.respond(
+                embed=EmbedBuilder.create_error_embed(
+                    "Round Pending",
+                    "You've been matched into a round that is waiting for confirmation."
+                ),
+                ephemeral=True
+            )
+            return
+
         # Party checks
         party_host_id = self.member_to_party.get(ctx.author.id)
         if party_host_id:
@@ -703,15 +838,23 @@ class Matchmaking(commands.Cog):
                     )
                     return
 
+                if any(member.id in self.pending_members for member in party.members):
+                    await ctx.respond(
+                        embed=EmbedBuilder.create_error_embed(
+                            "Round Pending",
+                            "A member of your party is in a round that is waiting for confirmation."
+                        ),
+                        ephemeral=True
+                    )
+                    return
+
                 # Queue all party members as debaters in the selected format
                 queue = self.queue_bp if debate_format == "BP" else self.queue_ap
                 format_display = debate_format
 
                 for member in party.members:
                     # Remove from all other queues
-                    for q in [self.queue_1v1, self.queue_ap, self.queue_bp]:
-                        if q != queue:
-                            q.remove_user(member)
+                    self._remove_from_queues(member, keep=queue)
                     queue.add_debater(member)
                     self._start_queue_timeout(member)
 
@@ -743,20 +886,7 @@ class Matchmaking(commands.Cog):
         queue = self._get_queue(debate_format)
 
         # Remove from all other queues
-        for q in [self.queue_1v1, self.queue_ap, self.queue_bp]:
-            if q != queue:
-                q.remove_user(ctx.author)
-
-        lobby = self.lobby_manager.get_lobby(name)
-        if lobby is None:
-            await ctx.respond(
-                embed=EmbedBuilder.create_error_embed(
-                    "Lobby Not Found",
-                    f"No lobby named **{name}** exists. Use `/lobbies` to see available lobbies."
-                ),
-                ephemeral=False
-            )
-            return
+        self._remove_from_queues(ctx.author, keep=queue)
 
         if role == "debater":
             success = queue.add_debater(ctx.author)
@@ -804,11 +934,7 @@ class Matchmaking(commands.Cog):
             if party:
                 removed = False
                 for member in party.members:
-                    if self.queue_1v1.remove_user(member):
-                        removed = True
-                    if self.queue_ap.remove_user(member):
-                        removed = True
-                    if self.queue_bp.remove_user(member):
+                    if self._remove_from_queues(member):
                         removed = True
                     self._cancel_queue_timeout(member.id)
                 if removed:
@@ -838,16 +964,14 @@ class Matchmaking(commands.Cog):
                 party.remove_member(ctx.author)
                 self.member_to_party.pop(ctx.author.id, None)
 
-        removed_1v1 = self.queue_1v1.remove_user(ctx.author)
-        removed_ap = self.queue_ap.remove_user(ctx.author)
-        removed_bp = self.queue_bp.remove_user(ctx.author)
+        removed = self._remove_from_queues(ctx.author)
         self._cancel_queue_timeout(ctx.author.id)
 
-        if removed_1v1 or removed_ap or removed_bp:
+        if removed:
             await ctx.respond(
                 embed=EmbedBuilder.create_success_embed(
-                    "Left Lobby",
-                    f"You have been removed from **{lobby.name}**."
+                    "Left Queue",
+                    "You have been removed from the matchmaking queue."
                 ),
                 ephemeral=True
             )
@@ -861,30 +985,12 @@ class Matchmaking(commands.Cog):
                 ),
                 ephemeral=True
             )
-            return
-
-        # Delete lobby message if it exists
-        if lobby.lobby_message:
-            try:
-                await lobby.lobby_message.delete()
-            except:
-                pass
-
-        self.lobby_manager.remove_lobby(name)
-
-        await ctx.respond(
-            embed=EmbedBuilder.create_success_embed(
-                "Lobby Disbanded",
-                f"**{name}** has been disbanded by {ctx.author.display_name}."
-            ),
-            ephemeral=False
-        )
 
     # ── /clearqueue (admin) ──────────────────────────────────────────
 
     @discord.slash_command(
         name="clearqueue",
-        description="Clear a specific lobby's queue (Admin only)"
+        description="Clear every matchmaking queue (Admin only)"
     )
     @commands.has_permissions(administrator=True)
     async def clear_queue_command(self, ctx: discord.ApplicationContext):
@@ -1027,7 +1133,7 @@ class Matchmaking(commands.Cog):
 
         party = self.parties[host_id]
         in_queue = any(
-            m in self.queue_ap.debaters or m in self.queue_bp.debaters
+            self.queue_ap.has_debater(m) or self.queue_bp.has_debater(m)
             for m in party.members
         )
         embed = EmbedBuilder.create_party_status_embed(party, in_queue)
@@ -1056,9 +1162,7 @@ class Matchmaking(commands.Cog):
         if ctx.author.id == host_id:
             # Host disbands: remove all members from queue + party
             for member in party.members:
-                self.queue_1v1.remove_user(member)
-                self.queue_ap.remove_user(member)
-                self.queue_bp.remove_user(member)
+                self._remove_from_queues(member)
             self._disband_party(host_id)
 
             await ctx.respond(
@@ -1071,9 +1175,7 @@ class Matchmaking(commands.Cog):
             # Member leaves: remove from party + queue
             party.remove_member(ctx.author)
             self.member_to_party.pop(ctx.author.id, None)
-            self.queue_1v1.remove_user(ctx.author)
-            self.queue_ap.remove_user(ctx.author)
-            self.queue_bp.remove_user(ctx.author)
+            self._remove_from_queues(ctx.author)
 
             await ctx.respond(
                 embed=EmbedBuilder.create_success_embed(
@@ -1114,7 +1216,7 @@ class Matchmaking(commands.Cog):
             ), ephemeral=True)
             return
 
-        if target_round and ctx.author in target_round.get_all_participants():
+        if target_round and target_round.get_role(ctx.author.id):
             await ctx.respond(embed=EmbedBuilder.create_error_embed(
                 "Already a Participant",
                 "You are already a participant in this round."
@@ -1172,14 +1274,15 @@ class Matchmaking(commands.Cog):
         embed.add_field(
             name="📋 Commands",
             value=(
-                "**/createqueue <name>** (or **/cq**) — Create a new lobby *(Host)*\n"
-                "**/join <name> <role>** — Join a lobby as **debater** or **judge**\n"
-                "**/leave <name>** — Leave a lobby\n"
-                "**/lobby <name>** — View a lobby's status\n"
-                "**/lobbies** — List all lobbies you're in\n"
-                "**/start <name>** — Start a round from a lobby *(Host)*\n"
-                "**/end <name>** — Disband a lobby *(Host)*\n"
-                "**/clearqueue <name>** — Clear a lobby's queue *(Admin)*\n"
+                "**/queue <role> <format>** — Queue as **debater** or **judge** for **1v1**, **AP** or **BP**\n"
+                "**/leave** — Leave the queue\n"
+                "**/invite <user>** — Invite someone to your party (AP/BP teammates)\n"
+                "**/party** — View your party\n"
+                "**/leaveparty** — Leave your party (the host disbands it)\n"
+                "**/observe <user>** — Ask to watch a user's round\n"
+                "**/stats [member]** — Debate and judging stats\n"
+                "**/guide** — How the bot works\n"
+                "**/clearqueue** — Clear every queue *(Admin)*\n"
                 "**/about** — This message"
             ),
             inline=False
@@ -1188,28 +1291,26 @@ class Matchmaking(commands.Cog):
         embed.add_field(
             name="⚙️ How Rounds Work",
             value=(
-                "A host creates a lobby with **/createqueue**, then players "
-                "**/join** as debaters or judges. When the host runs **/start**, "
-                "the bot checks whether there are enough players and determines "
-                "the round format automatically:\n\n"
-                "• **PM-LO Speech (1v1)** — 2 debaters + 1 judge (minimum to start)\n"
+                "Players **/queue** as debaters or judges. As soon as a format's "
+                "queue can fill a round, the bot draws as many rounds as it can "
+                "and picks the round type from who is waiting:\n\n"
+                "• **PM-LO Speech (1v1)** — 2 debaters + 1 judge\n"
                 "• **Double Iron (2v2)** — 4 debaters + 1 judge\n"
                 "• **Single Iron (3v2 or 2v3)** — 5 debaters + 1 judge\n"
-                "• **Standard (3v3)** — 6+ debaters + 1+ judges\n\n"
-                "Debaters are randomly shuffled into Government and Opposition "
-                "teams and assigned speaking positions (PM, DPM, GW / LO, DLO, OW). "
-                "Extra participants beyond what the round needs are placed as judges."
+                "• **Standard (3v3)** — 6 debaters + 1 judge\n"
+                "• **BP** — 8 debaters + 1 judge\n\n"
+                "Teams are balanced by Elo, parties stay together, and extra "
+                "judges join as panelists."
             ),
             inline=False
         )
 
         embed.add_field(
-            name="🔧 After Allocation",
+            name="🔧 After the Draw",
             value=(
-                "The host receives an interactive panel to adjust the allocation — "
-                "swap members between teams, toggle team sizes "
-                "(Full ↔ Iron ↔ Solo), or move players between debater and judge "
-                "roles — before confirming the final round."
+                "Everyone in the round confirms in the lobby; if anyone declines, "
+                "the others go back to the queue. Once all confirm, the bot creates "
+                "the round's channels and the chair runs motions, prep and the ballot."
             ),
             inline=False
         )
@@ -2,15 +2,30 @@ import asyncio
 import discord
 from discord.ext import commands
 import logging
+import re
 import time
+from datetime import timedelta
 from typing import Optional
 
-from utils.models import DebateRound, RoundType, SpeakerScore, Ballot, JudgeRating, BallotDraft, BPBallot, BPBallotDraft
+from utils.models import (
+    DebateRound, RoundType, SpeakerScore, Ballot, FinalizedBallot, JudgeRating, BallotDraft, BPBallot, BPBallotDraft
+)
+from utils.channel_pool import RoundChannelPool, layout_for
+from utils.concurrency import gather_bounded
+from utils.database import delete_live_round, load_live_state, save_live_round
+from utils.dm import get_dispatcher
 from utils.embeds import EmbedBuilder
+from utils.persistence import UnresolvedMember, restore_round, round_state
+from utils.scheduler import get_scheduler
+from utils.tracing import traced, traced_interaction
+from utils.voice import describe_move_error, move_members
 from config import Config
 
 logger = logging.getLogger('DebateBot.Rounds')
 
+# Matches the categories create_round_channels names, capturing the round id
+ROUND_CATEGORY_RE = re.compile(r"^Round (\d+) - ")
+
 
 class ParticipantConfirmationView(discord.ui.View):
     """View for participants to confirm or decline a round."""
@@ -39,11 +54,12 @@ class ParticipantConfirmationView(discord.ui.View):
         self.stop()
 
         # Re-queue all participants except the decliner (if any)
+        self.matchmaking_cog.release_pending_round(self.debate_round.round_id)
         self.matchmaking_cog.requeue_participants(self.debate_round, excluded_member=excluded_member)
-        self.matchmaking_cog.current_round = None
 
         # Update lobby display and check thresholds
         await self.matchmaking_cog.update_lobby_display()
+        await self.rounds_cog.forget_round(self.debate_round.round_id)
         await self.matchmaking_cog.check_matchmaking_threshold()
 
         # Disable buttons and update message
@@ -59,7 +75,8 @@ class ParticipantConfirmationView(discord.ui.View):
 
     async def _check_all_confirmed(self, interaction: discord.Interaction):
         """Check if all participants confirmed, and if so, create channels."""
-        if self.confirmed_members == self.all_participant_ids:
+        # Clicks that land together all see the full set once their edits return; only the first starts the round
+        if self.confirmed_members == self.all_participant_ids and not self.debate_round.confirmed:
             self.debate_round.confirmed = True
             self.stop()
 
@@ -81,10 +98,11 @@ class ParticipantConfirmationView(discord.ui.View):
                 interaction.guild, self.debate_round, self.matchmaking_cog
             )
 
-            # Clear current_round so a new round can be started
-            self.matchmaking_cog.current_round = None
+            # The round is active now; its members are no longer held as pending
+            self.matchmaking_cog.release_pending_round(self.debate_round.round_id)
 
     @discord.ui.button(label="Confirm", style=discord.ButtonStyle.success)
+    @traced_interaction()
     async def confirm_button(self, button: discord.ui.Button, interaction: discord.Interaction):
         """Handle a participant confirming."""
         if interaction.user.id not in self.all_participant_ids:
@@ -111,6 +129,7 @@ class ParticipantConfirmationView(discord.ui.View):
         await self._check_all_confirmed(interaction)
 
     @discord.ui.button(label="Decline", style=discord.ButtonStyle.danger)
+    @traced_interaction()
     async def decline_button(self, button: discord.ui.Button, interaction: discord.Interaction):
         """Handle a participant declining."""
         if interaction.user.id not in self.all_participant_ids:
@@ -146,6 +165,7 @@ class SubmitBallotView(discord.ui.View):
         btn.callback = self.submit_ballot_callback
         self.add_item(btn)
 
+    @traced_interaction()
     async def submit_ballot_callback(self, interaction: discord.Interaction):
         """Handle the ballot submission button click."""
         matchmaking_cog = self.rounds_cog.bot.get_cog("Matchmaking")
@@ -155,8 +175,7 @@ class SubmitBallotView(discord.ui.View):
             await interaction.response.send_message("Round not found.", ephemeral=True)
             return
 
-        judge_ids = {j.id for j in debate_round.judges.get_all_judges()}
-        if interaction.user.id not in judge_ids:
+        if not debate_round.is_judge(interaction.user.id):
             await interaction.response.send_message(
                 "Only judges can submit the ballot.", ephemeral=True
             )
@@ -238,6 +257,7 @@ class WinnerSelectView(discord.ui.View):
         self.next_btn.callback = self._next_callback
         self.add_item(self.next_btn)
 
+    @traced_interaction()
     async def _winner_callback(self, interaction: discord.Interaction):
         selected = self.winner_select.values[0]
         self.draft.winner = selected
@@ -250,6 +270,7 @@ class WinnerSelectView(discord.ui.View):
             view=self
         )
 
+    @traced_interaction()
     async def _next_callback(self, interaction: discord.Interaction):
         if self.is_1v1:
             modal = ScoreModal1v1(self.draft)
@@ -288,6 +309,7 @@ class ScoreModal1v1(discord.ui.Modal):
         )
         self.add_item(self.lo_input)
 
+    @traced_interaction()
     async def callback(self, interaction: discord.Interaction):
         gov_member = self.draft.debate_round.government.members[0]
         opp_member = self.draft.debate_round.opposition.members[0]
@@ -313,10 +335,10 @@ class ScoreModal1v1(discord.ui.Modal):
             winner=self.draft.winner,
             gov_scores=[SpeakerScore(member=gov_member, position_name="Prime Minister", score=pm_score)],
             opp_scores=[SpeakerScore(member=opp_member, position_name="Leader of Opposition", score=lo_score)],
-        )
-        error = ballot.validate()
-        if error:
-            await interaction.response.send_message(f"Validation error: {error}", ephemeral=True)
+        ).freeze()
+        issue = ballot.check()
+        if issue:
+            await interaction.response.send_message(f"Validation error: {issue.message}", ephemeral=True)
             return
 
         await interaction.response.defer()
@@ -361,6 +383,7 @@ class GovAssignmentView(discord.ui.View):
         self.add_item(self.next_btn)
 
     def _make_pos_callback(self, pos_name: str, select: discord.ui.Select):
+        @traced_interaction()
         async def callback(interaction: discord.Interaction):
             selected_id = interaction.data["values"][0]
             self.assignments[pos_name] = selected_id
@@ -371,6 +394,7 @@ class GovAssignmentView(discord.ui.View):
             await interaction.response.edit_message(view=self)
         return callback
 
+    @traced_interaction()
     async def _reply_callback(self, interaction: discord.Interaction):
         selected_id = interaction.data["values"][0]
         self.reply_member_id = selected_id
@@ -380,6 +404,7 @@ class GovAssignmentView(discord.ui.View):
         self.reply_select.placeholder = f"Gov Reply: {selected_label}"
         await interaction.response.edit_message(view=self)
 
+    @traced_interaction()
     async def _next_callback(self, interaction: discord.Interaction):
         # Validate all positions filled
         if len(self.assignments) < len(self.positions):
@@ -464,6 +489,7 @@ class OppAssignmentView(discord.ui.View):
         self.add_item(self.next_btn)
 
     def _make_pos_callback(self, pos_name: str, select: discord.ui.Select):
+        @traced_interaction()
         async def callback(interaction: discord.Interaction):
             selected_id = interaction.data["values"][0]
             self.assignments[pos_name] = selected_id
@@ -474,6 +500,7 @@ class OppAssignmentView(discord.ui.View):
             await interaction.response.edit_message(view=self)
         return callback
 
+    @traced_interaction()
     async def _reply_callback(self, interaction: discord.Interaction):
         selected_id = interaction.data["values"][0]
         self.reply_member_id = selected_id
@@ -483,6 +510,7 @@ class OppAssignmentView(discord.ui.View):
         self.reply_select.placeholder = f"Opp Reply: {selected_label}"
         await interaction.response.edit_message(view=self)
 
+    @traced_interaction()
     async def _next_callback(self, interaction: discord.Interaction):
         if len(self.assignments) < len(self.positions):
             await interaction.response.send_message(
@@ -551,6 +579,7 @@ class GovScoreModal(discord.ui.Modal):
         )
         self.add_item(self.reply_input)
 
+    @traced_interaction()
     async def callback(self, interaction: discord.Interaction):
         gov_scores = []
         for inp, pos_name, member in self.score_inputs:
@@ -601,6 +630,7 @@ class OppScoreContinueView(discord.ui.View):
         self.draft = draft
 
     @discord.ui.button(label="Continue to Opposition Scores", style=discord.ButtonStyle.primary)
+    @traced_interaction()
     async def continue_button(self, button: discord.ui.Button, interaction: discord.Interaction):
         modal = OppScoreModal(self.draft)
         await interaction.response.send_modal(modal)
@@ -632,6 +662,7 @@ class OppScoreModal(discord.ui.Modal):
         )
         self.add_item(self.reply_input)
 
+    @traced_interaction()
     async def callback(self, interaction: discord.Interaction):
         opp_scores = []
         for inp, pos_name, member in self.score_inputs:
@@ -672,10 +703,10 @@ class OppScoreModal(discord.ui.Modal):
             opp_scores=opp_scores,
             gov_reply=self.draft.gov_reply_score,
             opp_reply=opp_reply,
-        )
-        error = ballot.validate()
-        if error:
-            await interaction.response.send_message(f"Validation error: {error}", ephemeral=True)
+        ).freeze()
+        issue = ballot.check()
+        if issue:
+            await interaction.response.send_message(f"Validation error: {issue.message}", ephemeral=True)
             return
 
         await interaction.response.defer()
@@ -701,14 +732,14 @@ class PostBallotRoundCompleteView(discord.ui.View):
         btn.callback = self.complete_callback
         self.add_item(btn)
 
+    @traced_interaction()
     async def complete_callback(self, interaction: discord.Interaction):
         matchmaking_cog = self.rounds_cog.bot.get_cog("Matchmaking")
         debate_round = matchmaking_cog.active_rounds.get(self.round_id) if matchmaking_cog else None
 
         # Verify user is a judge
         if debate_round:
-            judge_ids = {j.id for j in debate_round.judges.get_all_judges()}
-            if interaction.user.id not in judge_ids:
+            if not debate_round.is_judge(interaction.user.id):
                 await interaction.response.send_message(
                     "Only judges can mark the round as complete.", ephemeral=True
                 )
@@ -731,18 +762,17 @@ class ChannelDeletionConfirmView(discord.ui.View):
         self.round_id = round_id
 
     @discord.ui.button(label="Confirm", style=discord.ButtonStyle.danger)
+    @traced_interaction()
     async def confirm_button(self, button: discord.ui.Button, interaction: discord.Interaction):
         await interaction.response.defer()
 
         matchmaking_cog = self.rounds_cog.bot.get_cog("Matchmaking")
         debate_round = matchmaking_cog.active_rounds.get(self.round_id) if matchmaking_cog else None
 
-        # Cancel prep/veto timers if still running
+        # Cancel prep/veto timers if still pending
         if debate_round:
-            if hasattr(debate_round, '_prep_task') and debate_round._prep_task:
-                debate_round._prep_task.cancel()
-            if hasattr(debate_round, '_veto_task') and debate_round._veto_task:
-                debate_round._veto_task.cancel()
+            self.rounds_cog.cancel_prep_timer(debate_round)
+            get_scheduler().cancel(("veto", debate_round.round_id))
 
         # Delete channels and category
         await self.rounds_cog.delete_round_channels(interaction.guild, self.round_id)
@@ -750,6 +780,7 @@ class ChannelDeletionConfirmView(discord.ui.View):
         # Remove from active rounds
         if matchmaking_cog:
             matchmaking_cog.remove_active_round(self.round_id)
+        await self.rounds_cog.forget_round(self.round_id)
 
         # Post completion in lobby channel
         lobby_channel = self.rounds_cog.bot.get_channel(Config.LOBBY_CHANNEL_ID)
@@ -758,6 +789,7 @@ class ChannelDeletionConfirmView(discord.ui.View):
             await lobby_channel.send(embed=embed)
 
     @discord.ui.button(label="Cancel", style=discord.ButtonStyle.secondary)
+    @traced_interaction()
     async def cancel_button(self, button: discord.ui.Button, interaction: discord.Interaction):
         await interaction.response.edit_message(content="Channel deletion cancelled.", view=None)
 
@@ -772,6 +804,7 @@ class RateJudgeView(discord.ui.View):
         self.debater = debater
 
     @discord.ui.button(label="Rate Judge", style=discord.ButtonStyle.primary)
+    @traced_interaction()
     async def rate_button(self, button: discord.ui.Button, interaction: discord.Interaction):
         # Check if already rated
         if self.debater.id in self.debate_round.rated_debater_ids:
@@ -808,6 +841,7 @@ class RateJudgeModal(discord.ui.Modal):
         )
         self.add_item(self.feedback_input)
 
+    @traced_interaction()
     async def callback(self, interaction: discord.Interaction):
         # Parse score
         try:
@@ -826,6 +860,7 @@ class RateJudgeModal(discord.ui.Modal):
         rating = JudgeRating(debater=self.debater, score=score, feedback=feedback)
         self.debate_round.judge_ratings.append(rating)
         self.debate_round.rated_debater_ids.add(self.debater.id)
+        await self.rounds_cog.save_round(self.debate_round)
 
         # Disable the Rate Judge button in the DM
         for item in self.rate_view.children:
@@ -878,6 +913,7 @@ class MotionInputModal(discord.ui.Modal):
         )
         self.add_item(self.infoslide_input)
 
+    @traced_interaction()
     async def callback(self, interaction: discord.Interaction):
         motion = self.motion_input.value.strip()
         if not motion:
@@ -903,6 +939,7 @@ class MotionInputModal(discord.ui.Modal):
         self.chair_view.show_start_prep()
         chair_embed = EmbedBuilder.create_chair_control_embed(debate_round)
         await interaction.response.edit_message(embed=chair_embed, view=self.chair_view)
+        await self.chair_view.rounds_cog.save_round(debate_round)
 
 
 class APSingleMotionModal(discord.ui.Modal):
@@ -927,6 +964,7 @@ class APSingleMotionModal(discord.ui.Modal):
         self.add_item(self.motion_input)
         self.add_item(self.infoslide_input)
 
+    @traced_interaction()
     async def callback(self, interaction: discord.Interaction):
         motion_text = self.motion_input.value.strip()
         infoslide_val = self.infoslide_input.value.strip() if self.infoslide_input.value else None
@@ -960,8 +998,9 @@ class VetoView(discord.ui.View):
         self.add_item(self.gov_btn)
         self.add_item(self.opp_btn)
 
+    @traced_interaction()
     async def _gov_callback(self, interaction: discord.Interaction):
-        if interaction.user not in self.debate_round.government.members:
+        if self.debate_round.get_role(interaction.user.id) != "gov":
             await interaction.response.send_message(
                 "Only Government members can submit the Gov veto.", ephemeral=True
             )
@@ -975,8 +1014,9 @@ class VetoView(discord.ui.View):
             VetoModal('gov', self.debate_round, self, self.rounds_cog)
         )
 
+    @traced_interaction()
     async def _opp_callback(self, interaction: discord.Interaction):
-        if interaction.user not in self.debate_round.opposition.members:
+        if self.debate_round.get_role(interaction.user.id) != "opp":
             await interaction.response.send_message(
                 "Only Opposition members can submit the Opp veto.", ephemeral=True
             )
@@ -1013,6 +1053,7 @@ class VetoModal(discord.ui.Modal):
             self.add_item(inp)
             self.rank_inputs.append(inp)
 
+    @traced_interaction()
     async def callback(self, interaction: discord.Interaction):
         # Parse ranks
         try:
@@ -1059,11 +1100,11 @@ class VetoModal(discord.ui.Modal):
             await self.veto_view.message.edit(view=self.veto_view)
         except Exception:
             pass
+        await self.rounds_cog.save_round(self.debate_round)
 
         # If both teams have now submitted, cancel timer and resolve
         if self.debate_round.gov_veto is not None and self.debate_round.opp_veto is not None:
-            if hasattr(self.debate_round, '_veto_task') and self.debate_round._veto_task:
-                self.debate_round._veto_task.cancel()
+            get_scheduler().cancel(("veto", self.debate_round.round_id))
             await self.rounds_cog.process_veto(self.debate_round, interaction.guild)
 
 
@@ -1098,6 +1139,7 @@ class CoinTossView(discord.ui.View):
         self.add_item(self.opp_tails)
 
     def _make_call_callback(self, team: str, call: str):
+        @traced_interaction()
         async def callback(interaction: discord.Interaction):
             gov_members = self.debate_round.government.members
             opp_members = self.debate_round.opposition.members
@@ -1214,6 +1256,7 @@ class ChairJudgeControlView(discord.ui.View):
 
     def _make_motion_button_callback(self, index: int):
         """Return a callback that opens APSingleMotionModal for the given motion index."""
+        @traced_interaction()
         async def callback(interaction: discord.Interaction):
             if interaction.user.id != self.chair_id:
                 await interaction.response.send_message(
@@ -1235,6 +1278,7 @@ class ChairJudgeControlView(discord.ui.View):
                 btn.style = discord.ButtonStyle.primary
         self._release_btn.disabled = not all(self.pending_motions)
 
+    @traced_interaction()
     async def _release_motions_callback(self, interaction: discord.Interaction):
         """Handle Release Motions button — commit motions to the round and start veto."""
         if interaction.user.id != self.chair_id:
@@ -1250,7 +1294,7 @@ class ChairJudgeControlView(discord.ui.View):
         self.show_prep_in_progress()
         duration = Config.PREP_TIME_AP
         end_timestamp = int(time.time()) + duration
-        debate_round._prep_end_timestamp = end_timestamp
+        debate_round.prep_end_timestamp = end_timestamp
 
         chair_embed = EmbedBuilder.create_chair_control_embed(debate_round)
         chair_embed.description += f"\n\nPrep ends <t:{end_timestamp}:R>"
@@ -1288,6 +1332,7 @@ class ChairJudgeControlView(discord.ui.View):
         btn.callback = self._start_prep_callback
         self.add_item(btn)
 
+    @traced_interaction()
     async def _enter_motion_callback(self, interaction: discord.Interaction):
         """Handle Enter Motion button click (1v1 only)."""
         if interaction.user.id != self.chair_id:
@@ -1297,6 +1342,7 @@ class ChairJudgeControlView(discord.ui.View):
             return
         await interaction.response.send_modal(MotionInputModal(self))
 
+    @traced_interaction()
     async def _start_prep_callback(self, interaction: discord.Interaction):
         """Handle Start Prep button click."""
         if interaction.user.id != self.chair_id:
@@ -1337,11 +1383,9 @@ class ChairJudgeControlView(discord.ui.View):
         # DM debaters with motion, side, and prep end time
         await self.rounds_cog.send_prep_dms(self.debate_round, end_timestamp)
 
-        # Start background prep timer
-        task = self.rounds_cog.bot.loop.create_task(
-            self.rounds_cog.run_prep_timer(interaction.guild, self.debate_round, text_channel, duration)
-        )
-        self.debate_round._prep_task = task
+        # Start prep timer
+        self.rounds_cog.start_prep_timer(interaction.guild, self.debate_round, text_channel, duration)
+        await self.rounds_cog.save_round(self.debate_round)
 
 
 class BPRankingView(discord.ui.View):
@@ -1373,6 +1417,7 @@ class BPRankingView(discord.ui.View):
         self.add_item(self.submit_btn)
 
     def _make_rank_callback(self, team_key: str, select: discord.ui.Select):
+        @traced_interaction()
         async def callback(interaction: discord.Interaction):
             val = int(interaction.data["values"][0])
             self.selections[team_key] = val
@@ -1382,6 +1427,7 @@ class BPRankingView(discord.ui.View):
             await interaction.response.edit_message(view=self)
         return callback
 
+    @traced_interaction()
     async def _submit_callback(self, interaction: discord.Interaction):
         if len(self.selections) < 4:
             await interaction.response.send_message("Please rank all four teams.", ephemeral=True)
@@ -1418,6 +1464,7 @@ class BPOGScoreModal(discord.ui.Modal):
             self.add_item(inp)
             self.inputs.append((inp, pos, member))
 
+    @traced_interaction()
     async def callback(self, interaction: discord.Interaction):
         scores = []
         for inp, pos, member in self.inputs:
@@ -1448,6 +1495,7 @@ class BPOOContinueView(discord.ui.View):
         self.draft = draft
 
     @discord.ui.button(label="Continue to OO Scores", style=discord.ButtonStyle.primary)
+    @traced_interaction()
     async def continue_button(self, button: discord.ui.Button, interaction: discord.Interaction):
         await interaction.response.send_modal(BPOOScoreModal(self.draft))
 
@@ -1473,6 +1521,7 @@ class BPOOScoreModal(discord.ui.Modal):
             self.add_item(inp)
             self.inputs.append((inp, pos, member))
 
+    @traced_interaction()
     async def callback(self, interaction: discord.Interaction):
         scores = []
         for inp, pos, member in self.inputs:
@@ -1503,6 +1552,7 @@ class BPCGContinueView(discord.ui.View):
         self.draft = draft
 
     @discord.ui.button(label="Continue to CG Scores", style=discord.ButtonStyle.primary)
+    @traced_interaction()
     async def continue_button(self, button: discord.ui.Button, interaction: discord.Interaction):
         await interaction.response.send_modal(BPCGScoreModal(self.draft))
 
@@ -1528,6 +1578,7 @@ class BPCGScoreModal(discord.ui.Modal):
             self.add_item(inp)
             self.inputs.append((inp, pos, member))
 
+    @traced_interaction()
     async def callback(self, interaction: discord.Interaction):
         scores = []
         for inp, pos, member in self.inputs:
@@ -1558,6 +1609,7 @@ class BPCOContinueView(discord.ui.View):
         self.draft = draft
 
     @discord.ui.button(label="Continue to CO Scores", style=discord.ButtonStyle.primary)
+    @traced_interaction()
     async def continue_button(self, button: discord.ui.Button, interaction: discord.Interaction):
         await interaction.response.send_modal(BPCOScoreModal(self.draft))
 
@@ -1583,6 +1635,7 @@ class BPCOScoreModal(discord.ui.Modal):
             self.add_item(inp)
             self.inputs.append((inp, pos, member))
 
+    @traced_interaction()
     async def callback(self, interaction: discord.Interaction):
         scores = []
         for inp, pos, member in self.inputs:
@@ -1629,6 +1682,8 @@ class Rounds(commands.Cog):
         self.bot = bot
         self._chair_views: dict = {}   # round_id → ChairJudgeControlView
         self._veto_views: dict = {}    # round_id → VetoView
+        self.channel_pool = RoundChannelPool()
+        self._restored = False
 
     async def cog_load(self):
         """Called when the cog is loaded."""
@@ -1636,7 +1691,23 @@ class Rounds(commands.Cog):
 
     @commands.Cog.listener()
     async def on_ready(self):
-        """Re-register persistent views after bot restart."""
+        """Fill the channel pool."""
+        guild = self.bot.get_guild(Config.GUILD_ID)
+        if guild:
+            await self.channel_pool.warm(guild)
+
+    @commands.Cog.listener()
+    async def on_database_ready(self):
+        """Restore the journaled live state (once per process), then re-register persistent views."""
+        guild = self.bot.get_guild(Config.GUILD_ID)
+        if guild and not self._restored:
+            self._restored = True
+            try:
+                await self._restore_live_state(guild)
+            except Exception as e:
+                logger.error(f"Error restoring live state: {e}", exc_info=True)
+            # With the live rounds known, clear out categories left behind by earlier runs
+            get_scheduler().schedule(("orphan_sweep", guild.id), 0, self._run_orphan_sweep, guild)
         await self._register_persistent_views()
 
     async def _register_persistent_views(self):
@@ -1644,13 +1715,158 @@ class Rounds(commands.Cog):
         matchmaking_cog = self.bot.get_cog("Matchmaking")
         if matchmaking_cog and hasattr(matchmaking_cog, 'active_rounds'):
             for round_id, debate_round in matchmaking_cog.active_rounds.items():
-                if debate_round.ballot is not None:
+                if debate_round.ballot is not None or debate_round.bp_ballot is not None:
                     view = PostBallotRoundCompleteView(self, round_id)
                 else:
                     view = SubmitBallotView(self, round_id)
                 self.bot.add_view(view)
                 logger.info(f"Re-registered persistent view for round {round_id}")
 
+    def _round_extra(self, debate_round: DebateRound) -> dict:
+        """The message ids and timer deadlines a restart needs to rebuild a round's controls."""
+        round_id = debate_round.round_id
+        extra = {}
+        chair_view = self._chair_views.get(round_id)
+        if chair_view and chair_view.message:
+            extra["chair_message_id"] = chair_view.message.id
+            extra["round_info_message_id"] = chair_view.round_info_message.id
+        veto_view = self._veto_views.get(round_id)
+        if veto_view and veto_view.message:
+            extra["veto_message_id"] = veto_view.message.id
+        # Deadlines as wall-clock time, so they still mean something in the next process
+        for kind in ("prep", "veto"):
+            remaining = get_scheduler().remaining((kind, round_id))
+            if remaining is not None:
+                extra[f"{kind}_ends_at"] = time.time() + remaining
+        return extra
+
+    @traced()
+    def _is_active(self, debate_round: DebateRound) -> bool:
+        """Whether debate_round is still the live round under its id (not torn down or replaced)."""
+        matchmaking_cog = self.bot.get_cog("Matchmaking")
+        return matchmaking_cog is not None and matchmaking_cog.active_rounds.get(debate_round.round_id) is debate_round
+
+    async def save_round(self, debate_round: DebateRound, pending: bool = False):
+        """Journal a round's current state. Failures are logged, never raised into the UI flow.
+
+        A started round is only journaled while it is active: views outlive
+        teardown (e.g. a late judge rating), and must not write it back.
+        """
+        if not pending and not self._is_active(debate_round):
+            return
+        try:
+            await save_live_round(
+                debate_round.round_id, round_state(debate_round, pending, self._round_extra(debate_round))
+            )
+        except Exception as e:
+            logger.error(f"Failed to journal round {debate_round.round_id}: {e}")
+
+    async def forget_round(self, round_id: int):
+        """Drop a finished or cancelled round from the journal."""
+        try:
+            await delete_live_round(round_id)
+        except Exception as e:
+            logger.error(f"Failed to remove round {round_id} from the journal: {e}")
+
+    async def _restore_live_state(self, guild: discord.Guild):
+        """Rehydrate queues, parties and rounds journaled by the previous process.
+
+        Rounds still awaiting confirmation are cancelled and their members
+        requeued; rounds whose members or category are gone are dropped.
+        Active rounds get their chair and veto controls re-attached and their
+        prep/veto timers rescheduled with whatever time they had left.
+        """
+        matchmaking_cog = self.bot.get_cog("Matchmaking")
+        if not matchmaking_cog:
+            return
+        started = time.monotonic()
+        state = await load_live_state()
+        queued = matchmaking_cog.restore_queues(state, guild.get_member)
+
+        edits, restored, requeued = [], 0, 0
+        for round_data in state["rounds"]:
+            round_id = round_data["round_id"]
+            matchmaking_cog.round_counter = max(matchmaking_cog.round_counter, round_id)
+            try:
+                debate_round = restore_round(round_data, guild.get_member)
+            except UnresolvedMember as e:
+                logger.warning(f"Dropping journaled round {round_id}: member {e} is no longer in the guild")
+                await self.forget_round(round_id)
+                continue
+            if round_data["pending"]:
+                matchmaking_cog.requeue_participants(debate_round)
+                await self.forget_round(round_id)
+                requeued += 1
+                continue
+            if not guild.get_channel(debate_round.category_id):
+                logger.warning(f"Dropping journaled round {round_id}: its category no longer exists")
+                await self.forget_round(round_id)
+                continue
+            matchmaking_cog.add_active_round(debate_round)
+            edits.extend(self._restore_round_controls(guild, debate_round, round_data["extra"]))
+            restored += 1
+
+        results = await gather_bounded(edits, Config.CHANNEL_CREATE_CONCURRENCY, return_exceptions=True)
+        for error in (r for r in results if isinstance(r, Exception)):
+            logger.warning(f"Could not re-attach a round control message: {error}")
+        logger.info(
+            f"Restored {restored} rounds, requeued {requeued} unconfirmed rounds and {queued} queued members "
+            f"in {(time.monotonic() - started) * 1000:.0f}ms"
+        )
+        await matchmaking_cog.update_lobby_display()
+
+    def _restore_round_controls(self, guild: discord.Guild, debate_round: DebateRound, extra: dict) -> list:
+        """Rebuild a restored round's chair/veto views and timers; returns the message edits to make."""
+        round_id = debate_round.round_id
+        text_channel = guild.get_channel(debate_round.channel_ids.get("text"))
+        judges_text = guild.get_channel(debate_round.channel_ids.get("judges_text"))
+        edits = []
+        now = time.time()
+
+        prep_started = debate_round.prep_channel_id is not None or bool(debate_round.motions)
+
+        if extra.get("chair_message_id") and text_channel and judges_text:
+            round_info_message = text_channel.get_partial_message(extra["round_info_message_id"])
+            chair_view = ChairJudgeControlView(self, debate_round, round_info_message)
+            chair_view.message = judges_text.get_partial_message(extra["chair_message_id"])
+            self._chair_views[round_id] = chair_view
+            if prep_started or debate_round.ballot or debate_round.bp_ballot:
+                chair_view.show_prep_in_progress()  # disabled; the message already shows it
+            elif debate_round.motion:
+                chair_view.show_start_prep()
+                edits.append(chair_view.message.edit(view=chair_view))
+            else:
+                if debate_round.format_label == "AP":
+                    chair_embed = EmbedBuilder.create_ap_motion_input_embed(chair_view.pending_motions)
+                else:
+                    chair_embed = EmbedBuilder.create_chair_control_embed(debate_round)
+                edits.append(chair_view.message.edit(embed=chair_embed, view=chair_view))
+
+        if extra.get("veto_message_id") and text_channel and debate_round.debated_motion_index is None:
+            veto_view = VetoView(debate_round, self)
+            if debate_round.gov_veto is not None:
+                veto_view.gov_btn.label = "Gov: Submitted ✓"
+                veto_view.gov_btn.disabled = True
+            if debate_round.opp_veto is not None:
+                veto_view.opp_btn.label = "Opp: Submitted ✓"
+                veto_view.opp_btn.disabled = True
+            veto_view.message = text_channel.get_partial_message(extra["veto_message_id"])
+            self._veto_views[round_id] = veto_view
+            edits.append(veto_view.message.edit(view=veto_view))
+            if debate_round.gov_veto is not None and debate_round.opp_veto is not None:
+                # Both rankings were in but the result (or coin toss) never went out
+                get_scheduler().schedule(("veto", round_id), 0, self.process_veto, debate_round, guild)
+            elif extra.get("veto_ends_at") is not None:
+                get_scheduler().schedule(
+                    ("veto", round_id), max(0.0, extra["veto_ends_at"] - now), self.run_veto_timer, debate_round, guild
+                )
+
+        prep_channel = guild.get_channel(debate_round.prep_channel_id) or text_channel
+        if extra.get("prep_ends_at") is not None and prep_channel:
+            self.start_prep_timer(guild, debate_round, prep_channel, max(0.0, extra["prep_ends_at"] - now))
+        return edits
+
+    @traced()
     async def send_participant_confirmation(
         self,
         channel: discord.TextChannel,
@@ -1672,6 +1888,7 @@ class Rounds(commands.Cog):
             view=view
         )
 
+    @traced()
     async def create_round_channels(
         self,
         guild: discord.Guild,
@@ -1728,114 +1945,57 @@ class Rounds(commands.Cog):
             category_overwrites[observer] = observer_perms
         debate_round.observers = round_observers
 
-        try:
-            category = await guild.create_category(
-                name=f"Round {round_id} - {round_label}",
-                overwrites=category_overwrites
-            )
-            debate_round.category_id = category.id
-
-            # Text channel (inherits from category)
-            text_channel = await category.create_text_channel(
-                name=f"round-{round_id}-text"
-            )
+        def team_overwrites(members: list) -> dict:
+            overwrites = {everyone_role: deny_all, guild.me: bot_perms}
+            for member in members:
+                overwrites[member] = allow_view_connect
+            return overwrites
+
+        # (channel_ids key, kind, name, overwrites); None inherits the category's.
+        # Listed in display order; BP gets 4 prep rooms (og/oo/cg/co), others 2 (gov/opp).
+        channel_specs = [
+            ("text", "text", f"round-{round_id}-text", None),
+            ("debate", "voice", f"round-{round_id}-debate", None),
+        ]
+        if debate_round.round_type == RoundType.BP:
+            channel_specs += [
+                ("gov_prep", "voice", f"round-{round_id}-og-prep", team_overwrites(gov_members)),
+                ("opp_prep", "voice", f"round-{round_id}-oo-prep", team_overwrites(opp_members)),
+                ("cg_prep", "voice", f"round-{round_id}-cg-prep", team_overwrites(debate_round.cg.members)),
+                ("co_prep", "voice", f"round-{round_id}-co-prep", team_overwrites(debate_round.co.members)),
+            ]
+        else:
+            channel_specs += [
+                ("gov_prep", "voice", f"round-{round_id}-gov-prep", team_overwrites(gov_members)),
+                ("opp_prep", "voice", f"round-{round_id}-opp-prep", team_overwrites(opp_members)),
+            ]
+        channel_specs += [
+            # Judge deliberation voice + judges-only text (chair controls, ballot button)
+            ("judges", "voice", f"round-{round_id}-judges", team_overwrites(judge_members)),
+            ("judges_text", "text", f"round-{round_id}-judges-text", team_overwrites(judge_members)),
+        ]
 
-            # Debate voice (inherits from category)
-            debate_vc = await category.create_voice_channel(
-                name=f"round-{round_id}-debate"
+        try:
+            category_name = f"Round {round_id} - {round_label}"
+            started = time.monotonic()
+            pooled = await self.channel_pool.acquire(
+                guild, layout_for(debate_round.round_type), category_name, category_overwrites, channel_specs
             )
-
-            # Prep voice channels — BP gets 4 (og/oo/cg/co), others get 2 (gov/opp)
-            if debate_round.round_type == RoundType.BP:
-                og_overwrites = {everyone_role: deny_all, guild.me: bot_perms}
-                for member in gov_members:
-                    og_overwrites[member] = allow_view_connect
-                gov_prep_vc = await category.create_voice_channel(
-                    name=f"round-{round_id}-og-prep",
-                    overwrites=og_overwrites
-                )
-
-                oo_overwrites = {everyone_role: deny_all, guild.me: bot_perms}
-                for member in opp_members:
-                    oo_overwrites[member] = allow_view_connect
-                opp_prep_vc = await category.create_voice_channel(
-                    name=f"round-{round_id}-oo-prep",
-                    overwrites=oo_overwrites
-                )
-
-                cg_overwrites = {everyone_role: deny_all, guild.me: bot_perms}
-                for member in debate_round.cg.members:
-                    cg_overwrites[member] = allow_view_connect
-                cg_prep_vc = await category.create_voice_channel(
-                    name=f"round-{round_id}-cg-prep",
-                    overwrites=cg_overwrites
-                )
-
-                co_overwrites = {everyone_role: deny_all, guild.me: bot_perms}
-                for member in debate_round.co.members:
-                    co_overwrites[member] = allow_view_connect
-                co_prep_vc = await category.create_voice_channel(
-                    name=f"round-{round_id}-co-prep",
-                    overwrites=co_overwrites
-                )
+            if pooled:
+                category, channels = pooled
             else:
-                # Gov prep voice (gov team only)
-                gov_overwrites = {everyone_role: deny_all, guild.me: bot_perms}
-                for member in gov_members:
-                    gov_overwrites[member] = allow_view_connect
-                gov_prep_vc = await category.create_voice_channel(
-                    name=f"round-{round_id}-gov-prep",
-                    overwrites=gov_overwrites
+                category, channels = await self._create_round_category(
+                    guild, category_name, category_overwrites, channel_specs
                 )
-
-                # Opp prep voice (opp team only)
-                opp_overwrites = {everyone_role: deny_all, guild.me: bot_perms}
-                for member in opp_members:
-                    opp_overwrites[member] = allow_view_connect
-                opp_prep_vc = await category.create_voice_channel(
-                    name=f"round-{round_id}-opp-prep",
-                    overwrites=opp_overwrites
-                )
-
-            # Judge deliberation voice (judges only)
-            judge_overwrites = {everyone_role: deny_all, guild.me: bot_perms}
-            for member in judge_members:
-                judge_overwrites[member] = allow_view_connect
-            judges_vc = await category.create_voice_channel(
-                name=f"round-{round_id}-judges",
-                overwrites=judge_overwrites
-            )
-
-            # Judges-only text channel (chair controls + ballot button hidden from debaters)
-            judge_text_overwrites = {everyone_role: deny_all, guild.me: bot_perms}
-            for member in judge_members:
-                judge_text_overwrites[member] = allow_view_connect
-            judges_text_channel = await category.create_text_channel(
-                name=f"round-{round_id}-judges-text",
-                overwrites=judge_text_overwrites
+            debate_round.category_id = category.id
+            debate_round.channel_ids = {key: channel.id for key, channel in channels.items()}
+            text_channel = channels["text"]
+            judges_text_channel = channels["judges_text"]
+            logger.info(
+                f"Round {round_id}: {len(channels)} channels ready in "
+                f"{(time.monotonic() - started) * 1000:.0f}ms ({'pooled' if pooled else 'created'})"
             )
 
-            if debate_round.round_type == RoundType.BP:
-                debate_round.channel_ids = {
-                    "text": text_channel.id,
-                    "debate": debate_vc.id,
-                    "gov_prep": gov_prep_vc.id,   # og-prep
-                    "opp_prep": opp_prep_vc.id,   # oo-prep
-                    "cg_prep": cg_prep_vc.id,
-                    "co_prep": co_prep_vc.id,
-                    "judges": judges_vc.id,
-                    "judges_text": judges_text_channel.id,
-                }
-            else:
-                debate_round.channel_ids = {
-                    "text": text_channel.id,
-                    "debate": debate_vc.id,
-                    "gov_prep": gov_prep_vc.id,
-                    "opp_prep": opp_prep_vc.id,
-                    "judges": judges_vc.id,
-                    "judges_text": judges_text_channel.id,
-                }
-
             # Track as active round
             matchmaking_cog.add_active_round(debate_round)
 
@@ -1860,6 +2020,7 @@ class Rounds(commands.Cog):
                 chair_embed = EmbedBuilder.create_chair_control_embed(debate_round)
             chair_view.message = await judges_text_channel.send(embed=chair_embed, view=chair_view)
             self._chair_views[debate_round.round_id] = chair_view
+            await self.save_round(debate_round)
 
             await self.send_round_confirmed_dms(debate_round)
             await self.move_to_prep_channels(guild, debate_round)
@@ -1885,6 +2046,7 @@ class Rounds(commands.Cog):
 
         except discord.Forbidden:
             logger.error("Bot lacks Manage Channels permission")
+            await self.forget_round(round_id)
             lobby_channel = self.bot.get_channel(Config.LOBBY_CHANNEL_ID)
             if lobby_channel:
                 await lobby_channel.send(
@@ -1896,56 +2058,103 @@ class Rounds(commands.Cog):
                 )
         except Exception as e:
             logger.error(f"Error creating round channels: {e}", exc_info=True)
+            if debate_round.category_id is None:
+                await self.forget_round(round_id)
+                lobby_channel = self.bot.get_channel(Config.LOBBY_CHANNEL_ID)
+                if lobby_channel:
+                    await lobby_channel.send(
+                        embed=EmbedBuilder.create_error_embed(
+                            "Channel Creation Failed",
+                            f"Round {round_id}'s channels could not be created and were removed. "
+                            "Please queue again."
+                        )
+                    )
+
+    @traced()
+    async def _create_round_category(self, guild: discord.Guild, category_name: str,
+                                     category_overwrites: dict, channel_specs: list):
+        """Create a round's category and channels; on failure, delete what was created and raise."""
+        category = await guild.create_category(name=category_name, overwrites=category_overwrites)
+
+        # Children are created concurrently; explicit positions keep their order
+        def create_child(kind: str, name: str, overwrites: Optional[dict], position: int):
+            kwargs = {"name": name, "position": position}
+            if overwrites is not None:
+                kwargs["overwrites"] = overwrites
+            if kind == "text":
+                return category.create_text_channel(**kwargs)
+            return category.create_voice_channel(**kwargs)
+
+        results = await gather_bounded(
+            [create_child(kind, name, overwrites, position)
+             for position, (_, kind, name, overwrites) in enumerate(channel_specs)],
+            Config.CHANNEL_CREATE_CONCURRENCY,
+            return_exceptions=True
+        )
+        failures = [r for r in results if isinstance(r, BaseException)]
+        if failures:
+            await self._roll_back_round_channels(
+                category, [r for r in results if not isinstance(r, BaseException)]
+            )
+            raise failures[0]
+        return category, {key: channel for (key, *_), channel in zip(channel_specs, results)}
+
+    async def _roll_back_round_channels(self, category: discord.CategoryChannel, channels: list):
+        """Delete whatever a failed create_round_channels managed to create."""
+        results = await gather_bounded(
+            [channel.delete() for channel in channels],
+            Config.CHANNEL_CREATE_CONCURRENCY,
+            return_exceptions=True
+        )
+        try:
+            await category.delete()
+        except Exception as e:
+            results.append(e)
+        errors = [r for r in results if isinstance(r, Exception)]
+        logger.warning(
+            f"Rolled back {category.name}: deleted {len(channels) - len(errors) + 1} channels"
+            + (f", {len(errors)} deletions failed" if errors else "")
+        )
 
+    @traced()
     async def move_to_prep_channels(self, guild: discord.Guild, debate_round: DebateRound):
         """Move all participants to their assigned prep/judge VCs."""
-        gov_prep_vc = guild.get_channel(debate_round.channel_ids["gov_prep"])
-        opp_prep_vc = guild.get_channel(debate_round.channel_ids["opp_prep"])
-        judges_vc = guild.get_channel(debate_round.channel_ids["judges"])
-
-        for member in debate_round.government.members:
-            try:
-                if member.voice:
-                    await member.move_to(gov_prep_vc)
-            except Exception:
-                pass
+        assignments = [
+            ("gov_prep", debate_round.government.members),
+            ("opp_prep", debate_round.opposition.members),
+        ]
+        if debate_round.round_type == RoundType.BP:
+            assignments += [("cg_prep", debate_round.cg.members), ("co_prep", debate_round.co.members)]
+        assignments.append(("judges", debate_round.judges.get_all_judges()))
 
-        for member in debate_round.opposition.members:
-            try:
-                if member.voice:
-                    await member.move_to(opp_prep_vc)
-            except Exception:
-                pass
+        moves = []
+        for key, members in assignments:
+            channel = guild.get_channel(debate_round.channel_ids[key])
+            if channel:
+                moves += [(member, channel) for member in members]
 
-        if debate_round.round_type == RoundType.BP:
-            cg_prep_vc = guild.get_channel(debate_round.channel_ids["cg_prep"])
-            co_prep_vc = guild.get_channel(debate_round.channel_ids["co_prep"])
-            for member in debate_round.cg.members:
-                try:
-                    if member.voice:
-                        await member.move_to(cg_prep_vc)
-                except Exception:
-                    pass
-            for member in debate_round.co.members:
-                try:
-                    if member.voice:
-                        await member.move_to(co_prep_vc)
-                except Exception:
-                    pass
+        failures = await move_members(moves)
+        await self._report_move_failures(guild.get_channel(debate_round.channel_ids["text"]), failures)
 
-        for member in debate_round.judges.get_all_judges():
-            try:
-                if member.voice:
-                    await member.move_to(judges_vc)
-            except Exception:
-                pass
+    async def _report_move_failures(self, text_channel: Optional[discord.TextChannel], failures: list):
+        """Tell the round's text channel who couldn't be moved, and why."""
+        if not failures or not text_channel:
+            return
+        embed = EmbedBuilder.create_voice_move_failures_embed(
+            [(member, channel, describe_move_error(error)) for member, channel, error in failures]
+        )
+        try:
+            await text_channel.send(embed=embed)
+        except Exception as e:
+            logger.error(f"Could not report voice move failures in {text_channel.name}: {e}")
 
     async def add_observer_to_round(self, debate_round: DebateRound, observer: discord.Member, guild: discord.Guild):
         """Dynamically grant an observer read/listen-only access to the text channel and debate VC."""
-        if observer in debate_round.observers or observer in debate_round.get_all_participants():
+        if observer in debate_round.observers or debate_round.get_role(observer.id):
             return
 
         debate_round.observers.append(observer)
+        await self.save_round(debate_round)
 
         observer_perms = discord.PermissionOverwrite(
             view_channel=True, connect=True,
@@ -1965,6 +2174,7 @@ class Rounds(commands.Cog):
                 except Exception:
                     pass
 
+    @traced()
     async def send_round_confirmed_dms(self, debate_round: DebateRound):
         """DM all participants (debaters + judges) with the debate room link."""
         text_channel_id = debate_round.channel_ids["text"]
@@ -1979,12 +2189,12 @@ class Rounds(commands.Cog):
             url=channel_url
         ))
 
-        for member in debate_round.get_all_participants():
-            try:
-                await member.send(embed=embed, view=view)
-            except discord.Forbidden:
-                pass
+        report = await get_dispatcher().send_many(
+            (member, {"embed": embed, "view": view}) for member in debate_round.get_all_participants()
+        )
+        logger.info(f"Round {debate_round.round_id} room DMs: {report.summary()}")
 
+    @traced()
     async def release_motions(self, debate_round: DebateRound, guild: discord.Guild, duration: int):
         """Post motions to text channel, create veto view, and start both timers (veto + prep)."""
         text_channel = guild.get_channel(debate_round.channel_ids['text'])
@@ -2010,21 +2220,15 @@ class Rounds(commands.Cog):
             except Exception:
                 pass
 
-        # Start 5-minute veto timer
-        task = self.bot.loop.create_task(self.run_veto_timer(debate_round, guild))
-        debate_round._veto_task = task
+        # Start 5-minute veto timer (cancelled once both teams submit)
+        get_scheduler().schedule(("veto", debate_round.round_id), 300, self.run_veto_timer, debate_round, guild)
 
         # Start 30-minute prep timer concurrently (veto resolves within this window)
-        task = self.bot.loop.create_task(self.run_prep_timer(guild, debate_round, text_channel, duration))
-        debate_round._prep_task = task
+        self.start_prep_timer(guild, debate_round, text_channel, duration)
+        await self.save_round(debate_round)
 
     async def run_veto_timer(self, debate_round: DebateRound, guild: discord.Guild):
-        """5-minute background task; auto-resolves veto if teams don't submit in time."""
-        try:
-            await asyncio.sleep(300)
-        except asyncio.CancelledError:
-            return  # Both teams submitted; process_veto already called
-
+        """Fires 5 minutes after motions release; auto-resolves veto if teams didn't submit in time."""
         import random
         text_channel = guild.get_channel(debate_round.channel_ids['text'])
 
@@ -2129,7 +2333,7 @@ class Rounds(commands.Cog):
                 pass
 
         # Post prep started embed and DM debaters now that the winning motion is known
-        end_ts = getattr(debate_round, '_prep_end_timestamp', None)
+        end_ts = debate_round.prep_end_timestamp
         if end_ts and text_channel:
             prep_embed = EmbedBuilder.create_prep_started_embed(debate_round, end_ts)
             await text_channel.send(embed=prep_embed)
@@ -2144,7 +2348,9 @@ class Rounds(commands.Cog):
                 await veto_view.message.edit(view=veto_view)
             except Exception:
                 pass
+        await self.save_round(debate_round)
 
+    @traced()
     async def send_prep_dms(self, debate_round: DebateRound, end_timestamp: int):
         """DM each debater with their side, the motion, and prep end time."""
         if debate_round.round_type == RoundType.BP:
@@ -2160,27 +2366,40 @@ class Rounds(commands.Cog):
                 (debate_round.opposition.members, "Opposition"),
             ]
 
-        for members, side in team_sides:
-            for member in members:
-                try:
-                    embed = EmbedBuilder.create_prep_dm_embed(debate_round, side, end_timestamp)
-                    await member.send(embed=embed)
-                except discord.Forbidden:
-                    pass
+        report = await get_dispatcher().send_many(
+            (member, {"embed": EmbedBuilder.create_prep_dm_embed(debate_round, side, end_timestamp)})
+            for members, side in team_sides
+            for member in members
+        )
+        logger.info(f"Round {debate_round.round_id} prep DMs: {report.summary()}")
+        await self._post_dm_report(debate_round, "Motion & Prep", report)
 
+    async def _post_dm_report(self, debate_round: DebateRound, subject: str, report):
+        """Let the judges know which participants a batch of DMs didn't reach."""
+        if not report.undelivered:
+            return
+        guild = self.bot.get_guild(Config.GUILD_ID)
+        judges_text = guild.get_channel(debate_round.channel_ids.get("judges_text")) if guild else None
+        if not judges_text:
+            return
+        try:
+            await judges_text.send(embed=EmbedBuilder.create_dm_delivery_report_embed(subject, report))
+        except Exception as e:
+            logger.error(f"Could not post DM report for round {debate_round.round_id}: {e}")
+
+    @traced()
     async def finalize_ballot(
         self,
         interaction: discord.Interaction,
         debate_round: DebateRound,
-        ballot: Ballot,
+        ballot: FinalizedBallot,
         ballot_view: SubmitBallotView
     ):
         """Finalize a ballot submission: store, DM judge, DM debaters, post in channel."""
         debate_round.ballot = ballot
 
-        # Cancel prep timer if still running
-        if hasattr(debate_round, '_prep_task') and debate_round._prep_task:
-            debate_round._prep_task.cancel()
+        # Cancel prep timer if still pending
+        self.cancel_prep_timer(debate_round)
 
         # Disable the Submit Ballot button
         ballot_view.clear_items()
@@ -2200,22 +2419,11 @@ class Rounds(commands.Cog):
             # We can't easily get the original message, so just post updates
             pass
 
-        # DM the judge with full ballot results
-        try:
-            ballot_embed = EmbedBuilder.create_ballot_results_embed(debate_round)
-            await ballot.judge.send(embed=ballot_embed)
-        except discord.Forbidden:
-            pass
-
-        # DM each debater with "ballot ready" + Rate Judge button
+        # DM the judge with full ballot results, and each debater "ballot ready" + Rate Judge button
         all_debaters = debate_round.government.members + debate_round.opposition.members
-        for debater in all_debaters:
-            try:
-                embed = EmbedBuilder.create_ballot_ready_dm_embed(debate_round)
-                rate_view = RateJudgeView(self, debate_round, debater)
-                rate_view.message = await debater.send(embed=embed, view=rate_view)
-            except discord.Forbidden:
-                pass
+        await self._send_ballot_dms(
+            debate_round, ballot.judge, EmbedBuilder.create_ballot_results_embed(debate_round), all_debaters
+        )
 
         # Post ballot submitted embed in text channel
         if text_channel:
@@ -2236,7 +2444,9 @@ class Rounds(commands.Cog):
             debate_round.db_round_id = await log_round(debate_round)
         except Exception as e:
             logger.error(f"Failed to log round {debate_round.round_id} to database: {e}")
+        await self.save_round(debate_round)
 
+    @traced()
     async def finalize_bp_ballot(
         self,
         interaction: discord.Interaction,
@@ -2247,9 +2457,8 @@ class Rounds(commands.Cog):
         """Finalize a BP ballot: store, DM chair, DM all debaters, post in channel."""
         debate_round.bp_ballot = bp_ballot
 
-        # Cancel prep timer if still running
-        if hasattr(debate_round, '_prep_task') and debate_round._prep_task:
-            debate_round._prep_task.cancel()
+        # Cancel prep timer if still pending
+        self.cancel_prep_timer(debate_round)
 
         # Disable the Submit Ballot button
         ballot_view.clear_items()
@@ -2263,23 +2472,12 @@ class Rounds(commands.Cog):
 
         text_channel = interaction.guild.get_channel(debate_round.channel_ids.get("text"))
 
-        # DM the chair with full ballot results
-        try:
-            ballot_embed = EmbedBuilder.create_bp_ballot_results_embed(debate_round)
-            await bp_ballot.judge.send(embed=ballot_embed)
-        except discord.Forbidden:
-            pass
-
-        # DM all debaters with "ballot ready" + Rate Judge button
+        # DM the chair with full ballot results, and all debaters "ballot ready" + Rate Judge button
         all_debaters = (list(debate_round.government.members) + list(debate_round.opposition.members)
                         + list(debate_round.cg.members) + list(debate_round.co.members))
-        for debater in all_debaters:
-            try:
-                embed = EmbedBuilder.create_ballot_ready_dm_embed(debate_round)
-                rate_view = RateJudgeView(self, debate_round, debater)
-                rate_view.message = await debater.send(embed=embed, view=rate_view)
-            except discord.Forbidden:
-                pass
+        await self._send_ballot_dms(
+            debate_round, bp_ballot.judge, EmbedBuilder.create_bp_ballot_results_embed(debate_round), all_debaters
+        )
 
         # Post ballot submitted embed in text channel
         if text_channel:
@@ -2299,7 +2497,21 @@ class Rounds(commands.Cog):
             debate_round.db_round_id = await log_round(debate_round)
         except Exception as e:
             logger.error(f"Failed to log BP round {debate_round.round_id} to database: {e}")
+        await self.save_round(debate_round)
+
+    async def _send_ballot_dms(self, debate_round: DebateRound, judge, results_embed: discord.Embed, debaters: list):
+        """DM the judge their ballot results and each debater a Rate Judge prompt, all at once."""
+        ready_embed = EmbedBuilder.create_ballot_ready_dm_embed(debate_round)
+        rate_views = {debater.id: RateJudgeView(self, debate_round, debater) for debater in debaters}
+        report = await get_dispatcher().send_many(
+            [(judge, {"embed": results_embed})]
+            + [(debater, {"embed": ready_embed, "view": rate_views[debater.id]}) for debater in debaters]
+        )
+        for debater_id, rate_view in rate_views.items():
+            rate_view.message = report.messages.get(debater_id)
+        logger.info(f"Round {debate_round.round_id} ballot DMs: {report.summary()}")
 
+    @traced()
     async def send_judge_ratings(self, debate_round: DebateRound):
         """Send aggregated debater ratings to the judge."""
         judge = debate_round.bp_ballot.judge if debate_round.bp_ballot else debate_round.ballot.judge
@@ -2318,38 +2530,60 @@ class Rounds(commands.Cog):
             except Exception as e:
                 logger.error(f"Failed to log judge ratings for round {debate_round.round_id}: {e}")
 
-    async def run_prep_timer(self, guild: discord.Guild, debate_round: DebateRound, text_channel: discord.TextChannel, duration: int):
-        """Run the prep timer and auto-move debaters when done."""
-        try:
-            await asyncio.sleep(duration)
-
-            # Auto-move debaters from prep VCs to debate VC
-            debate_vc = guild.get_channel(debate_round.channel_ids.get("debate"))
-            if debate_vc:
-                all_debaters = list(debate_round.government.members) + list(debate_round.opposition.members)
-                if debate_round.cg:
-                    all_debaters += list(debate_round.cg.members)
-                if debate_round.co:
-                    all_debaters += list(debate_round.co.members)
-                for member in all_debaters:
-                    try:
-                        if member.voice:
-                            await member.move_to(debate_vc)
-                    except Exception as e:
-                        logger.warning(f"Could not move {member.display_name}: {e}")
+    def start_prep_timer(self, guild: discord.Guild, debate_round: DebateRound,
+                         text_channel: discord.TextChannel, duration: int):
+        """Schedule the end of prep, replacing any prep timer already running for the round."""
+        debate_round.prep_channel_id = text_channel.id
+        get_scheduler().schedule(
+            ("prep", debate_round.round_id), duration, self.run_prep_timer, guild, debate_round, text_channel
+        )
 
-            # Post debate started embed
-            embed = EmbedBuilder.create_debate_started_embed(debate_round)
-            try:
-                await text_channel.send(embed=embed)
-            except:
-                pass
+    def cancel_prep_timer(self, debate_round: DebateRound):
+        if get_scheduler().cancel(("prep", debate_round.round_id)):
+            logger.info(f"Prep timer cancelled for round {debate_round.round_id}")
 
-            logger.info(f"Prep timer ended for round {debate_round.round_id}, debaters moved to debate VC")
+    def _prep_timer_current(self, debate_round: DebateRound) -> bool:
+        """Whether a prep timer that fired for this round still applies.
+
+        Cancelling only removes a pending timer, so a callback already running
+        when the round got its ballot, was torn down, or had prep restarted
+        checks this before acting.
+        """
+        return (
+            self._is_active(debate_round)
+            and debate_round.ballot is None and debate_round.bp_ballot is None
+            and get_scheduler().deadline(("prep", debate_round.round_id)) is None
+        )
 
-        except asyncio.CancelledError:
-            logger.info(f"Prep timer cancelled for round {debate_round.round_id}")
+    async def run_prep_timer(self, guild: discord.Guild, debate_round: DebateRound, text_channel: discord.TextChannel):
+        """Fires when prep ends: auto-move debaters to the debate VC."""
+        if not self._prep_timer_current(debate_round):
+            return
+        # Auto-move debaters from prep VCs to debate VC
+        debate_vc = guild.get_channel(debate_round.channel_ids.get("debate"))
+        if debate_vc:
+            all_debaters = list(debate_round.government.members) + list(debate_round.opposition.members)
+            if debate_round.cg:
+                all_debaters += list(debate_round.cg.members)
+            if debate_round.co:
+                all_debaters += list(debate_round.co.members)
+            failures = await move_members((member, debate_vc) for member in all_debaters)
+            await self._report_move_failures(text_channel, failures)
+
+        # The moves take a while; don't announce a round that was cancelled meanwhile
+        if not self._prep_timer_current(debate_round):
+            return
+
+        # Post debate started embed
+        embed = EmbedBuilder.create_debate_started_embed(debate_round)
+        try:
+            await text_channel.send(embed=embed)
+        except:
+            pass
+
+        logger.info(f"Prep timer ended for round {debate_round.round_id}, debaters moved to debate VC")
 
+    @traced()
     async def delete_round_channels(self, guild: discord.Guild, round_id: int):
         """Delete all channels and category for a round."""
         matchmaking_cog = self.bot.get_cog("Matchmaking")
@@ -2362,23 +2596,77 @@ class Rounds(commands.Cog):
         # Fallback: search by name if category reference is lost
         if not category:
             for cat in guild.categories:
-                if cat.name.startswith(f"Round {round_id} -"):
+                if cat.name.startswith(f"Round {round_id} -") and not self.channel_pool.is_idle(cat.id):
                     category = cat
                     break
 
+        if category and debate_round and debate_round.channel_ids:
+            if await self.channel_pool.release(
+                guild, layout_for(debate_round.round_type), category, debate_round.channel_ids
+            ):
+                logger.info(f"Returned round {round_id}'s channels to the pool")
+                return
+
         if category:
-            for channel in category.channels:
-                try:
-                    await channel.delete(reason=f"Round {round_id} complete")
-                except Exception as e:
-                    logger.error(f"Error deleting channel {channel.name}: {e}")
+            deleted, errors = await self._delete_categories([category], f"Round {round_id} complete")
+            for error in errors:
+                logger.error(f"Error deleting a channel of round {round_id}: {error}")
+            logger.info(f"Deleted channels for round {round_id} ({deleted} deleted, {len(errors)} failed)")
+
+    async def _delete_categories(self, categories: list, reason: str) -> tuple:
+        """Delete categories with their channels: every child concurrently, then the categories.
+
+        Returns (number deleted, exceptions for the deletions that failed).
+        """
+        children = [channel for category in categories for channel in category.channels]
+        results = await gather_bounded(
+            [channel.delete(reason=reason) for channel in children],
+            Config.CHANNEL_DELETE_CONCURRENCY, return_exceptions=True
+        )
+        results += await gather_bounded(
+            [category.delete(reason=reason) for category in categories],
+            Config.CHANNEL_DELETE_CONCURRENCY, return_exceptions=True
+        )
+        errors = [r for r in results if isinstance(r, Exception)]
+        return len(results) - len(errors), errors
 
-            try:
-                await category.delete(reason=f"Round {round_id} complete")
-            except Exception as e:
-                logger.error(f"Error deleting category: {e}")
+    def find_orphan_categories(self, guild: discord.Guild) -> list:
+        """Round categories with no live (active or pending) round, older than ORPHAN_CATEGORY_TTL.
 
-            logger.info(f"Deleted channels for round {round_id}")
+        Idle pooled categories keep their last round's name, so they're skipped.
+        """
+        matchmaking_cog = self.bot.get_cog("Matchmaking")
+        if not matchmaking_cog:
+            return []
+        live = set(matchmaking_cog.active_rounds) | set(matchmaking_cog.pending_rounds)
+        cutoff = discord.utils.utcnow() - timedelta(seconds=Config.ORPHAN_CATEGORY_TTL)
+        orphans = []
+        for category in guild.categories:
+            match = ROUND_CATEGORY_RE.match(category.name)
+            if (match and int(match.group(1)) not in live and category.created_at < cutoff
+                    and not self.channel_pool.is_idle(category.id)):
+                orphans.append(category)
+        return orphans
+
+    async def sweep_orphan_categories(self, guild: discord.Guild) -> int:
+        """Delete round categories left behind by a crash or a dropped round; returns how many."""
+        orphans = self.find_orphan_categories(guild)
+        if not orphans:
+            return 0
+        deleted, errors = await self._delete_categories(orphans, "Orphaned round category")
+        logger.info(
+            f"Swept {len(orphans)} orphaned round categories: {deleted} channels and categories deleted"
+            + (f", {len(errors)} deletions failed" if errors else "")
+        )
+        return len(orphans)
+
+    async def _run_orphan_sweep(self, guild: discord.Guild):
+        """Sweep now, then again every ORPHAN_SWEEP_INTERVAL."""
+        try:
+            await self.sweep_orphan_categories(guild)
+        except Exception as e:
+            logger.error(f"Error sweeping orphaned round categories: {e}", exc_info=True)
+        get_scheduler().schedule(("orphan_sweep", guild.id), Config.ORPHAN_SWEEP_INTERVAL, self._run_orphan_sweep, guild)
 
     def _get_round_label(self, debate_round: DebateRound) -> str:
         """Generate a human-readable label for the round type."""
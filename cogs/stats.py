@@ -3,7 +3,7 @@ from discord.ext import commands
 import logging
 
 from config import Config
-from utils.database import get_participant_stats
+from utils.database import get_participant_stats, rebuild_participant_stats, rebuild_ratings
 from utils.embeds import EmbedBuilder
 
 logger = logging.getLogger('DebateBot.Stats')
@@ -42,6 +42,44 @@ class Stats(commands.Cog):
         embed = EmbedBuilder.create_stats_embed(member, stats)
         await ctx.respond(embed=embed, ephemeral=True)
 
+    @discord.slash_command(
+        name="rebuildstats",
+        description="Recompute everyone's stats from the round history (Admin only)",
+        guild_ids=[Config.GUILD_ID] if Config.GUILD_ID else None
+    )
+    @commands.has_permissions(administrator=True)
+    async def rebuild_stats(self, ctx: discord.ApplicationContext):
+        """Rebuild the participant_stats summary table from scratch."""
+        await ctx.defer(ephemeral=True)
+        count = await rebuild_participant_stats()
+        logger.info(f"{ctx.author} rebuilt participant stats ({count} participants)")
+        await ctx.respond(
+            embed=EmbedBuilder.create_success_embed(
+                "Stats Rebuilt",
+                f"Recomputed stats for {count} participants."
+            ),
+            ephemeral=True
+        )
+
+    @discord.slash_command(
+        name="rebuildratings",
+        description="Replay the round history to recompute everyone's Elo (Admin only)",
+        guild_ids=[Config.GUILD_ID] if Config.GUILD_ID else None
+    )
+    @commands.has_permissions(administrator=True)
+    async def rebuild_ratings(self, ctx: discord.ApplicationContext):
+        """Reset all Elo ratings and replay every logged round."""
+        await ctx.defer(ephemeral=True)
+        rated = await rebuild_ratings()
+        logger.info(f"{ctx.author} rebuilt Elo ratings ({rated} rounds replayed)")
+        await ctx.respond(
+            embed=EmbedBuilder.create_success_embed(
+                "Ratings Rebuilt",
+                f"Replayed {rated} rounds to recompute Elo ratings."
+            ),
+            ephemeral=True
+        )
+
 
 def setup(bot):
     bot.add_cog(Stats(bot))
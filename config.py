@@ -47,6 +47,62 @@ class Config:
 
     JUDGE_ROLES = ["Chair", "Panelist"]
 
+    # Ratings (Elo)
+    ELO_DEFAULT = 1000.0
+    ELO_K_FACTOR = 32
+
+    # Queued members are removed after this long without a match (seconds)
+    QUEUE_TIMEOUT = 15 * 60
+
+    # Max time the team allocator may spend searching for the most balanced split (seconds)
+    ALLOCATION_TIME_BUDGET = 0.05
+
+    # Most rounds a single draw may start per format
+    MAX_ROUNDS_PER_DRAW = 8
+
+    # Round channels created at once (py-cord still handles any 429s per route)
+    CHANNEL_CREATE_CONCURRENCY = 4
+
+    # Round teardown: channel deletions in flight at once. Orphaned "Round N - ..." categories
+    # (no live round, older than the TTL) are swept at startup and then every interval (seconds)
+    CHANNEL_DELETE_CONCURRENCY = 4
+    ORPHAN_CATEGORY_TTL = 600
+    ORPHAN_SWEEP_INTERVAL = 1800
+
+    # Idle, hidden round categories kept ready per format (0 disables the pool for it).
+    # 1v1 and AP rounds share the same channel layout, so their sizes add up.
+    CHANNEL_POOL_SIZES = {"1v1": 0, "AP": 2, "BP": 1}
+    # A pooled category's renames may sit behind a long rename rate limit; past this many
+    # seconds the round gets freshly created channels instead
+    CHANNEL_POOL_ACQUIRE_TIMEOUT = 5.0
+
+    # Voice moves in flight at once, and how 429s / server errors are retried
+    VOICE_MOVE_CONCURRENCY = 5
+    VOICE_MOVE_RETRIES = 3
+    VOICE_MOVE_BACKOFF = 0.5  # seconds, doubled per attempt
+
+    # DMs in flight at once (across all batches), retries, and how long to skip users with DMs closed
+    DM_WORKERS = 8
+    DM_RETRIES = 3
+    DM_BACKOFF = 1.0  # seconds, doubled per attempt
+    DM_CLOSED_TTL = 3600  # seconds
+
+    # Lobby embed edits are coalesced into at most one per interval (seconds)
+    LOBBY_RENDER_INTERVAL = 1.0
+
+    # Local Prometheus endpoint (GET /metrics, see utils/metrics.py); port 0 leaves it off
+    METRICS_HOST = os.getenv("METRICS_HOST", "127.0.0.1")
+    METRICS_PORT = int(os.getenv("METRICS_PORT", 0))
+
+    # Interactions slower than this are logged with their span tree (seconds; see utils/tracing.py),
+    # and spans past the cap are counted instead of recorded
+    TRACE_SLOW_THRESHOLD = float(os.getenv("TRACE_SLOW_MS", 1000)) / 1000
+    TRACE_MAX_SPANS = 500
+
+    # Timer wheel for queue/prep/veto timers: tick resolution (seconds) and slot count
+    TIMER_TICK = 1.0
+    TIMER_SLOTS = 1024
+
     @classmethod
     def validate(cls):
         """Validate required configuration."""
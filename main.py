@@ -1,10 +1,13 @@
 import discord
 from discord.ext import commands
 import sys
+import time
 import traceback
 import logging
 
 from config import Config
+from utils import tracing
+from utils.metrics import COMMAND_ERRORS, COMMAND_SECONDS, instrument_http, start_metrics_server
 
 # Set up logging
 logging.basicConfig(
@@ -36,6 +39,9 @@ class DebateBot(discord.Bot):
 
         self.cogs_loaded = False
         self.commands_cleared = False  # Flag to ensure we only clear commands once
+        self.metrics_runner = None     # the /metrics server, when Config.METRICS_PORT is set
+        instrument_http(self.http)
+        tracing.instrument_http(self.http)
 
         logger.info("Bot __init__ complete. Loading cogs...")
         for extension in self.initial_extensions:
@@ -86,9 +92,17 @@ class DebateBot(discord.Bot):
             except Exception as e:
                 logger.error(f"Error syncing commands: {e}", exc_info=True)
 
-        # Initialize database
+        if Config.METRICS_PORT and self.metrics_runner is None:
+            try:
+                self.metrics_runner = await start_metrics_server()
+            except OSError as e:
+                logger.error(f"Could not start the metrics endpoint: {e}")
+
+        # Initialize database (opens the shared connection pool)
         from utils.database import init_db
         await init_db()
+        # Cogs restore their journaled state once the schema is known to be current
+        self.dispatch("database_ready")
 
         logger.info("Bot is ready! Waiting for commands...")
 
@@ -100,8 +114,18 @@ class DebateBot(discord.Bot):
             )
         )
 
+    async def invoke_application_command(self, ctx: discord.ApplicationContext):
+        """Run a slash command in its own trace, timing it by name for /metrics."""
+        started = time.perf_counter()
+        try:
+            with tracing.trace(f"/{ctx.command.qualified_name}", user=ctx.author.id):
+                await super().invoke_application_command(ctx)
+        finally:
+            COMMAND_SECONDS.labels(ctx.command.qualified_name).observe(time.perf_counter() - started)
+
     async def on_application_command_error(self, ctx: discord.ApplicationContext, error: discord.DiscordException):
         """Handle application command errors."""
+        COMMAND_ERRORS.labels(ctx.command.qualified_name if ctx.command else "unknown").inc()
         if isinstance(error, commands.MissingPermissions):
             await ctx.respond(
                 "❌ You don't have permission to use this command.",
@@ -133,6 +157,18 @@ class DebateBot(discord.Bot):
         """Called when bot connects to Discord."""
         logger.info("on_connect called - relying on automatic command sync")
 
+    async def close(self):
+        """Close the database pool (and the metrics endpoint) before shutting down the gateway connection."""
+        from utils.database import close_db
+        if self.metrics_runner is not None:
+            await self.metrics_runner.cleanup()
+            self.metrics_runner = None
+        try:
+            await close_db()
+        except Exception as e:
+            logger.error(f"Error closing database: {e}")
+        await super().close()
+
 
 def main():
     """Main entry point for the bot."""
@@ -0,0 +1,61 @@
+"""Allocation tests: unit selection, packing and Elo-balanced teams (utils/allocation.py)."""
+import sys
+
+sys.path.insert(0, '.')
+
+from utils.allocation import _can_pack, balance_teams, select_units, split_judges
+
+
+def _members(*names) -> list:
+    return [[name] for name in names]
+
+
+def _team_members(teams: list) -> list:
+    return [[member for unit in team for member in unit] for team in teams]
+
+
+def test_party_stays_on_one_team():
+    party = ["p1", "p2", "p3"]
+    units = [party] + _members("a", "b", "c")
+    ratings = {"p1": 1600, "p2": 1600, "p3": 1600, "a": 1400, "b": 1400, "c": 1400}
+    teams = balance_teams(units, [3, 3], ratings.get)
+    assert teams is not None
+    assert party in teams[0] or party in teams[1]
+    assert sorted(len(team) for team in _team_members(teams)) == [3, 3]
+
+
+def test_select_units_skips_a_party_that_does_not_fit():
+    # Teams of 2 can't seat a party of 3; it stays queued and the pair behind it is taken
+    units = _members("a", "b") + [["p1", "p2", "p3"]] + [["q1", "q2"]]
+    selected = select_units(units, [2, 2])
+    assert selected == [["a"], ["b"], ["q1", "q2"]]
+
+
+def test_balance_teams_minimizes_rating_gap():
+    ratings = {"a": 1800, "b": 1200, "c": 1500, "d": 1500}
+    teams = balance_teams(_members("a", "b", "c", "d"), [2, 2], ratings.get)
+    assert sorted(sorted(team) for team in _team_members(teams)) == [["a", "b"], ["c", "d"]]
+
+
+def test_time_budget_still_returns_a_valid_allocation():
+    # 24 debaters into four teams of 6 is far more than the 256 nodes between budget checks
+    names = [f"d{i}" for i in range(24)]
+    ratings = {name: 1000 + 37 * i for i, name in enumerate(names)}
+    teams = balance_teams(_members(*names), [6, 6, 6, 6], ratings.get, time_budget=0)
+    assert teams is not None
+    members = _team_members(teams)
+    assert [len(team) for team in members] == [6, 6, 6, 6]
+    assert sorted(m for team in members for m in team) == sorted(names)
+
+
+def test_impossible_pack_returns_none():
+    assert not _can_pack([3, 3], [2, 2, 2])
+    assert _can_pack([2, 1, 1], [2, 2])
+    assert balance_teams([["p1", "p2", "p3"], ["a"]], [2, 2], lambda member: 1500) is None
+    assert select_units([["p1", "p2", "p3"], ["q1", "q2", "q3"]], [2, 2]) is None
+
+
+def test_split_judges_gives_each_round_a_chair():
+    panels = split_judges(["j1", "j2", "j3", "j4", "j5"], 2)
+    assert [len(panel) for panel in panels] in ([3, 2], [2, 3])
+    assert sorted(j for panel in panels for j in panel) == ["j1", "j2", "j3", "j4", "j5"]
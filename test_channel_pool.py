@@ -0,0 +1,65 @@
+"""Round channel pool tests on the offline fake Discord (utils/channel_pool.py)."""
+import asyncio
+import sys
+import time
+
+sys.path.insert(0, '.')
+
+from benchmarks.fake_discord import FakeAPI, FakeGuild
+from config import Config
+from utils.channel_pool import LAYOUTS, POOL_CATEGORY_NAME, RoundChannelPool
+
+
+def _specs(round_id: int) -> list:
+    return [(key, kind, f"round-{round_id}-{key}", None) for key, kind in LAYOUTS["AP"]]
+
+
+async def _warm_pool(api: FakeAPI):
+    guild = FakeGuild(api)
+    pool = RoundChannelPool(sizes={"AP": 2})
+    await pool.warm(guild)
+    # No background refills: the test controls what's idle
+    pool._refill_later = lambda guild, layout: None
+    return guild, pool
+
+
+def test_idle_categories_are_reused_oldest_first_without_renaming_on_release():
+    async def main():
+        guild, pool = await _warm_pool(FakeAPI(latency=0))
+        first, second = (category for category, _ in pool._idle["AP"])
+
+        category, channels = await pool.acquire(guild, "AP", "Round 1 - Standard", {}, _specs(1))
+        assert category is first and category.name == "Round 1 - Standard"
+        api_renames = guild.api.calls["edit_channel"]
+        released = await pool.release(guild, "AP", category, {key: c.id for key, c in channels.items()})
+        assert released and pool.is_idle(first.id)
+        # Permissions are reset in place; nothing is renamed back
+        assert first.name == "Round 1 - Standard"
+        assert guild.api.calls["edit_channel"] - api_renames == 1 + sum(kind == "voice" for _, kind in LAYOUTS["AP"])
+
+        category, _ = await pool.acquire(guild, "AP", "Round 2 - Standard", {}, _specs(2))
+        assert category is second
+        assert second.name == "Round 2 - Standard" and first.name != POOL_CATEGORY_NAME
+
+    asyncio.run(main())
+
+
+def test_slow_acquire_falls_back_to_creating(monkeypatch):
+    monkeypatch.setattr(Config, "CHANNEL_POOL_ACQUIRE_TIMEOUT", 0.05)
+
+    async def main():
+        api = FakeAPI(latency=0)
+        guild, pool = await _warm_pool(api)
+        taken, _ = pool._idle["AP"][0]
+        api.latency = 1.0  # every rename now waits out a long rate limit
+
+        started = time.perf_counter()
+        assert await pool.acquire(guild, "AP", "Round 1 - Standard", {}, _specs(1)) is None
+        assert time.perf_counter() - started < 0.5
+        assert not pool.is_idle(taken.id) and pool.idle_count("AP") == 1
+        # The half-renamed category is deleted in the background
+        api.latency = 0
+        await asyncio.gather(*pool._tasks)
+        assert guild.get_channel(taken.id) is None
+
+    asyncio.run(main())
@@ -0,0 +1,85 @@
+"""Coalescing renderer tests (utils/debounce.py), on a short window."""
+import asyncio
+import sys
+
+import discord
+
+sys.path.insert(0, '.')
+
+from benchmarks.fake_discord import http_error
+from utils.debounce import DebouncedRenderer
+
+WINDOW = 0.02
+
+
+class _Lobby:
+    """A render function over mutable state, and a publish that records (or fails)."""
+
+    def __init__(self):
+        self.count = 0
+        self.renders = 0
+        self.published: list = []
+        self.fail_next = False
+
+    def render(self) -> discord.Embed:
+        self.renders += 1
+        return discord.Embed(title="Lobby", description=f"{self.count} queued")
+
+    async def publish(self, embed: discord.Embed):
+        if self.fail_next:
+            self.fail_next = False
+            raise http_error(500, "edit failed")
+        self.published.append(embed.description)
+
+
+def test_marks_within_a_window_publish_once():
+    async def main():
+        lobby = _Lobby()
+        renderer = DebouncedRenderer(lobby.render, lobby.publish, WINDOW)
+        for _ in range(10):
+            lobby.count += 1
+            renderer.mark_dirty()
+        await asyncio.sleep(WINDOW * 3)
+        assert lobby.published == ["10 queued"]
+        assert lobby.renders == 1 and renderer.published == 1
+
+    asyncio.run(main())
+
+
+def test_identical_embed_is_skipped():
+    async def main():
+        lobby = _Lobby()
+        renderer = DebouncedRenderer(lobby.render, lobby.publish, WINDOW)
+        renderer.mark_published(lobby.render())
+        renderer.mark_dirty()
+        await asyncio.sleep(WINDOW * 3)
+        assert lobby.published == [] and renderer.skipped == 1
+
+        lobby.count = 1
+        renderer.mark_dirty()
+        await asyncio.sleep(WINDOW * 3)
+        renderer.mark_dirty()
+        await asyncio.sleep(WINDOW * 3)
+        assert lobby.published == ["1 queued"]
+        assert renderer.published == 1 and renderer.skipped == 2
+
+    asyncio.run(main())
+
+
+def test_failed_publish_is_retried_on_the_next_render():
+    async def main():
+        lobby = _Lobby()
+        renderer = DebouncedRenderer(lobby.render, lobby.publish, WINDOW)
+        lobby.count, lobby.fail_next = 3, True
+        renderer.mark_dirty()
+        await asyncio.sleep(WINDOW * 3)
+        assert lobby.published == [] and renderer.published == 0
+        assert renderer._last_digest is None
+
+        # Same content as the failed edit: it must not be skipped as already published
+        renderer.mark_dirty()
+        await asyncio.sleep(WINDOW * 3)
+        assert lobby.published == ["3 queued"]
+        assert renderer.published == 1 and renderer.skipped == 0
+
+    asyncio.run(main())
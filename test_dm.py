@@ -0,0 +1,122 @@
+"""DM dispatcher tests (utils/dm.py) on the offline fake Discord, with errors injected per route."""
+import asyncio
+import sys
+
+sys.path.insert(0, '.')
+
+from benchmarks.fake_discord import FakeAPI, FakeGuild, http_error
+from utils.dm import DMDispatcher
+
+
+def _dispatcher(**kwargs) -> DMDispatcher:
+    return DMDispatcher(**{"workers": 4, "retries": 2, "backoff": 0.001, "closed_ttl": 60, **kwargs})
+
+
+def test_closed_dms_are_cached_and_skipped():
+    async def main():
+        api = FakeAPI(latency=0)
+        member = FakeGuild(api).add_member("closed")
+        dispatcher = _dispatcher()
+
+        api.fail("send_message", http_error(403, "Cannot send messages to this user"))
+        report = await dispatcher.send_many([(member, {"content": "hi"})])
+        assert report.closed == [member] and not report.delivered and not report.failed
+        assert dispatcher.is_closed(member.id)
+        assert api.calls["send_message"] == 1  # Forbidden isn't retried
+
+        # The next batch skips them without a call
+        assert await dispatcher.send(member, content="again") is None
+        assert api.calls["send_message"] == 1
+
+        # Until the cache forgets them
+        dispatcher.forget_closed(member.id)
+        assert await dispatcher.send(member, content="open now") is not None
+        assert api.calls["send_message"] == 2
+
+    asyncio.run(main())
+
+
+def test_closed_cache_expires():
+    async def main():
+        api = FakeAPI(latency=0)
+        member = FakeGuild(api).add_member("closed")
+        dispatcher = _dispatcher(closed_ttl=0.01)
+        api.fail("send_message", http_error(403))
+        await dispatcher.send(member, content="hi")
+        assert dispatcher.is_closed(member.id)
+        await asyncio.sleep(0.02)
+        assert not dispatcher.is_closed(member.id)
+
+    asyncio.run(main())
+
+
+def test_report_accounts_for_every_user():
+    async def main():
+        api = FakeAPI(latency=0)
+        guild = FakeGuild(api)
+        retried, missing, fine = (guild.add_member(name) for name in ("retried", "missing", "fine"))
+        dispatcher = _dispatcher(workers=1)
+
+        # With one worker the sends go out in batch order: a 503 then a retry, a 404, then fine
+        api.fail("send_message", http_error(503), http_error(404))
+        report = await dispatcher.send_many([
+            (retried, {"content": "a"}), (missing, {"content": "b"}), (fine, {"content": "c"}),
+            (retried, {"content": "duplicate"}),
+        ])
+        assert report.delivered == [retried, fine]
+        assert set(report.messages) == {retried.id, fine.id}
+        assert [(user, error.status) for user, error in report.failed] == [(missing, 404)]
+        assert report.undelivered == [missing]
+        assert report.summary() == "2 delivered, 0 closed, 1 failed"
+        # The duplicate isn't sent; the 503 costs one extra call
+        assert [m.content for m in retried.dm_channel.messages] == ["a"]
+        assert api.calls["send_message"] == 4
+
+    asyncio.run(main())
+
+
+def test_retryable_errors_give_up_after_the_retry_limit():
+    async def main():
+        api = FakeAPI(latency=0)
+        member = FakeGuild(api).add_member("unlucky")
+        dispatcher = _dispatcher(retries=2)
+        api.fail("send_message", *(http_error(500) for _ in range(3)))
+        report = await dispatcher.send_many([(member, {"content": "hi"})])
+        assert [(user, error.status) for user, error in report.failed] == [(member, 500)]
+        assert api.calls["send_message"] == 3
+        assert not dispatcher.is_closed(member.id)
+
+    asyncio.run(main())
+
+
+def test_workers_bound_sends_across_batches():
+    async def main():
+        api = FakeAPI(latency=0.01)
+        guild = FakeGuild(api)
+        members = [guild.add_member(f"member{i}") for i in range(12)]
+        dispatcher = _dispatcher(workers=3)
+        in_flight = peak = 0
+
+        def track(member):
+            send = member.send
+
+            async def tracked(*args, **kwargs):
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                try:
+                    return await send(*args, **kwargs)
+                finally:
+                    in_flight -= 1
+            member.send = tracked
+
+        for member in members:
+            track(member)
+        reports = await asyncio.gather(
+            dispatcher.send_many([(m, {"content": "x"}) for m in members[:6]]),
+            dispatcher.send_many([(m, {"content": "y"}) for m in members[6:]]),
+        )
+        assert peak == 3
+        assert sum(len(report.delivered) for report in reports) == 12
+
+    asyncio.run(main())
@@ -0,0 +1,99 @@
+"""Matchmaking cog tests against the offline fake Discord (benchmarks/fake_discord.py)."""
+import asyncio
+import sys
+
+sys.path.insert(0, '.')
+
+from benchmarks.fake_discord import FakeAPI, FakeBot, FakeContext, FakeGuild
+from cogs.matchmaking import Matchmaking, _queue_timeout_text
+from config import Config
+from utils import database, scheduler
+from utils.allocation import split_judges
+
+
+def _cog():
+    api = FakeAPI(latency=0)
+    guild = FakeGuild(api)
+    return guild, Matchmaking(FakeBot(guild, guild.add_text_channel("lobby")))
+
+
+def test_draw_backs_off_when_the_queue_empties_while_ratings_load():
+    guild, cog = _cog()
+    debaters = [guild.add_member(f"debater{i}") for i in range(2)]
+    for member in debaters:
+        cog.queue_1v1.add_debater(member)
+    cog.queue_1v1.add_judge(guild.add_member("judge"))
+
+    async def fetch_ratings(members):
+        # A /leave lands during the await; it doesn't take the formation lock
+        cog.queue_1v1.remove_user(debaters[0])
+        return {}
+
+    cog._fetch_ratings = fetch_ratings
+    assert asyncio.run(cog._form_rounds("1v1", cog.queue_1v1)) == []
+    assert not cog.pending_rounds
+    assert cog.queue_1v1.debater_count() == 1 and cog.queue_1v1.judge_count() == 1
+
+
+def test_split_judges_without_rounds():
+    assert split_judges(["j1"], 0) == []
+
+
+def test_queue_timeout_text_follows_config(monkeypatch):
+    monkeypatch.setattr(Config, "QUEUE_TIMEOUT", 15 * 60)
+    assert _queue_timeout_text() == "15 minutes"
+    monkeypatch.setattr(Config, "QUEUE_TIMEOUT", 60)
+    assert _queue_timeout_text() == "1 minute"
+    monkeypatch.setattr(Config, "QUEUE_TIMEOUT", 90)
+    assert _queue_timeout_text() == "1.5 minutes"
+
+
+def _assert_index_matches_queues(cog):
+    queued = {}
+    for queue in (cog.queue_1v1, cog.queue_ap, cog.queue_bp):
+        for member in queue.debaters + queue.judges:
+            assert member.id not in queued, f"{member} is in two queues"
+            queued[member.id] = queue
+    assert cog.queue_index.keys() == queued.keys()
+    assert all(cog.queue_index[member_id] is queue for member_id, queue in queued.items())
+
+
+def test_queue_index_follows_every_queue_change(tmp_path):
+    guild, cog = _cog()
+    alice, bob, carol = (guild.add_member(name) for name in ("alice", "bob", "carol"))
+    scheduler._scheduler = None  # queue timeouts run on the wheel, which belongs to one event loop
+
+    async def join(member, role, debate_format):
+        await cog.join_command.callback(cog, FakeContext(guild.api, member, guild, cog.bot.lobby_channel), role, debate_format)
+
+    async def main():
+        await database.init_db(str(tmp_path / "queues.db"))
+        try:
+            await join(alice, "debater", "AP")
+            await join(bob, "judge", "AP")
+            assert cog.queue_index[alice.id] is cog.queue_ap
+            _assert_index_matches_queues(cog)
+
+            # Switching role in the same format, then moving across formats
+            await join(bob, "debater", "AP")
+            assert cog.queue_ap.get_user_role(bob) == "debater"
+            await join(alice, "judge", "BP")
+            await join(carol, "debater", "1v1")
+            assert cog.queue_index[alice.id] is cog.queue_bp and not cog.queue_ap.is_in_queue(alice)
+            _assert_index_matches_queues(cog)
+
+            # Direct removal, and _remove_from_queues honouring `keep`
+            assert cog.queue_ap.remove_user(bob) and not cog.queue_ap.remove_user(bob)
+            assert not cog._remove_from_queues(alice, keep=cog.queue_bp)
+            assert cog._remove_from_queues(alice)
+            assert not cog._remove_from_queues(alice)
+            _assert_index_matches_queues(cog)
+            assert cog.queue_index.keys() == {carol.id}
+
+            cog.queue_1v1.clear()
+            assert not cog.queue_index
+        finally:
+            await database.close_db()
+            scheduler._scheduler = None
+
+    asyncio.run(main())
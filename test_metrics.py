@@ -0,0 +1,35 @@
+"""Rate-limit counting (utils/metrics.py), fed the warnings py-cord's HTTPClient logs for a 429."""
+import logging
+import sys
+
+sys.path.insert(0, '.')
+
+from utils import metrics
+
+
+def _warning(msg: str, *args) -> logging.LogRecord:
+    return logging.LogRecord("discord.http", logging.WARNING, __file__, 0, msg, args, None)
+
+
+BUCKET_LINE = 'We are being rate limited. Retrying in %.2f seconds. Handled under the bucket "%s"'
+GLOBAL_LINE = "Global rate limit has been hit. Retrying in %.2f seconds."
+
+
+def _counts():
+    return (metrics.API_RATE_LIMITS.labels().value, metrics.API_GLOBAL_RATE_LIMITS.labels().value,
+            metrics.API_RATE_LIMIT_WAIT.labels().value)
+
+
+def test_a_global_429_is_counted_once():
+    handler = metrics._RateLimitCounter()
+    before = _counts()
+
+    # A per-bucket 429, then a global one (py-cord logs the bucket line before the global line)
+    handler.emit(_warning(BUCKET_LINE, 1.5, "bucket-a"))
+    handler.emit(_warning(BUCKET_LINE, 2.0, "bucket-b"))
+    handler.emit(_warning(GLOBAL_LINE, 2.0))
+
+    limits, global_limits, wait = (after - start for after, start in zip(_counts(), before))
+    assert limits == 2
+    assert global_limits == 1
+    assert wait == 3.5
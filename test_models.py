@@ -0,0 +1,139 @@
+"""Round model tests (utils/models.py): frozen ballots and their validation, and the round index."""
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, '.')
+
+from benchmarks.synthetic import make_ap_round, make_members
+from utils.models import (
+    Ballot, BallotErrorCode, DebateRound, DebateTeam, JudgePanel, RoundType, SpeakerScore, TeamType
+)
+from utils.persistence import restore_round, round_state
+
+GOV_POSITIONS = ("Prime Minister", "Deputy Prime Minister", "Government Whip")
+OPP_POSITIONS = ("Leader of Opposition", "Deputy Leader of Opposition", "Opposition Whip")
+
+
+def _ballot(winner: str, gov: list, opp: list, gov_reply=None, opp_reply=None) -> Ballot:
+    """A 3v3 ballot from score lists; replies are (position, score) pairs."""
+    members = make_members(7)
+    gov_members, opp_members = members[:3], members[3:6]
+
+    def reply(team_members, positions, entry):
+        if entry is None:
+            return None
+        position, value = entry
+        return SpeakerScore(team_members[positions.index(position)], position, value)
+
+    return Ballot(
+        judge=members[6], winner=winner,
+        gov_scores=[SpeakerScore(m, p, s) for m, p, s in zip(gov_members, GOV_POSITIONS, gov)],
+        opp_scores=[SpeakerScore(m, p, s) for m, p, s in zip(opp_members, OPP_POSITIONS, opp)],
+        gov_reply=reply(gov_members, GOV_POSITIONS, gov_reply),
+        opp_reply=reply(opp_members, OPP_POSITIONS, opp_reply),
+    )
+
+
+def test_freeze_totals_and_margin():
+    ballot = _ballot("Government", [76, 75, 74], [73, 74, 72],
+                     ("Prime Minister", 38), ("Leader of Opposition", 37)).freeze()
+    assert (ballot.gov_total, ballot.opp_total) == (263, 256)
+    assert ballot.margin == 7
+    assert ballot.check() is None
+
+    # The margin is the named winner's lead, so it goes negative when the totals disagree with them
+    upset = _ballot("Opposition", [76, 75, 74], [73, 74, 72]).freeze()
+    assert upset.margin == -6
+    assert _ballot("Opposition", [70, 70, 70], [75, 70, 70]).freeze().margin == 5
+
+
+def test_tied_scores_share_a_speaker_rank():
+    ballot = _ballot("Government", [80, 75, 75], [70, 72, 71], ("Prime Minister", 40)).freeze()
+    assert [(s.score, rank) for s, rank in ballot.speaker_ranks] == [
+        (80, 1), (75, 2), (75, 2), (72, 4), (71, 5), (70, 6)
+    ]
+    # Replies are not ranked
+    assert len(ballot.speaker_ranks) == 6
+
+
+@pytest.mark.parametrize("winner", ["Government", "Opposition"])
+@pytest.mark.parametrize("kwargs, code", [
+    ({"gov": [101, 75, 75]}, BallotErrorCode.SCORE_RANGE),
+    ({"opp": [75, 49, 75]}, BallotErrorCode.SCORE_RANGE),
+    ({"gov_reply": ("Prime Minister", 51)}, BallotErrorCode.REPLY_RANGE),
+    ({"opp_reply": ("Leader of Opposition", 24)}, BallotErrorCode.REPLY_RANGE),
+    ({"gov_reply": ("Government Whip", 40)}, BallotErrorCode.REPLY_WHIP),
+    ({"opp_reply": ("Opposition Whip", 40)}, BallotErrorCode.REPLY_WHIP),
+    ({"gov": [75, 75, 75], "opp": [75, 75, 75]}, BallotErrorCode.WINNER_TOTAL),
+])
+def test_check_codes(winner, kwargs, code):
+    # A clear win for `winner` unless the case says otherwise
+    strong, weak = [78, 78, 78], [72, 72, 72]
+    scores = {"gov": strong if winner == "Government" else weak,
+              "opp": weak if winner == "Government" else strong}
+    scores.update({key: kwargs[key] for key in ("gov", "opp") if key in kwargs})
+    issue = _ballot(winner, scores["gov"], scores["opp"],
+                    kwargs.get("gov_reply"), kwargs.get("opp_reply")).freeze().check()
+    assert issue is not None and issue.code is code
+
+
+def test_check_reports_substantive_scores_before_replies():
+    # Government's reply and Opposition's speech are both out of range: the speech is reported first
+    issue = _ballot("Government", [78, 78, 78], [72, 72, 120], ("Prime Minister", 70)).freeze().check()
+    assert issue.code is BallotErrorCode.SCORE_RANGE
+    assert "Opposition Whip" in issue.message
+
+
+def test_restore_round_refreezes_an_equal_ballot():
+    members = make_members(10)
+    debate_round = make_ap_round(4, members, random.Random(1))
+    by_id = {member.id: member for member in members}
+
+    restored = restore_round(round_state(debate_round), by_id.get)
+    assert restored.ballot == debate_round.ballot
+    assert restored.ballot.speaker_ranks == debate_round.ballot.speaker_ranks
+
+
+def _indexed_round(round_id: int, members: list, index: dict) -> DebateRound:
+    """A 2v2 round with a chair and a panelist, recorded in index."""
+    judges = JudgePanel()
+    for judge in members[4:6]:
+        judges.add_judge(judge)
+    debate_round = DebateRound(
+        round_id=round_id, round_type=RoundType.DOUBLE_IRON,
+        government=DebateTeam("Government", TeamType.IRON, members[0:2]),
+        opposition=DebateTeam("Opposition", TeamType.IRON, members[2:4]),
+        judges=judges,
+    )
+    debate_round.attach_index(index)
+    return debate_round
+
+
+def _entries(index: dict, round_id: int) -> dict:
+    return {member_id: role for member_id, (entry_round, role) in index.items() if entry_round == round_id}
+
+
+def test_swaps_keep_the_round_index_current():
+    index = {}
+    gov0, gov1, opp0, opp1, chair, panelist = make_members(6)
+    debate_round = _indexed_round(1, [gov0, gov1, opp0, opp1, chair, panelist], index)
+    other = _indexed_round(2, make_members(6, start_id=2000), index)
+
+    # A debater with the chair: the chair leaving promotes the panelist, and the debater joins as panelist
+    assert debate_round.swap_members(gov0, chair)
+    assert index[gov0.id] == (1, "panelist")
+    assert index[chair.id] == (1, "gov")
+    assert index[panelist.id] == (1, "chair")
+
+    # Debaters across teams
+    assert debate_round.swap_members(gov1, opp0)
+    assert index[gov1.id] == (1, "opp")
+    assert index[opp0.id] == (1, "gov")
+    assert _entries(index, 1) == debate_round.get_member_roles()
+
+    debate_round.detach_index()
+    assert debate_round.index is None
+    assert not _entries(index, 1)
+    assert _entries(index, 2) == other.get_member_roles()
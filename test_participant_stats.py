@@ -0,0 +1,56 @@
+"""participant_stats tests: the per-round upserts in log_round must agree with rebuild_participant_stats()."""
+import asyncio
+import json
+import random
+import sqlite3
+import sys
+
+sys.path.insert(0, '.')
+
+from benchmarks.synthetic import make_1v1_round, make_members, make_rounds
+from utils import database
+
+JSON_COLUMNS = ("positions", "formats", "judge_formats")
+
+def test_incremental_stats_match_a_rebuild(tmp_path):
+    # AP rounds carry reply speeches, and AP/BP position names contain spaces
+    rounds = make_rounds(40, population=30, bp_share=0.4, seed=5)
+    rng = random.Random(9)
+    pool = make_members(30)
+    rounds += [make_1v1_round(len(rounds) + i, pool, rng) for i in range(1, 13)]
+    ids = [member.id for member in pool]
+    db_path = str(tmp_path / "stats.db")
+
+    def raw_rows() -> list:
+        """participant_stats as stored, with the JSON columns parsed (key order may differ)."""
+        conn = sqlite3.connect(db_path)
+        conn.row_factory = sqlite3.Row
+        try:
+            rows = conn.execute("SELECT * FROM participant_stats ORDER BY discord_id").fetchall()
+        finally:
+            conn.close()
+        return [{key: json.loads(row[key]) if key in JSON_COLUMNS and row[key] else row[key] for key in row.keys()}
+                for row in rows]
+
+    async def all_stats() -> dict:
+        return {discord_id: await database.get_participant_stats(discord_id) for discord_id in ids}
+
+    async def main():
+        await database.init_db(db_path)
+        try:
+            for debate_round in rounds:
+                db_round_id = await database.log_round(debate_round)
+                await database.log_judge_ratings(db_round_id, debate_round)
+            incremental, incremental_rows = await all_stats(), raw_rows()
+            await database.rebuild_participant_stats()
+            rebuilt, rebuilt_rows = await all_stats(), raw_rows()
+        finally:
+            await database.close_db()
+        return incremental, incremental_rows, rebuilt, rebuilt_rows
+
+    incremental, incremental_rows, rebuilt, rebuilt_rows = asyncio.run(main())
+    debaters = [stats["debater"] for stats in incremental.values() if stats and stats["debater"]]
+    assert any("Prime Minister" in stats["positions"] for stats in debaters)
+    assert {"1v1", "ap", "bp"} <= {fmt for stats in debaters for fmt in stats["formats"]}
+    assert incremental == rebuilt
+    assert incremental_rows == rebuilt_rows
@@ -0,0 +1,151 @@
+"""Live-state journal tests: a round and the queues survive a restart (utils/persistence.py).
+
+Runs the Matchmaking and Rounds cogs on the offline fake Discord
+(benchmarks/fake_discord.py) against a temporary database, re-opens the
+pool, and restores into fresh cogs.
+"""
+import asyncio
+import sys
+
+sys.path.insert(0, '.')
+
+from benchmarks.fake_discord import FakeAPI, FakeBot, FakeContext, FakeGuild, FakeInteraction
+from cogs.matchmaking import Matchmaking
+from cogs.rounds import ChannelDeletionConfirmView, ParticipantConfirmationView, RateJudgeView, Rounds
+from utils import database, scheduler
+from utils.channel_pool import RoundChannelPool
+from utils.models import Ballot, SpeakerScore
+
+
+def _cogs(guild, lobby):
+    bot = FakeBot(guild, lobby)
+    matchmaking, rounds = Matchmaking(bot), Rounds(bot)
+    rounds.channel_pool = RoundChannelPool(sizes={})
+    bot.add_cog(matchmaking)
+    bot.add_cog(rounds)
+    return matchmaking, rounds
+
+
+def _members(debate_round) -> list:
+    return sorted(m.id for m in debate_round.get_all_participants())
+
+
+async def _run(db_path: str):
+    api = FakeAPI(latency=0)
+    guild = FakeGuild(api)
+    lobby = guild.add_text_channel("lobby")
+    matchmaking, rounds = _cogs(guild, lobby)
+    await matchmaking.initialize_lobby()
+
+    async def join(member, role, debate_format):
+        await matchmaking.join_command.callback(matchmaking, FakeContext(api, member, guild, lobby), role, debate_format)
+
+    # One 1v1 round that gets confirmed and started
+    for i in range(2):
+        await join(guild.add_member(f"debater{i}"), "debater", "1v1")
+    await join(guild.add_member("judge0"), "judge", "1v1")
+    confirmation = next(m.view for m in lobby.messages if isinstance(m.view, ParticipantConfirmationView))
+    for member in confirmation.debate_round.get_all_participants():
+        await confirmation.confirm_button.callback(FakeInteraction(api, member, guild, lobby, confirmation.message))
+    (active,) = matchmaking.active_rounds.values()
+
+    # A second round left waiting on confirmation, and someone still queued for AP
+    for i in range(2, 4):
+        await join(guild.add_member(f"debater{i}"), "debater", "1v1")
+    await join(guild.add_member("judge1"), "judge", "1v1")
+    (pending,) = matchmaking.pending_rounds.values()
+    waiting = guild.add_member("ap-debater")
+    await join(waiting, "debater", "AP")
+    await matchmaking.journal_queues()
+
+    await database.close_db()
+    await database.init_db(db_path)
+
+    restarted, restarted_rounds = _cogs(guild, lobby)
+    await restarted_rounds._restore_live_state(guild)
+
+    restored = restarted.active_rounds[active.round_id]
+    assert _members(restored) == _members(active)
+    assert restored.channel_ids == active.channel_ids
+    assert restored.category_id == active.category_id
+    assert restored.confirmed
+    assert restarted.round_index.keys() == set(_members(active))
+
+    # The unconfirmed round is cancelled: its members are queued again, and it leaves the journal
+    assert not restarted.pending_rounds
+    assert sorted(m.id for m in restarted.queue_1v1.debaters + restarted.queue_1v1.judges) == _members(pending)
+    assert [m.id for m in restarted.queue_ap.debaters] == [waiting.id]
+    assert restarted.round_counter >= pending.round_id
+    state = await database.load_live_state()
+    assert [r["round_id"] for r in state["rounds"]] == [active.round_id]
+
+    await restarted_rounds.forget_round(active.round_id)
+    assert not (await database.load_live_state())["rounds"]
+
+
+def test_round_and_queue_survive_restart(tmp_path):
+    db_path = str(tmp_path / "live.db")
+    scheduler._scheduler = None  # the wheel's task and event belong to one event loop
+
+    async def main():
+        await database.init_db(db_path)
+        try:
+            await _run(db_path)
+        finally:
+            await database.close_db()
+            scheduler._scheduler = None
+
+    asyncio.run(main())
+
+
+async def _rate_after_teardown():
+    api = FakeAPI(latency=0)
+    guild = FakeGuild(api)
+    lobby = guild.add_text_channel("lobby")
+    matchmaking, rounds = _cogs(guild, lobby)
+    await matchmaking.initialize_lobby()
+    for name, role in (("debater0", "debater"), ("debater1", "debater"), ("judge0", "judge")):
+        member = guild.add_member(name)
+        await matchmaking.join_command.callback(matchmaking, FakeContext(api, member, guild, lobby), role, "1v1")
+    confirmation = next(m.view for m in lobby.messages if isinstance(m.view, ParticipantConfirmationView))
+    for member in confirmation.debate_round.get_all_participants():
+        await confirmation.confirm_button.callback(FakeInteraction(api, member, guild, lobby, confirmation.message))
+    (debate_round,) = matchmaking.active_rounds.values()
+    gov, opp = debate_round.government, debate_round.opposition
+    debate_round.ballot = Ballot(
+        judge=debate_round.judges.chair, winner="Government",
+        gov_scores=[SpeakerScore(gov.members[0], gov.get_position_name(0), 76)],
+        opp_scores=[SpeakerScore(opp.members[0], opp.get_position_name(0), 74)],
+    ).freeze()
+    assert [r["round_id"] for r in (await database.load_live_state())["rounds"]] == [debate_round.round_id]
+
+    # The chair tears the round down while a debater still has the Rate Judge DM open
+    debater = gov.members[0]
+    rate_view = RateJudgeView(rounds, debate_round, debater)
+    chair = debate_round.judges.chair
+    teardown = ChannelDeletionConfirmView(rounds, debate_round.round_id)
+    await teardown.confirm_button.callback(FakeInteraction(api, chair, guild, lobby))
+    assert not (await database.load_live_state())["rounds"]
+
+    clicked = FakeInteraction(api, debater, guild)
+    await rate_view.rate_button.callback(clicked)
+    modal = clicked.response.modal
+    modal.score_input.value = "8"
+    await modal.callback(FakeInteraction(api, debater, guild))
+
+    assert debater.id in debate_round.rated_debater_ids
+    assert not (await database.load_live_state())["rounds"]
+
+
+def test_late_judge_rating_does_not_journal_a_torn_down_round(tmp_path):
+    scheduler._scheduler = None
+
+    async def main():
+        await database.init_db(str(tmp_path / "live.db"))
+        try:
+            await _rate_after_teardown()
+        finally:
+            await database.close_db()
+            scheduler._scheduler = None
+
+    asyncio.run(main())
@@ -0,0 +1,83 @@
+"""Query-plan regression test: every /stats query must stay on an index.
+
+Seeds a database with synthetic rounds, then runs EXPLAIN QUERY PLAN on each
+entry in utils.database.STATS_QUERIES and fails if any step falls back to a
+full SCAN of one of our tables. The full-history rebuilds in REBUILD_QUERIES
+read whole tables by design, so those must read them through an index, and
+between them use every index the migrations create.
+"""
+import asyncio
+import re
+import sqlite3
+import sys
+
+import pytest
+
+sys.path.insert(0, '.')
+
+from benchmarks.synthetic import make_rounds
+from utils import database
+
+TABLES = ("rounds", "participants", "speaker_scores", "judge_ratings")
+
+
+async def _seed(db_path: str):
+    await database.init_db(db_path)
+    try:
+        for debate_round in make_rounds(150):
+            db_round_id = await database.log_round(debate_round)
+            await database.log_judge_ratings(db_round_id, debate_round)
+    finally:
+        await database.close_db()
+
+
+@pytest.fixture(scope="module")
+def seeded_db(tmp_path_factory):
+    db_path = str(tmp_path_factory.mktemp("plans") / "stats.db")
+    asyncio.run(_seed(db_path))
+    conn = sqlite3.connect(db_path)
+    yield conn
+    conn.close()
+
+
+def _plan(conn, sql: str) -> list:
+    params = (1001,) if "?" in sql else ()
+    return [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params)]
+
+
+def _table_scans(conn, sql: str) -> list:
+    """Plan steps that SCAN one of our tables (aliases resolved via the FROM clause)."""
+    aliases = {table: table for table in TABLES}
+    for table, alias in re.findall(r"\b(\w+)\s+(?:AS\s+)?(\w+)\s+(?:JOIN|WHERE|ON)\b", sql):
+        if table in TABLES:
+            aliases[alias] = table
+    return [step for step in _plan(conn, sql)
+            if step.startswith("SCAN ") and step.split()[1] in aliases]
+
+
+def test_schema_is_fully_migrated(seeded_db):
+    version = seeded_db.execute("PRAGMA user_version").fetchone()[0]
+    assert version == database.SCHEMA_VERSION
+
+
+@pytest.mark.parametrize("name", sorted(database.STATS_QUERIES))
+def test_stats_query_uses_index(seeded_db, name):
+    scans = _table_scans(seeded_db, database.STATS_QUERIES[name])
+    assert not scans, f"{name} regressed to a full table scan: {scans}"
+
+
+@pytest.mark.parametrize("name", sorted(database.REBUILD_QUERIES))
+def test_rebuild_query_reads_through_index(seeded_db, name):
+    unindexed = [step for step in _plan(seeded_db, database.REBUILD_QUERIES[name])
+                 if step.split()[:1] in (["SCAN"], ["SEARCH"]) and step.split()[1] in ("ss", "r", *TABLES)
+                 and "INDEX" not in step and "PRIMARY KEY" not in step]
+    assert not unindexed, f"{name} reads a table without an index: {unindexed}"
+
+
+def test_every_index_is_used(seeded_db):
+    indexes = {row[0] for row in seeded_db.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'index' AND name LIKE 'idx_%'"
+    )}
+    queries = list(database.STATS_QUERIES.values()) + list(database.REBUILD_QUERIES.values())
+    used = {index for sql in queries for step in _plan(seeded_db, sql) for index in indexes if index in step.split()}
+    assert indexes <= used, f"Indexes no query uses: {sorted(indexes - used)}"
@@ -0,0 +1,88 @@
+"""Elo engine tests (utils/ratings.py), and incremental log_round Elo against a full rebuild_ratings replay."""
+import asyncio
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, '.')
+
+from benchmarks.synthetic import make_1v1_round, make_members, make_rounds
+from config import Config
+from utils import database
+from utils.ratings import expected_score, rating_deltas, team_ranks
+
+
+def test_expected_score_is_symmetric():
+    assert expected_score(1000, 1000) == 0.5
+    for rating, opponent in ((1200, 1000), (950, 1410), (1000, 1001)):
+        assert expected_score(rating, opponent) + expected_score(opponent, rating) == pytest.approx(1.0)
+    assert expected_score(1400, 1000) == pytest.approx(10 / 11)
+
+
+def test_two_team_deltas_sum_to_zero():
+    teams = {"gov": [1, 2, 3], "opp": [4, 5]}
+    ratings = {1: 1100, 2: 1000, 3: 900, 4: 1250, 5: 1010}
+    deltas = rating_deltas(teams, team_ranks("Opposition", None), ratings)
+    gov, opp = deltas[1], deltas[4]
+    # Every member of a team gets the team's delta; the two teams' deltas cancel
+    assert deltas[1] == deltas[2] == deltas[3] and deltas[4] == deltas[5]
+    assert gov + opp == pytest.approx(0.0)
+    expected = Config.ELO_K_FACTOR * (1 - expected_score(1130, 1000))
+    assert opp == pytest.approx(expected)
+
+
+def test_bp_splits_k_across_the_other_teams():
+    teams = {"og": [1, 2], "oo": [3, 4], "cg": [5, 6], "co": [7, 8]}
+    deltas = rating_deltas(teams, {"og": 1, "oo": 2, "cg": 3, "co": 4}, {}, k=30)
+    # All level: each pair game moves K / 3 * (actual - 0.5)
+    assert deltas[1] == pytest.approx(3 * 10 * 0.5)
+    assert deltas[3] == pytest.approx(10 * (-0.5 + 0.5 + 0.5))
+    assert deltas[5] == pytest.approx(-deltas[3])
+    assert deltas[7] == pytest.approx(-deltas[1])
+    assert sum(deltas[pid] for pid in (1, 3, 5, 7)) == pytest.approx(0.0)
+
+
+def test_tied_ranks_score_a_draw():
+    teams = {"og": [1], "oo": [2], "cg": [3]}
+    deltas = rating_deltas(teams, {"og": 1, "oo": 1, "cg": 3}, {1: 1000, 2: 1000, 3: 1000}, k=32)
+    assert deltas[1] == deltas[2] == pytest.approx(16 * (0.5 - 0.5) + 16 * 0.5)
+    # Level teams that tie move nothing between them
+    level = rating_deltas({"gov": [1], "opp": [2]}, {"gov": 1, "opp": 1}, {})
+    assert level == {1: 0.0, 2: 0.0}
+
+
+def test_team_ranks():
+    assert team_ranks(None, None) is None
+    assert team_ranks("Government", None) == {"gov": 1, "opp": 2}
+    assert team_ranks("Opposition", None) == {"gov": 2, "opp": 1}
+    assert team_ranks(None, {"og": 2, "oo": 1, "cg": 4, "co": 3}) == {"og": 2, "oo": 1, "cg": 4, "co": 3}
+    # An unranked BP ballot has no result to rate
+    assert team_ranks(None, {"og": None, "oo": None}) is None
+    assert rating_deltas({"gov": [1], "opp": [2]}, {"gov": 1}, {}) == {}
+
+
+def test_log_round_matches_rebuild_ratings(tmp_path):
+    rounds = make_rounds(30, population=24, seed=11)
+    rng = random.Random(3)
+    pool = make_members(24)
+    rounds += [make_1v1_round(len(rounds) + i, pool, rng) for i in range(1, 11)]
+    ids = [member.id for member in pool]
+
+    async def main():
+        await database.init_db(str(tmp_path / "elo.db"))
+        try:
+            for debate_round in rounds:
+                await database.log_round(debate_round)
+            incremental = await database.get_ratings(ids)
+            assert await database.rebuild_ratings() == len(rounds)
+            replayed = await database.get_ratings(ids)
+        finally:
+            await database.close_db()
+        return incremental, replayed
+
+    incremental, replayed = asyncio.run(main())
+    assert incremental.keys() == replayed.keys()
+    assert any(rating != Config.ELO_DEFAULT for rating in incremental.values())
+    for participant_id, rating in incremental.items():
+        assert replayed[participant_id] == pytest.approx(rating, abs=1e-9)
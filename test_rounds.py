@@ -0,0 +1,112 @@
+"""Rounds cog tests against the offline fake Discord (benchmarks/fake_discord.py)."""
+import asyncio
+import sys
+
+sys.path.insert(0, '.')
+
+from benchmarks.fake_discord import FakeAPI, FakeBot, FakeContext, FakeGuild, FakeInteraction
+from cogs.matchmaking import Matchmaking
+from cogs.rounds import ParticipantConfirmationView, Rounds
+from utils import database, scheduler
+from config import Config
+from utils.channel_pool import LAYOUTS, RoundChannelPool
+from utils.scheduler import get_scheduler
+
+
+async def _started_round(api: FakeAPI):
+    """A confirmed 1v1 round, with its channels."""
+    guild = FakeGuild(api)
+    lobby = guild.add_text_channel("lobby")
+    bot = FakeBot(guild, lobby)
+    matchmaking, rounds = Matchmaking(bot), Rounds(bot)
+    rounds.channel_pool = RoundChannelPool(sizes={})
+    bot.add_cog(matchmaking)
+    bot.add_cog(rounds)
+    await matchmaking.initialize_lobby()
+    for name, role in (("debater0", "debater"), ("debater1", "debater"), ("judge", "judge")):
+        member = guild.add_member(name)
+        await matchmaking.join_command.callback(matchmaking, FakeContext(api, member, guild, lobby), role, "1v1")
+    view = next(m.view for m in lobby.messages if isinstance(m.view, ParticipantConfirmationView))
+    for member in view.debate_round.get_all_participants():
+        await view.confirm_button.callback(FakeInteraction(api, member, guild, lobby, view.message))
+    (debate_round,) = matchmaking.active_rounds.values()
+    return guild, matchmaking, rounds, debate_round
+
+
+def test_prep_timer_that_already_fired_respects_later_cancels(tmp_path):
+    scheduler._scheduler = None  # the wheel's task and event belong to one event loop
+
+    async def main():
+        api = FakeAPI(latency=0)
+        guild, matchmaking, rounds, debate_round = await _started_round(api)
+        text_channel = guild.get_channel(debate_round.channel_ids["text"])
+
+        async def announcements() -> int:
+            before = len(text_channel.messages)
+            await rounds.run_prep_timer(guild, debate_round, text_channel)
+            return len(text_channel.messages) - before
+
+        # Prep was restarted after this callback fired: the newer timer owns the round
+        rounds.start_prep_timer(guild, debate_round, text_channel, 60)
+        assert await announcements() == 0
+        rounds.cancel_prep_timer(debate_round)
+
+        assert await announcements() == 1
+
+        # Torn down while the callback was on its way
+        matchmaking.remove_active_round(debate_round.round_id)
+        assert await announcements() == 0
+        assert get_scheduler().deadline(("prep", debate_round.round_id)) is None
+
+    async def run():
+        await database.init_db(str(tmp_path / "rounds.db"))
+        try:
+            await main()
+        finally:
+            await database.close_db()
+            scheduler._scheduler = None
+
+    asyncio.run(run())
+
+
+def test_orphan_sweep_deletes_only_stale_round_categories(tmp_path, monkeypatch):
+    scheduler._scheduler = None
+
+    async def main():
+        api = FakeAPI(latency=0)
+        guild, matchmaking, rounds, debate_round = await _started_round(api)
+        active = guild.get_channel(debate_round.category_id)
+
+        # An idle pooled category still named after the round it last hosted
+        rounds.channel_pool = RoundChannelPool(sizes={"AP": 1})
+        await rounds.channel_pool.warm(guild)
+        rounds.channel_pool._refill_later = lambda guild, layout: None
+        specs = [(key, kind, f"round-99-{key}", None) for key, kind in LAYOUTS["AP"]]
+        idle, channels = await rounds.channel_pool.acquire(guild, "AP", "Round 99 - Standard", {}, specs)
+        await rounds.channel_pool.release(guild, "AP", idle, {key: c.id for key, c in channels.items()})
+        assert rounds.channel_pool.is_idle(idle.id)
+
+        other = await guild.create_category("General")
+        stale = await guild.create_category("Round 42 - Standard")
+        stale_text = await stale.create_text_channel("round-42-text")
+
+        # Nothing is old enough yet
+        assert await rounds.sweep_orphan_categories(guild) == 0
+
+        monkeypatch.setattr(Config, "ORPHAN_CATEGORY_TTL", -60)
+        assert rounds.find_orphan_categories(guild) == [stale]
+        assert await rounds.sweep_orphan_categories(guild) == 1
+        remaining = {category.id for category in guild.categories}
+        assert {active.id, idle.id, other.id} <= remaining
+        assert stale.id not in remaining and guild.get_channel(stale_text.id) is None
+        assert matchmaking.active_rounds[debate_round.round_id] is debate_round
+
+    async def run():
+        await database.init_db(str(tmp_path / "rounds.db"))
+        try:
+            await main()
+        finally:
+            await database.close_db()
+            scheduler._scheduler = None
+
+    asyncio.run(run())
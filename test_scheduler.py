@@ -0,0 +1,85 @@
+"""Timer wheel tests (utils/scheduler.py), on a fine tick so they run quickly."""
+import asyncio
+import sys
+import time
+
+sys.path.insert(0, '.')
+
+from utils.scheduler import TimerWheel
+
+
+def test_scheduling_a_key_again_replaces_its_timer():
+    async def main():
+        wheel = TimerWheel(tick=0.01, slots=16)
+        fired = []
+        wheel.schedule("k", 0.02, fired.append, "first")
+        wheel.schedule("k", 0.03, fired.append, "second")
+        assert len(wheel) == 1
+        await asyncio.sleep(0.1)
+        assert fired == ["second"]
+        assert len(wheel) == 0
+
+    asyncio.run(main())
+
+
+def test_cancel():
+    async def main():
+        wheel = TimerWheel(tick=0.01, slots=16)
+        fired = []
+        wheel.schedule(("queue", 1), 0.02, fired.append, 1)
+        wheel.schedule(("queue", 2), 0.02, fired.append, 2)
+        assert wheel.cancel(("queue", 1))
+        assert not wheel.cancel(("queue", 1))
+        assert not wheel.cancel(("queue", 3))
+        await asyncio.sleep(0.1)
+        assert fired == [2]
+
+    asyncio.run(main())
+
+
+def test_remaining_and_pending():
+    async def main():
+        wheel = TimerWheel(tick=0.01, slots=16)
+        wheel.schedule(("prep", 1), 5, print)
+        wheel.schedule(("veto", 1), 1, print)
+        assert 4.9 < wheel.remaining(("prep", 1)) <= 5
+        assert wheel.remaining(("prep", 2)) is None
+        assert [key for key, _ in wheel.pending()] == [("veto", 1), ("prep", 1)]
+        assert [key for key, _ in wheel.pending("prep")] == [("prep", 1)]
+        wheel.cancel(("prep", 1))
+        assert wheel.remaining(("prep", 1)) is None
+        wheel.cancel(("veto", 1))
+
+    asyncio.run(main())
+
+
+def test_catches_up_on_ticks_missed_while_the_loop_was_blocked():
+    async def main():
+        # Deadlines more than a full turn of the 4-slot ring apart still fire in order
+        wheel = TimerWheel(tick=0.01, slots=4)
+        fired = []
+        deadlines = {i: wheel.schedule(i, 0.01 * (i + 1), lambda i=i: fired.append((i, time.monotonic())))
+                     for i in range(8)}
+        await asyncio.sleep(0)
+        time.sleep(0.15)  # a stall long enough to miss every tick
+        await asyncio.sleep(0.05)
+        assert [i for i, _ in fired] == list(range(8))
+        assert all(at >= deadlines[i] for i, at in fired)  # late, never early
+        assert len(wheel) == 0
+
+    asyncio.run(main())
+
+
+def test_coroutine_callbacks_run_as_tasks():
+    async def main():
+        wheel = TimerWheel(tick=0.01, slots=16)
+        done = asyncio.Event()
+
+        async def callback():
+            await asyncio.sleep(0)
+            done.set()
+
+        wheel.schedule("k", 0, callback)
+        await asyncio.wait_for(done.wait(), 1)
+
+    asyncio.run(main())
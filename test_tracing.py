@@ -0,0 +1,39 @@
+"""Interaction tracing (utils/tracing.py): a traced button callback is logged as its own trace."""
+import asyncio
+import json
+import logging
+import sys
+from types import SimpleNamespace
+
+import discord
+
+sys.path.insert(0, '.')
+
+from config import Config
+from utils.tracing import span, traced_interaction
+
+
+class _View(discord.ui.View):
+    @discord.ui.button(label="Go")
+    @traced_interaction()
+    async def go_button(self, button: discord.ui.Button, interaction: discord.Interaction):
+        with span("work"):
+            await asyncio.sleep(0)
+
+
+def test_button_callback_is_traced(caplog, monkeypatch):
+    monkeypatch.setattr(Config, "TRACE_SLOW_THRESHOLD", 0)
+    interaction = SimpleNamespace(user=SimpleNamespace(id=42))
+
+    async def main():
+        view = _View()
+        await view.go_button.callback(interaction)
+
+    with caplog.at_level(logging.WARNING, logger="DebateBot.Tracing"):
+        asyncio.run(main())
+
+    [line] = [r.getMessage() for r in caplog.records if r.name == "DebateBot.Tracing"]
+    record = json.loads(line.removeprefix("Slow trace: "))
+    assert record["trace"] == "_View.go_button"
+    assert record["user"] == 42
+    assert [child["name"] for child in record["children"]] == ["work"]
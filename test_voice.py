@@ -0,0 +1,81 @@
+"""Bulk voice move tests (utils/voice.py) on the offline fake Discord, with errors injected per route."""
+import asyncio
+import sys
+
+sys.path.insert(0, '.')
+
+from benchmarks.fake_discord import FakeAPI, FakeGuild, FakeVoiceState, http_error
+from utils import voice
+from utils.voice import describe_move_error, move_members
+
+
+def _in_voice(api: FakeAPI, count: int):
+    guild = FakeGuild(api)
+    lobby, target = guild.add_voice_channel("lobby"), guild.add_voice_channel("target")
+    members = [guild.add_member(f"member{i}") for i in range(count)]
+    for member in members:
+        member.voice = FakeVoiceState(lobby)
+        lobby.connected.add(member)
+    return guild, members, target
+
+
+def _record_backoff(monkeypatch) -> list:
+    attempts = []
+
+    def backoff_delay(attempt, base):
+        attempts.append(attempt)
+        return 0.001
+    monkeypatch.setattr(voice, "backoff_delay", backoff_delay)
+    return attempts
+
+
+def test_retryable_failure_is_retried_and_moved(monkeypatch):
+    attempts = _record_backoff(monkeypatch)
+
+    async def main():
+        api = FakeAPI(latency=0)
+        _, (member,), target = _in_voice(api, 1)
+        api.fail("move_member", http_error(429), http_error(503))
+        failures = await move_members([(member, target)], retries=3, backoff=0.5)
+        assert failures == []
+        assert target.members == [member] and member.voice.channel is target
+        assert api.calls["move_member"] == 3
+
+    asyncio.run(main())
+    # Each failed attempt backs off from its own attempt number
+    assert attempts == [0, 1]
+
+
+def test_gives_up_after_the_retry_limit(monkeypatch):
+    attempts = _record_backoff(monkeypatch)
+
+    async def main():
+        api = FakeAPI(latency=0)
+        _, (member,), target = _in_voice(api, 1)
+        api.fail("move_member", *(http_error(429) for _ in range(3)))
+        failures = await move_members([(member, target)], retries=2, backoff=0.5)
+        assert [(m, channel, error.status) for m, channel, error in failures] == [(member, target, 429)]
+        assert describe_move_error(failures[0][2]) == "Discord kept rate limiting the move"
+        assert api.calls["move_member"] == 3
+        assert member.voice.channel is not target
+
+    asyncio.run(main())
+    assert attempts == [0, 1]
+
+
+def test_non_retryable_failure_and_members_out_of_voice(monkeypatch):
+    attempts = _record_backoff(monkeypatch)
+
+    async def main():
+        api = FakeAPI(latency=0)
+        guild, (blocked,), target = _in_voice(api, 1)
+        left = guild.add_member("left")  # not in voice: skipped without a call
+        api.fail("move_member", http_error(403))
+        failures = await move_members([(blocked, target), (left, target)], retries=3)
+        assert [(m, error.status) for m, _, error in failures] == [(blocked, 403)]
+        assert describe_move_error(failures[0][2]) == "the bot lacks the Move Members permission"
+        assert api.calls["move_member"] == 1
+        assert left.voice is None
+
+    asyncio.run(main())
+    assert attempts == []
@@ -0,0 +1,181 @@
+"""Draw planning and skill-balanced team allocation.
+
+plan_draw() decides how many rounds (and of which type) a queue can support
+at once. For each round, debaters arrive as allocation units: a solo debater,
+or a party that has to share a team. select_units() takes units
+first-come-first-served until the round's seats are filled, then
+balance_teams() searches the ways of packing those units into teams (branch
+and bound, under a time budget) for the one with the smallest gap between the
+strongest and weakest team's average rating.
+"""
+import logging
+import random
+import time
+from typing import Callable, List, Optional, Sequence
+
+from config import Config
+from utils.models import FormatType, RoundType
+
+logger = logging.getLogger('DebateBot.Allocation')
+
+
+# Debaters seated by each AP round type
+AP_ROUND_SIZES = {6: RoundType.STANDARD, 5: RoundType.SINGLE_IRON, 4: RoundType.DOUBLE_IRON}
+
+
+def plan_draw(format_type: FormatType, debaters: int, judges: int,
+              max_party_size: int = 1, max_rounds: Optional[int] = None) -> List[RoundType]:
+    """Round types for the largest number of rounds the queue can fill at once.
+
+    Every round needs a judge to chair it. Among draws with the most rounds,
+    the one seating the most debaters wins, and bigger rounds come first.
+    Debaters that don't fit stay queued. A party of 3 rules out 2v2 rounds,
+    the same rule MatchmakingQueue.get_threshold_type applies.
+    """
+    max_rounds = Config.MAX_ROUNDS_PER_DRAW if max_rounds is None else max_rounds
+
+    if format_type == FormatType.ONE_V_ONE:
+        return [RoundType.PM_LO] * min(debaters // 2, judges, max_rounds)
+    if format_type == FormatType.BP:
+        return [RoundType.BP] * min(debaters // 8, judges, max_rounds)
+
+    min_size = 4 if max_party_size <= 2 else 5
+    rounds = min(debaters // min_size, judges, max_rounds)
+    extra = min(debaters, 6 * rounds) - min_size * rounds
+    plan = []
+    for _ in range(rounds):
+        grow = min(6 - min_size, extra)
+        plan.append(AP_ROUND_SIZES[min_size + grow])
+        extra -= grow
+    return plan
+
+
+def split_judges(judges: list, rounds: int) -> List[list]:
+    """Deal judges out over the rounds: one random chair each, surplus judges as panelists."""
+    if rounds <= 0:
+        return []
+    shuffled = judges.copy()
+    random.shuffle(shuffled)
+    panels = [[judge] for judge in shuffled[:rounds]]
+    for i, judge in enumerate(shuffled[rounds:]):
+        panels[i % rounds].append(judge)
+    return panels
+
+
+class _OutOfTime(Exception):
+    pass
+
+
+def _can_pack(unit_sizes: Sequence[int], capacities: Sequence[int]) -> bool:
+    """Whether units of these sizes fit into teams with these free seats."""
+    sizes = sorted(unit_sizes, reverse=True)
+    room = list(capacities)
+
+    def place(i: int) -> bool:
+        if i == len(sizes):
+            return True
+        tried = set()
+        for t, free in enumerate(room):
+            if free >= sizes[i] and free not in tried:
+                tried.add(free)
+                room[t] -= sizes[i]
+                if place(i + 1):
+                    return True
+                room[t] += sizes[i]
+        return False
+
+    return place(0)
+
+
+def select_units(units: List[list], team_sizes: Sequence[int]) -> Optional[List[list]]:
+    """Pick units in queue order until every seat in team_sizes is filled.
+
+    A unit that can no longer be packed alongside the ones already picked is
+    skipped (it stays queued). Returns None if the seats can't be filled exactly.
+    """
+    seats = sum(team_sizes)
+    selected, filled = [], 0
+    for unit in units:
+        if filled + len(unit) > seats:
+            continue
+        if not _can_pack([len(u) for u in selected] + [len(unit)], team_sizes):
+            continue
+        selected.append(unit)
+        filled += len(unit)
+        if filled == seats:
+            return selected
+    return None
+
+
+def balance_teams(units: List[list], team_sizes: Sequence[int],
+                  rating: Callable[[object], float],
+                  time_budget: Optional[float] = None) -> Optional[List[list]]:
+    """Pack units into teams of exactly team_sizes, minimizing the spread of average team rating.
+
+    Returns one list of units per team (in team_sizes order), or None if the
+    units can't be packed at all. If the time budget runs out the best packing
+    found so far is returned (the search always runs until it has found one).
+    """
+    budget = Config.ALLOCATION_TIME_BUDGET if time_budget is None else time_budget
+    deadline = time.perf_counter() + budget
+
+    # Big, strong units first: they constrain the search the most
+    scored = sorted(
+        ((len(unit), sum(rating(member) for member in unit), unit) for unit in units),
+        key=lambda item: (-item[0], -item[1])
+    )
+    team_count = len(team_sizes)
+    room = list(team_sizes)
+    totals = [0.0] * team_count
+    teams: List[list] = [[] for _ in range(team_count)]
+    best = {"gap": float("inf"), "teams": None}
+    nodes = 0
+
+    def full_team_gap() -> float:
+        averages = [totals[t] / team_sizes[t] for t in range(team_count) if room[t] == 0]
+        return max(averages) - min(averages) if len(averages) > 1 else 0.0
+
+    def search(i: int):
+        nonlocal nodes
+        nodes += 1
+        # The budget only cuts the search short once there's a packing to fall back on
+        if nodes % 256 == 0 and best["teams"] is not None and time.perf_counter() > deadline:
+            raise _OutOfTime
+        if i == len(scored):
+            gap = full_team_gap()
+            if gap < best["gap"]:
+                best["gap"] = gap
+                best["teams"] = [list(team) for team in teams]
+            return
+
+        size, total, unit = scored[i]
+        tried_empty = set()
+        for t in range(team_count):
+            if room[t] < size:
+                continue
+            if room[t] == team_sizes[t]:
+                # Empty teams of the same size are interchangeable; try only one
+                if team_sizes[t] in tried_empty:
+                    continue
+                tried_empty.add(team_sizes[t])
+            room[t] -= size
+            totals[t] += total
+            teams[t].append(unit)
+            # Teams that are already full can only widen the final gap
+            if full_team_gap() < best["gap"]:
+                search(i + 1)
+            teams[t].pop()
+            totals[t] -= total
+            room[t] += size
+            if best["gap"] == 0.0:
+                return
+
+    try:
+        search(0)
+    except _OutOfTime:
+        logger.info(f"Allocation search hit its {budget * 1000:.0f}ms budget after {nodes} nodes")
+
+    if best["teams"] is None:
+        return None
+    logger.debug(f"Balanced {len(units)} units into {list(team_sizes)} (gap {best['gap']:.1f}, {nodes} nodes)")
+    return best["teams"]
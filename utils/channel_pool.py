@@ -0,0 +1,279 @@
+"""Pre-warmed round categories, so a confirmed round doesn't wait on channel creation.
+
+The pool keeps idle round categories, hidden from everyone but the bot, with
+the standard channel layout already created. Starting a round then costs one
+edit per channel (new name + permission overwrites) instead of a create, and a
+finished round's category is reset and put back instead of deleted.
+
+Discord rate limits channel renames to 2 per 10 minutes per channel, so
+renames are kept to the one per channel that taking a category for a round
+needs: a released category only has its permissions reset and keeps its last
+names while idle, and idle categories are handed out oldest first, so each
+one goes a full trip through the pool between renames. If the renames still
+hit a rate limit, acquire() gives up after CHANNEL_POOL_ACQUIRE_TIMEOUT and
+the round gets freshly created channels.
+
+Categories released this way keep their "Round N - ..." name, so after a
+restart they are no longer recognized as idle; the orphan sweep deletes them
+and warm() creates fresh ones.
+"""
+import asyncio
+import logging
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
+
+import discord
+
+from config import Config
+from utils.concurrency import gather_bounded
+from utils.models import RoundType
+from utils import tracing
+
+logger = logging.getLogger('DebateBot.ChannelPool')
+
+
+POOL_CATEGORY_NAME = "Idle Round Pool"
+
+# (channel_ids key, kind) in display order, per layout. 1v1 and AP share a layout.
+LAYOUTS: Dict[str, Tuple[Tuple[str, str], ...]] = {
+    "AP": (
+        ("text", "text"), ("debate", "voice"),
+        ("gov_prep", "voice"), ("opp_prep", "voice"),
+        ("judges", "voice"), ("judges_text", "text"),
+    ),
+    "BP": (
+        ("text", "text"), ("debate", "voice"),
+        ("gov_prep", "voice"), ("opp_prep", "voice"), ("cg_prep", "voice"), ("co_prep", "voice"),
+        ("judges", "voice"), ("judges_text", "text"),
+    ),
+}
+
+# Format labels drawing from each layout
+LAYOUT_FORMATS = {"AP": ("1v1", "AP"), "BP": ("BP",)}
+
+
+def layout_for(round_type: RoundType) -> str:
+    return "BP" if round_type == RoundType.BP else "AP"
+
+
+def idle_overwrites(guild: discord.Guild) -> dict:
+    """Overwrites for an idle category and its channels: only the bot can see them."""
+    return {
+        guild.default_role: discord.PermissionOverwrite(view_channel=False, connect=False),
+        guild.me: discord.PermissionOverwrite(
+            view_channel=True, connect=True, send_messages=True,
+            manage_channels=True, read_message_history=True, move_members=True
+        ),
+    }
+
+
+class RoundChannelPool:
+    """Idle round categories per layout, handed out on round start and refilled in the background."""
+
+    def __init__(self, sizes: Optional[Dict[str, int]] = None):
+        sizes = Config.CHANNEL_POOL_SIZES if sizes is None else sizes
+        self.targets = {
+            layout: sum(sizes.get(label, 0) for label in labels)
+            for layout, labels in LAYOUT_FORMATS.items()
+        }
+        # layout → (category, {key: channel}) in the order they went idle; taken oldest first
+        self._idle: Dict[str, Deque[Tuple[discord.CategoryChannel, dict]]] = {layout: deque() for layout in LAYOUTS}
+        self._refilling: set = set()
+        self._tasks: set = set()
+
+    def idle_count(self, layout: str) -> int:
+        return len(self._idle[layout])
+
+    def is_idle(self, category_id: int) -> bool:
+        """Whether the category is waiting in the pool (it may still carry its last round's name)."""
+        return any(category.id == category_id for entries in self._idle.values() for category, _ in entries)
+
+    async def warm(self, guild: discord.Guild):
+        """Adopt idle categories left over from a previous run, then create up to each target."""
+        pooled = {category.id for entries in self._idle.values() for category, _ in entries}
+        for category in guild.categories:
+            if category.name != POOL_CATEGORY_NAME or category.id in pooled:
+                continue
+            entry = self._adopt(category)
+            if entry is None or self.idle_count(entry[0]) >= self.targets[entry[0]]:
+                await self._discard(category, category.channels)
+                continue
+            self._idle[entry[0]].append(entry[1:])
+
+        for layout in LAYOUTS:
+            await self._refill(guild, layout)
+        logger.info(
+            "Channel pool warm: "
+            + ", ".join(f"{layout} {self.idle_count(layout)}/{self.targets[layout]}" for layout in LAYOUTS)
+        )
+
+    def _adopt(self, category: discord.CategoryChannel):
+        """Match an existing idle category's channels (by position) to a layout."""
+        children = sorted(category.channels, key=lambda c: c.position)
+        for layout, keys in LAYOUTS.items():
+            if len(children) != len(keys):
+                continue
+            kinds_match = all(
+                isinstance(channel, discord.TextChannel) == (kind == "text")
+                for channel, (_, kind) in zip(children, keys)
+            )
+            if kinds_match:
+                return layout, category, {key: channel for (key, _), channel in zip(keys, children)}
+        return None
+
+    async def _create_idle(self, guild: discord.Guild, layout: str):
+        overwrites = idle_overwrites(guild)
+        category = await guild.create_category(name=POOL_CATEGORY_NAME, overwrites=overwrites)
+
+        def create_child(key: str, kind: str, position: int):
+            kwargs = {"name": f"idle-{key.replace('_', '-')}", "overwrites": overwrites, "position": position}
+            if kind == "text":
+                return category.create_text_channel(**kwargs)
+            return category.create_voice_channel(**kwargs)
+
+        keys = LAYOUTS[layout]
+        results = await gather_bounded(
+            [create_child(key, kind, position) for position, (key, kind) in enumerate(keys)],
+            Config.CHANNEL_CREATE_CONCURRENCY,
+            return_exceptions=True
+        )
+        failures = [r for r in results if isinstance(r, BaseException)]
+        if failures:
+            await self._discard(category, [r for r in results if not isinstance(r, BaseException)])
+            raise failures[0]
+        return category, {key: channel for (key, _), channel in zip(keys, results)}
+
+    async def _refill(self, guild: discord.Guild, layout: str):
+        if layout in self._refilling:
+            return
+        self._refilling.add(layout)
+        try:
+            while self.idle_count(layout) < self.targets[layout]:
+                try:
+                    self._idle[layout].append(await self._create_idle(guild, layout))
+                except Exception as e:
+                    logger.error(f"Could not create an idle {layout} round category: {e}")
+                    return
+        finally:
+            self._refilling.discard(layout)
+
+    def _in_background(self, coro):
+        # Background work: keep it out of the trace of the round that started it
+        task = asyncio.create_task(tracing.detached(coro))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _refill_later(self, guild: discord.Guild, layout: str):
+        self._in_background(self._refill(guild, layout))
+
+    async def _discard(self, category: discord.CategoryChannel, channels: list):
+        await gather_bounded(
+            [channel.delete() for channel in channels],
+            Config.CHANNEL_CREATE_CONCURRENCY,
+            return_exceptions=True
+        )
+        try:
+            await category.delete()
+        except Exception as e:
+            logger.error(f"Error deleting pooled category: {e}")
+
+    async def acquire(self, guild: discord.Guild, layout: str, category_name: str,
+                      category_overwrites: dict, channel_specs: list):
+        """Turn an idle category into a round's: rename everything and apply its overwrites.
+
+        channel_specs is create_round_channels' list of (key, kind, name,
+        overwrites), with None meaning "same as the category". Returns
+        (category, {key: channel}), or None if the pool is empty or the edits
+        failed or took longer than CHANNEL_POOL_ACQUIRE_TIMEOUT; the caller
+        then creates channels the usual way.
+        """
+        if not self._idle[layout]:
+            return None
+        category, channels = self._idle[layout].popleft()
+        self._refill_later(guild, layout)
+
+        edits = [category.edit(name=category_name, overwrites=category_overwrites)]
+        edits += [
+            channels[key].edit(name=name, overwrites=category_overwrites if overwrites is None else overwrites)
+            for key, _, name, overwrites in channel_specs
+        ]
+        # Unlike creates, which all share the guild's channel-create bucket, each
+        # channel edit has its own rate-limit bucket, so they can all go at once
+        try:
+            results = await asyncio.wait_for(
+                asyncio.gather(*edits, return_exceptions=True), Config.CHANNEL_POOL_ACQUIRE_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Pooled {layout} category edits took over {Config.CHANNEL_POOL_ACQUIRE_TIMEOUT:.0f}s "
+                "(rename rate limit?), creating channels instead"
+            )
+            self._in_background(self._discard(category, list(channels.values())))
+            return None
+        failures = [r for r in results if isinstance(r, BaseException)]
+        if failures:
+            logger.error(f"Could not take a pooled {layout} category, creating channels instead: {failures[0]}")
+            await self._discard(category, list(channels.values()))
+            return None
+        return category, channels
+
+    async def release(self, guild: discord.Guild, layout: str,
+                      category: discord.CategoryChannel, channel_ids: dict) -> bool:
+        """Reset a finished round's category and return it to the pool.
+
+        Voice channels are emptied and re-hidden, and the category is hidden
+        again under its current name (no rename; see the module docstring).
+        Text channels are replaced with fresh ones so the next round doesn't
+        inherit the last one's history. Returns False if the pool is already full or the reset
+        failed; the caller should delete the channels instead.
+        """
+        if self.idle_count(layout) >= self.targets[layout]:
+            return False
+        channels = {key: guild.get_channel(channel_ids.get(key)) for key, _ in LAYOUTS[layout]}
+        if any(channel is None or channel.category_id != category.id for channel in channels.values()):
+            return False
+
+        overwrites = idle_overwrites(guild)
+        disconnects = [
+            member.move_to(None)
+            for channel in channels.values() if isinstance(channel, discord.VoiceChannel)
+            for member in channel.members
+        ]
+        await gather_bounded(disconnects, Config.CHANNEL_CREATE_CONCURRENCY, return_exceptions=True)
+
+        def reset(position: int, key: str, kind: str):
+            channel = channels[key]
+            if kind == "text":
+                return category.create_text_channel(
+                    name=f"idle-{key.replace('_', '-')}", overwrites=overwrites, position=position
+                )
+            return channel.edit(overwrites=overwrites)
+
+        results = await gather_bounded(
+            [category.edit(overwrites=overwrites)]
+            + [reset(position, key, kind) for position, (key, kind) in enumerate(LAYOUTS[layout])],
+            Config.CHANNEL_CREATE_CONCURRENCY,
+            return_exceptions=True
+        )
+        failures = [r for r in results if isinstance(r, BaseException)]
+        fresh = {}
+        for (key, kind), result in zip(LAYOUTS[layout], results[1:]):
+            if kind == "text" and not isinstance(result, BaseException):
+                fresh[key] = result
+        if failures:
+            logger.error(f"Could not reset {category.name} for reuse: {failures[0]}")
+            # The caller deletes the category's channels, which now include these
+            return False
+
+        old_text = [channels[key] for key in fresh]
+        await gather_bounded(
+            [channel.delete() for channel in old_text],
+            Config.CHANNEL_CREATE_CONCURRENCY,
+            return_exceptions=True
+        )
+        channels.update(fresh)
+        if self.idle_count(layout) >= self.targets[layout]:
+            # Filled by a refill while this reset was in flight
+            return False
+        self._idle[layout].append((category, channels))
+        return True
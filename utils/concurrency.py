@@ -0,0 +1,31 @@
+"""Small asyncio helpers for fanning out Discord API calls."""
+import asyncio
+import random
+from typing import Awaitable, Iterable, List
+
+import discord
+
+
+async def gather_bounded(aws: Iterable[Awaitable], limit: int, return_exceptions: bool = False) -> List:
+    """Like asyncio.gather, but with at most `limit` awaitables running at once.
+
+    Results come back in input order. py-cord already retries 429s per route;
+    the limit keeps a burst of calls from landing on one bucket all at once.
+    """
+    semaphore = asyncio.Semaphore(max(1, limit))
+
+    async def run(aw: Awaitable):
+        async with semaphore:
+            return await aw
+
+    return await asyncio.gather(*(run(aw) for aw in aws), return_exceptions=return_exceptions)
+
+
+def is_retryable(error: Exception) -> bool:
+    """Whether a failed Discord call is worth retrying: rate limited (429) or a server error."""
+    return isinstance(error, discord.HTTPException) and (error.status == 429 or error.status >= 500)
+
+
+def backoff_delay(attempt: int, base: float) -> float:
+    """Exponential backoff with jitter, so retries from one burst don't land together."""
+    return base * (2 ** attempt) * (1 + random.random())
@@ -0,0 +1,74 @@
+"""Coalescing renderer for messages that are edited on every state change (the lobby).
+
+Callers mark the message dirty as often as they like; at most one render runs
+per window, and the edit is skipped when the rendered embed is identical to
+the last one published. Edits to one message share a rate-limit bucket, so
+this keeps a burst of queue joins from turning into a burst of 429s.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+from typing import Awaitable, Callable, Optional
+
+import discord
+
+from utils import tracing
+
+logger = logging.getLogger('DebateBot.Debounce')
+
+
+def embed_digest(embed: discord.Embed) -> str:
+    return hashlib.sha1(json.dumps(embed.to_dict(), sort_keys=True).encode()).hexdigest()
+
+
+class DebouncedRenderer:
+    """Renders and publishes an embed at most once per window, and only when it changed."""
+
+    def __init__(self, render: Callable[[], discord.Embed],
+                 publish: Callable[[discord.Embed], Awaitable[None]], window: float):
+        self.render = render
+        self.publish = publish
+        self.window = window
+        self.published = 0
+        self.skipped = 0
+        self._dirty = False
+        self._last_digest: Optional[str] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def mark_dirty(self):
+        """Schedule a render; changes made before it runs are coalesced into it."""
+        self._dirty = True
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def mark_published(self, embed: discord.Embed):
+        """Record an embed published outside the renderer (e.g. a freshly sent message)."""
+        self._last_digest = embed_digest(embed)
+
+    async def _run(self):
+        # Coalesces many interactions' changes, so it isn't part of the trace of whichever came first
+        tracing.detach()
+        while self._dirty:
+            await asyncio.sleep(self.window)
+            self._dirty = False
+            await self.flush()
+
+    async def flush(self):
+        """Render now, publishing only if the content changed since the last publish."""
+        embed = self.render()
+        digest = embed_digest(embed)
+        if digest == self._last_digest:
+            self.skipped += 1
+            return
+        try:
+            await self.publish(embed)
+        except Exception as e:
+            logger.error(f"Error publishing render: {e}")
+            return
+        self._last_digest = digest
+        self.published += 1
+
+    def cancel(self):
+        if self._task:
+            self._task.cancel()
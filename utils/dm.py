@@ -0,0 +1,115 @@
+"""Fan-out DM delivery shared by the cogs.
+
+DMs to different users go to different channels (and rate-limit buckets), so
+DMDispatcher sends a batch concurrently, bounded by a worker limit shared
+across every batch in flight. Each batch is deduplicated by user, 429s and
+server errors are retried with backoff, and users whose DMs turn out to be
+closed are remembered for a while so later batches don't spend calls on them.
+Every batch returns a DMReport the caller can show to whoever needs to know.
+"""
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import discord
+
+from config import Config
+from utils.concurrency import backoff_delay, is_retryable
+
+logger = logging.getLogger('DebateBot.DM')
+
+
+@dataclass
+class DMReport:
+    """Outcome of one batch of DMs."""
+    delivered: List = field(default_factory=list)
+    closed: List = field(default_factory=list)      # DMs closed (Forbidden), now or cached
+    failed: List = field(default_factory=list)      # (user, error) for anything else
+    messages: Dict[int, discord.Message] = field(default_factory=dict)  # user id → sent message
+
+    @property
+    def undelivered(self) -> list:
+        return self.closed + [user for user, _ in self.failed]
+
+    def summary(self) -> str:
+        return f"{len(self.delivered)} delivered, {len(self.closed)} closed, {len(self.failed)} failed"
+
+
+class DMDispatcher:
+    """Concurrent DM sender with retries and a cache of users who can't be DMed."""
+
+    def __init__(self, workers: Optional[int] = None, retries: Optional[int] = None,
+                 backoff: Optional[float] = None, closed_ttl: Optional[float] = None):
+        self._semaphore = asyncio.Semaphore(max(1, Config.DM_WORKERS if workers is None else workers))
+        self.retries = Config.DM_RETRIES if retries is None else retries
+        self.backoff = Config.DM_BACKOFF if backoff is None else backoff
+        self.closed_ttl = Config.DM_CLOSED_TTL if closed_ttl is None else closed_ttl
+        self._closed_until: Dict[int, float] = {}  # user id → monotonic expiry
+
+    def is_closed(self, user_id: int) -> bool:
+        expiry = self._closed_until.get(user_id)
+        if expiry is None:
+            return False
+        if expiry <= time.monotonic():
+            del self._closed_until[user_id]
+            return False
+        return True
+
+    def forget_closed(self, user_id: int):
+        """Drop a user from the closed-DMs cache (e.g. they just DMed the bot)."""
+        self._closed_until.pop(user_id, None)
+
+    async def _deliver(self, user, kwargs: dict):
+        """Returns the sent message, or the exception that stopped delivery."""
+        for attempt in range(self.retries + 1):
+            try:
+                async with self._semaphore:
+                    return await user.send(**kwargs)
+            except Exception as e:
+                if attempt == self.retries or not is_retryable(e):
+                    return e
+                await asyncio.sleep(backoff_delay(attempt, self.backoff))
+
+    async def send_many(self, messages: Iterable[Tuple[object, dict]]) -> DMReport:
+        """Send each (user, send() kwargs) pair; a user appearing twice only gets the first."""
+        batch, seen = [], set()
+        report = DMReport()
+        for user, kwargs in messages:
+            if user.id in seen:
+                continue
+            seen.add(user.id)
+            if self.is_closed(user.id):
+                report.closed.append(user)
+            else:
+                batch.append((user, kwargs))
+
+        results = await asyncio.gather(*(self._deliver(user, kwargs) for user, kwargs in batch))
+        for (user, _), result in zip(batch, results):
+            if isinstance(result, discord.Forbidden):
+                self._closed_until[user.id] = time.monotonic() + self.closed_ttl
+                report.closed.append(user)
+            elif isinstance(result, Exception):
+                logger.warning(f"Could not DM {user}: {result}")
+                report.failed.append((user, result))
+            else:
+                report.delivered.append(user)
+                report.messages[user.id] = result
+        return report
+
+    async def send(self, user, **kwargs) -> Optional[discord.Message]:
+        """Send a single DM; returns the message, or None if it wasn't delivered."""
+        report = await self.send_many([(user, kwargs)])
+        return report.messages.get(user.id)
+
+
+_dispatcher: Optional[DMDispatcher] = None
+
+
+def get_dispatcher() -> DMDispatcher:
+    """The process-wide dispatcher, so the worker limit and closed cache are shared."""
+    global _dispatcher
+    if _dispatcher is None:
+        _dispatcher = DMDispatcher()
+    return _dispatcher
@@ -1,8 +1,10 @@
 import discord
 from typing import List
 from utils.models import DebateRound, MatchmakingQueue, RoundType, TeamType, FormatType, Ballot, JudgeRating
+from utils.tracing import traced_methods
 
 
+@traced_methods("create_", kind="embed")
 class EmbedBuilder:
     """Utility class for building Discord embeds."""
 
@@ -510,7 +512,7 @@ class EmbedBuilder:
 
     @staticmethod
     def create_ballot_results_embed(debate_round) -> discord.Embed:
-        """Create full ballot results embed showing winner, all speaker scores, and totals."""
+        """Create full ballot results embed from a FinalizedBallot: winner, speaker scores, totals, margin."""
         ballot = debate_round.ballot
         winner_color = EmbedBuilder.COLOR_GOV if ballot.winner == "Government" else EmbedBuilder.COLOR_OPP
 
@@ -548,7 +550,11 @@ class EmbedBuilder:
             inline=True
         )
 
-        embed.set_footer(text=f"Judged by {ballot.judge.display_name}")
+        top_speaker, _ = ballot.speaker_ranks[0]
+        embed.set_footer(
+            text=f"Judged by {ballot.judge.display_name} · Margin {ballot.margin} · "
+                 f"Top speaker {top_speaker.member.display_name} ({top_speaker.score})"
+        )
         return embed
 
     @staticmethod
@@ -635,6 +641,30 @@ class EmbedBuilder:
         )
         return embed
 
+    @staticmethod
+    def create_voice_move_failures_embed(failures: list) -> discord.Embed:
+        """Create an embed listing members the bot couldn't move, as (member, channel, reason)."""
+        lines = [f"{member.mention} → {channel.mention}: {reason}" for member, channel, reason in failures]
+        embed = discord.Embed(
+            title="Some Members Couldn't Be Moved",
+            description="\n".join(lines) + "\n\nPlease join your voice channel manually.",
+            color=EmbedBuilder.COLOR_WARNING
+        )
+        return embed
+
+    @staticmethod
+    def create_dm_delivery_report_embed(subject: str, report) -> discord.Embed:
+        """Create an embed listing who a batch of DMs (a utils.dm.DMReport) didn't reach."""
+        lines = [f"{user.mention}: DMs closed" for user in report.closed]
+        lines += [f"{user.mention}: delivery failed" for user, _ in report.failed]
+        embed = discord.Embed(
+            title=f"Undelivered DMs — {subject}",
+            description="\n".join(lines),
+            color=EmbedBuilder.COLOR_WARNING
+        )
+        embed.set_footer(text=report.summary())
+        return embed
+
     @staticmethod
     def create_round_confirmed_dm_embed(debate_round) -> discord.Embed:
         """Create a DM embed sent to all participants when round channels are ready."""
@@ -908,6 +938,8 @@ class EmbedBuilder:
             record_line = " | ".join(parts) if parts else ""
 
             lines = [f"**Rounds:** {debater['total_rounds']}"]
+            if debater.get("elo") is not None:
+                lines.append(f"**Elo:** {debater['elo']}")
             if record_line:
                 lines.append(record_line)
             if debater["avg_score"]:
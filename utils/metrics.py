@@ -0,0 +1,338 @@
+"""In-process metrics (counters, gauges, histograms) and a Prometheus text endpoint.
+
+Everything the bot reports is declared at the bottom of this module, so the
+/metrics output is documented in one place. Updating a series is a dict
+lookup and an addition (histograms add a bisect), cheap enough to leave on.
+Gauges that mirror state the bot already keeps (queue depths, rounds, timer
+backlog) take a function instead of being updated, and are only read when
+scraped. The HTTP endpoint is off unless Config.METRICS_PORT is set and binds
+to Config.METRICS_HOST (localhost by default).
+"""
+import bisect
+import functools
+import logging
+import math
+import time
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+import discord
+
+from config import Config
+
+logger = logging.getLogger('DebateBot.Metrics')
+
+# Latency buckets (seconds)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class Registry:
+    """A set of metrics rendered together in the Prometheus text format."""
+
+    def __init__(self):
+        self._metrics: Dict[str, '_Metric'] = {}
+
+    def register(self, metric: '_Metric'):
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+
+    def get(self, name: str) -> Optional['_Metric']:
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics.values():
+            lines += metric.render()
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 registry: Optional[Registry] = None):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._series: Dict[Tuple, object] = {}
+        (REGISTRY if registry is None else registry).register(self)
+
+    def labels(self, *values):
+        """The series for these label values, given in labelnames order."""
+        series = self._series.get(values)
+        if series is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name} takes labels {self.labelnames}, got {values!r}")
+            series = self._series[values] = self._new_series()
+        return series
+
+    def _new_series(self):
+        raise NotImplementedError
+
+    def _labels_text(self, values: Tuple, extra: str = "") -> str:
+        pairs = [f'{name}="{_escape(value)}"' for name, value in zip(self.labelnames, values)]
+        if extra:
+            pairs.append(extra)
+        return "{" + ",".join(pairs) + "}" if pairs else ""
+
+    def _render_series(self, values: Tuple, series) -> list:
+        raise NotImplementedError
+
+    def render(self) -> list:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        for values, series in list(self._series.items()):
+            try:
+                lines += self._render_series(values, series)
+            except Exception as e:
+                logger.error(f"Could not read {self.name}{self._labels_text(values)}: {e}")
+        return lines
+
+
+class _CounterSeries:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0):
+        self.value += amount
+
+
+class Counter(_Metric):
+    """A monotonically increasing total."""
+    kind = "counter"
+
+    def _new_series(self):
+        return _CounterSeries()
+
+    def inc(self, amount: float = 1.0):
+        self.labels().inc(amount)
+
+    def _render_series(self, values, series) -> list:
+        return [f"{self.name}{self._labels_text(values)} {_format_value(series.value)}"]
+
+
+class _GaugeSeries:
+    __slots__ = ("value", "function")
+
+    def __init__(self):
+        self.value = 0.0
+        self.function: Optional[Callable[[], float]] = None
+
+    def set(self, value: float):
+        self.value = value
+
+    def inc(self, amount: float = 1.0):
+        self.value += amount
+
+    def dec(self, amount: float = 1.0):
+        self.value -= amount
+
+    def set_function(self, function: Callable[[], float]):
+        """Read the value from function() at scrape time instead."""
+        self.function = function
+
+    def get(self) -> float:
+        return self.function() if self.function else self.value
+
+
+class Gauge(_Metric):
+    """A value that goes up and down, set directly or read from a function when scraped."""
+    kind = "gauge"
+
+    def _new_series(self):
+        return _GaugeSeries()
+
+    def set(self, value: float):
+        self.labels().set(value)
+
+    def set_function(self, function: Callable[[], float]):
+        self.labels().set_function(function)
+
+    def _render_series(self, values, series) -> list:
+        return [f"{self.name}{self._labels_text(values)} {_format_value(series.get())}"]
+
+
+class _HistogramSeries:
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # per bucket, not cumulative; the last is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class Histogram(_Metric):
+    """Observations counted into cumulative buckets, with their sum and count."""
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS, registry: Optional[Registry] = None):
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames, registry)
+
+    def _new_series(self):
+        return _HistogramSeries(self.buckets)
+
+    def observe(self, value: float):
+        self.labels().observe(value)
+
+    def _render_series(self, values, series) -> list:
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets + (math.inf,), series.counts):
+            cumulative += count
+            le = f'le="{_format_value(bound)}"'
+            lines.append(f"{self.name}_bucket{self._labels_text(values, le)} {cumulative}")
+        lines.append(f"{self.name}_sum{self._labels_text(values)} {_format_value(series.sum)}")
+        lines.append(f"{self.name}_count{self._labels_text(values)} {series.count}")
+        return lines
+
+
+def timed(histogram: Histogram):
+    """Decorator: observe each call's duration (failures included) under the function's name.
+
+    For async functions, on a histogram with a single label.
+    """
+    def decorator(func):
+        series = histogram.labels(func.__name__)
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                series.observe(time.perf_counter() - started)
+        return wrapper
+    return decorator
+
+
+# ─── The bot's metrics ────────────────────────────────────────────
+
+COMMAND_SECONDS = Histogram(
+    "debatebot_command_seconds", "Slash command handling time, by command.", ["command"]
+)
+COMMAND_ERRORS = Counter(
+    "debatebot_command_errors_total", "Slash commands that ended in an error, by command.", ["command"]
+)
+API_SECONDS = Histogram(
+    "debatebot_discord_api_seconds",
+    "Discord API request time by route, including py-cord's retries and rate-limit waits.",
+    ["method", "route"]
+)
+API_ERRORS = Counter(
+    "debatebot_discord_api_errors_total", "Discord API requests that failed, by route and status.",
+    ["method", "route", "status"]
+)
+API_RATE_LIMITS = Counter(
+    "debatebot_discord_rate_limits_total", "429 responses py-cord waited out, global ones included."
+)
+API_GLOBAL_RATE_LIMITS = Counter(
+    "debatebot_discord_global_rate_limits_total", "429 responses py-cord waited out that hit the global limit."
+)
+API_RATE_LIMIT_WAIT = Counter(
+    "debatebot_discord_rate_limit_wait_seconds_total", "Time spent waiting out 429 responses."
+)
+DB_QUERY_SECONDS = Histogram(
+    "debatebot_db_query_seconds", "Database call time, by utils.database function.", ["function"]
+)
+QUEUE_DEPTH = Gauge("debatebot_queue_depth", "Members waiting in each queue.", ["format", "role"])
+PENDING_ROUNDS = Gauge("debatebot_pending_rounds", "Rounds drawn and waiting on participant confirmation.")
+ACTIVE_ROUNDS = Gauge("debatebot_active_rounds", "Rounds in progress.")
+TIMERS_PENDING = Gauge("debatebot_timers_pending", "Timers waiting on the timer wheel.")
+TIMER_LATENESS = Histogram(
+    "debatebot_timer_lateness_seconds", "How long after its deadline each timer fired.",
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 60.0)
+)
+
+
+# ─── Discord API instrumentation ─────────────────────────────────
+
+class _RateLimitCounter(logging.Handler):
+    """Counts py-cord's rate-limit warnings: 429s are retried inside py-cord, so its log is where they surface.
+
+    py-cord logs the per-bucket line for every 429, then the global line as
+    well when the limit was global, so each line feeds its own counter.
+    """
+
+    def __init__(self):
+        super().__init__(level=logging.WARNING)
+
+    def emit(self, record: logging.LogRecord):
+        if not isinstance(record.msg, str):
+            return
+        if record.msg.startswith("Global rate limit has been hit"):
+            API_GLOBAL_RATE_LIMITS.inc()
+            return
+        if record.msg.startswith("We are being rate limited"):
+            API_RATE_LIMITS.inc()
+            if record.args:
+                API_RATE_LIMIT_WAIT.inc(float(record.args[0]))
+
+
+def instrument_http(http):
+    """Time every request a py-cord HTTPClient makes, by route template, and count its 429s."""
+    request = http.request
+
+    async def timed_request(route, **kwargs):
+        started = time.perf_counter()
+        try:
+            return await request(route, **kwargs)
+        except discord.HTTPException as e:
+            API_ERRORS.labels(route.method, route.path, str(e.status)).inc()
+            raise
+        finally:
+            API_SECONDS.labels(route.method, route.path).observe(time.perf_counter() - started)
+
+    http.request = timed_request
+    http_logger = logging.getLogger("discord.http")
+    if not any(isinstance(handler, _RateLimitCounter) for handler in http_logger.handlers):
+        http_logger.addHandler(_RateLimitCounter())
+
+
+# ─── /metrics endpoint ───────────────────────────────────────────
+
+async def start_metrics_server(host: Optional[str] = None, port: Optional[int] = None,
+                               registry: Optional[Registry] = None):
+    """Serve GET /metrics in the Prometheus text format; returns the runner (call cleanup() to stop)."""
+    from aiohttp import web
+
+    registry = REGISTRY if registry is None else registry
+    host = Config.METRICS_HOST if host is None else host
+    port = Config.METRICS_PORT if port is None else port
+
+    async def metrics(request):
+        return web.Response(
+            body=registry.render().encode(),
+            headers={"Content-Type": "text/plain; version=0.0.4; charset=utf-8"}
+        )
+
+    app = web.Application()
+    app.router.add_get("/metrics", metrics)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, host, port).start()
+    logger.info(f"Serving metrics on http://{host}:{port}/metrics")
+    return runner
@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import Any, List, Optional
+from typing import Any, Callable, List, Optional, Tuple
 from enum import Enum
 import discord
 
@@ -56,7 +56,7 @@ class Party:
         return len(self.members)
 
 
-@dataclass
+@dataclass(slots=True)
 class DebateTeam:
     """Represents a debate team (Gov or Opp)."""
     team_name: str  # "Government" or "Opposition"
@@ -105,7 +105,7 @@ class DebateTeam:
         return positions[index] if index < len(positions) else f"Speaker {index + 1}"
 
 
-@dataclass
+@dataclass(slots=True)
 class JudgePanel:
     """Represents the judging panel."""
     chair: Optional[discord.Member] = None
@@ -143,7 +143,7 @@ class JudgePanel:
         return (1 if self.chair else 0) + len(self.panelists)
 
 
-@dataclass
+@dataclass(slots=True)
 class SpeakerScore:
     """A single speaker's score in a ballot."""
     member: discord.Member
@@ -151,9 +151,9 @@ class SpeakerScore:
     score: int  # 50-100
 
 
-@dataclass
+@dataclass(slots=True)
 class Ballot:
-    """A judge's ballot for a round."""
+    """A judge's ballot for a round, as entered. freeze() it before storing or scoring."""
     judge: discord.Member
     winner: str  # "Government" or "Opposition"
     gov_scores: List[SpeakerScore] = field(default_factory=list)
@@ -161,39 +161,89 @@ class Ballot:
     gov_reply: Optional[SpeakerScore] = None  # Reply speech score (25-50), AP only
     opp_reply: Optional[SpeakerScore] = None
 
-    @property
-    def gov_total(self) -> int:
-        total = sum(s.score for s in self.gov_scores)
-        if self.gov_reply:
-            total += self.gov_reply.score
-        return total
-
-    @property
-    def opp_total(self) -> int:
-        total = sum(s.score for s in self.opp_scores)
-        if self.opp_reply:
-            total += self.opp_reply.score
-        return total
-
-    def validate(self) -> Optional[str]:
-        """Returns error message if invalid, None if valid."""
+    def freeze(self) -> 'FinalizedBallot':
+        """Snapshot the ballot, computing totals, margin and speaker ranks once."""
+        gov_total = sum(s.score for s in self.gov_scores) + (self.gov_reply.score if self.gov_reply else 0)
+        opp_total = sum(s.score for s in self.opp_scores) + (self.opp_reply.score if self.opp_reply else 0)
+        speeches = sorted(self.gov_scores + self.opp_scores, key=lambda s: -s.score)
+        speaker_ranks = []
+        for i, speech in enumerate(speeches):
+            # Tied scores share a rank (1, 2, 2, 4)
+            rank = speaker_ranks[-1][1] if i and speech.score == speeches[i - 1].score else i + 1
+            speaker_ranks.append((speech, rank))
+        return FinalizedBallot(
+            judge=self.judge, winner=self.winner,
+            gov_scores=tuple(self.gov_scores), opp_scores=tuple(self.opp_scores),
+            gov_reply=self.gov_reply, opp_reply=self.opp_reply,
+            gov_total=gov_total, opp_total=opp_total,
+            margin=gov_total - opp_total if self.winner == "Government" else opp_total - gov_total,
+            speaker_ranks=tuple(speaker_ranks),
+        )
+
+
+class BallotErrorCode(Enum):
+    """Why a ballot failed validation."""
+    SCORE_RANGE = "score_range"        # substantive speech outside 50-100
+    REPLY_RANGE = "reply_range"        # reply speech outside 25-50
+    REPLY_WHIP = "reply_whip"          # a Whip gave the reply
+    WINNER_TOTAL = "winner_total"      # the winner's total isn't higher
+
+
+@dataclass(frozen=True, slots=True)
+class BallotIssue:
+    """A validation failure: a code to branch on and a message for the judge."""
+    code: BallotErrorCode
+    message: str
+
+
+@dataclass(frozen=True, slots=True)
+class FinalizedBallot:
+    """An immutable AP/1v1 ballot with its derived numbers computed up front (see Ballot.freeze)."""
+    judge: discord.Member
+    winner: str
+    gov_scores: Tuple[SpeakerScore, ...]
+    opp_scores: Tuple[SpeakerScore, ...]
+    gov_reply: Optional[SpeakerScore]
+    opp_reply: Optional[SpeakerScore]
+    gov_total: int
+    opp_total: int
+    margin: int                   # winner's total minus loser's; not positive on an invalid ballot
+    speaker_ranks: Tuple[Tuple[SpeakerScore, int], ...]  # substantive speeches, best first
+
+    def check(self) -> Optional[BallotIssue]:
+        """The first problem with the ballot, or None if it's valid.
+
+        Checked in the order judges have always been told about them: every
+        substantive speech, then the replies, then the winner's total.
+        """
         for s in self.gov_scores + self.opp_scores:
             if not (50 <= s.score <= 100):
-                return f"Score for {s.position_name} must be between 50-100 (got {s.score})."
-        for reply, side in [(self.gov_reply, "Government"), (self.opp_reply, "Opposition")]:
+                return BallotIssue(
+                    BallotErrorCode.SCORE_RANGE,
+                    f"Score for {s.position_name} must be between 50-100 (got {s.score})."
+                )
+        for side, reply in (("Government", self.gov_reply), ("Opposition", self.opp_reply)):
             if reply:
                 if not (25 <= reply.score <= 50):
-                    return f"Reply score for {side} must be between 25-50 (got {reply.score})."
+                    return BallotIssue(
+                        BallotErrorCode.REPLY_RANGE,
+                        f"Reply score for {side} must be between 25-50 (got {reply.score})."
+                    )
                 if "Whip" in reply.position_name:
-                    return f"{side} reply speaker cannot be a Whip."
-        if self.winner == "Government" and self.gov_total <= self.opp_total:
-            return f"Government won but their total ({self.gov_total}) is not higher than Opposition ({self.opp_total})."
-        if self.winner == "Opposition" and self.opp_total <= self.gov_total:
-            return f"Opposition won but their total ({self.opp_total}) is not higher than Government ({self.gov_total})."
+                    return BallotIssue(BallotErrorCode.REPLY_WHIP, f"{side} reply speaker cannot be a Whip.")
+        if self.margin <= 0:
+            loser = "Opposition" if self.winner == "Government" else "Government"
+            winner_total, loser_total = self.gov_total, self.opp_total
+            if self.winner == "Opposition":
+                winner_total, loser_total = loser_total, winner_total
+            return BallotIssue(
+                BallotErrorCode.WINNER_TOTAL,
+                f"{self.winner} won but their total ({winner_total}) is not higher than {loser} ({loser_total})."
+            )
         return None
 
 
-@dataclass
+@dataclass(slots=True)
 class JudgeRating:
     """A debater's rating of a judge."""
     debater: discord.Member
@@ -216,7 +266,7 @@ class BallotDraft:
     gov_reply_score: Optional[SpeakerScore] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class BPBallot:
     """A judge's ballot for a BP round (rankings + per-speaker scores)."""
     judge: discord.Member
@@ -243,9 +293,14 @@ class BPBallotDraft:
     co_scores: List['SpeakerScore'] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class DebateRound:
-    """Represents a complete debate round."""
+    """Represents a complete debate round.
+
+    A round given a shared `index` dict (the matchmaking cog's, while the
+    round is active) records member_id → (round_id, role) in it for every
+    participant, and keeps it current through swap_members.
+    """
     round_id: int
     round_type: RoundType
     government: DebateTeam
@@ -262,7 +317,7 @@ class DebateRound:
     format_label: Optional[str] = None
     category_id: Optional[int] = None
     channel_ids: dict = field(default_factory=dict)
-    ballot: Optional['Ballot'] = None
+    ballot: Optional['FinalizedBallot'] = None
     bp_ballot: Optional['BPBallot'] = None
     cg: Optional['DebateTeam'] = None                       # BP: Closing Government
     co: Optional['DebateTeam'] = None                       # BP: Closing Opposition
@@ -270,6 +325,10 @@ class DebateRound:
     rated_debater_ids: set = field(default_factory=set)
     observers: List[discord.Member] = field(default_factory=list)
     db_round_id: Optional[int] = None
+    # Prep timer state (the timer itself lives in the scheduler under ("prep", round_id))
+    prep_end_timestamp: Optional[int] = None  # unix time prep ends, once motions are out
+    prep_channel_id: Optional[int] = None     # channel the end-of-prep notice goes to, once prep starts
+    index: Optional[dict] = field(default=None, repr=False, compare=False)
 
     def get_all_participants(self) -> List[discord.Member]:
         """Get all participants in the round."""
@@ -283,6 +342,44 @@ class DebateRound:
         participants.extend(self.judges.get_all_judges())
         return participants
 
+    def get_member_roles(self) -> dict:
+        """Map each participant's id to their role: gov/opp/cg/co, chair or panelist."""
+        roles = {}
+        for role, team in (("gov", self.government), ("opp", self.opposition), ("cg", self.cg), ("co", self.co)):
+            if team:
+                for member in team.members:
+                    roles[member.id] = role
+        if self.judges.chair:
+            roles[self.judges.chair.id] = "chair"
+        for panelist in self.judges.panelists:
+            roles[panelist.id] = "panelist"
+        return roles
+
+    def attach_index(self, index: dict):
+        """Start recording this round's participants in a shared index."""
+        self.index = index
+        for member_id, role in self.get_member_roles().items():
+            index[member_id] = (self.round_id, role)
+
+    def detach_index(self):
+        """Remove this round's entries from its index (and stop maintaining it)."""
+        if self.index is None:
+            return
+        for member_id in self.get_member_roles():
+            if self.index.get(member_id, (None,))[0] == self.round_id:
+                del self.index[member_id]
+        self.index = None
+
+    def get_role(self, member_id: int) -> Optional[str]:
+        """A participant's role in this round, or None. O(1) once the round is indexed."""
+        if self.index is not None:
+            entry = self.index.get(member_id)
+            return entry[1] if entry and entry[0] == self.round_id else None
+        return self.get_member_roles().get(member_id)
+
+    def is_judge(self, member_id: int) -> bool:
+        return self.get_role(member_id) in ("chair", "panelist")
+
     def get_original_queue_roles(self) -> dict:
         """Map each member to 'debater' or 'judge' for re-queuing on cancel."""
         roles = {}
@@ -317,6 +414,11 @@ class DebateRound:
         self._add_member_to_location(member1, loc2)
         self._add_member_to_location(member2, loc1)
 
+        if self.index is not None:
+            # A judge swap can move the chair, so refresh every judge's entry too
+            roles = self.get_member_roles()
+            for member in [member1, member2] + self.judges.get_all_judges():
+                self.index[member.id] = (self.round_id, roles[member.id])
         return True
 
     def _find_member_location(self, member: discord.Member) -> Optional[tuple]:
@@ -358,74 +460,104 @@ class DebateRound:
             self.judges.add_judge(member)
 
 
-@dataclass
+@dataclass(eq=False)
 class MatchmakingQueue:
-    """Manages the matchmaking queue with separate debater and judge queues."""
+    """Manages the matchmaking queue with separate debater and judge queues.
+
+    Members live in insertion-ordered dicts keyed by member id, so FIFO order
+    is kept and every membership check is O(1). Queues given a shared `index`
+    dict also record member_id → queue in it, which lets the cog find a
+    member's queue across every format with one lookup. `on_change`, if set,
+    is called with (member_id, joined) whenever a member joins (or moves to
+    the back of a line) or leaves.
+    """
     format_type: FormatType = FormatType.AP
-    debaters: List[discord.Member] = field(default_factory=list)
-    judges: List[discord.Member] = field(default_factory=list)
+    index: Optional[dict] = field(default=None, repr=False)
+    on_change: Optional[Callable[[int, bool], None]] = field(default=None, repr=False)
+    _debaters: dict = field(default_factory=dict, init=False, repr=False)  # member_id → Member
+    _judges: dict = field(default_factory=dict, init=False, repr=False)    # member_id → Member
+    _roles: dict = field(default_factory=dict, init=False, repr=False)     # member_id → "debater"/"judge"
 
-    def add_debater(self, user: discord.Member) -> bool:
-        """Add a user to the debater queue."""
-        # Remove from judge queue if they're there
-        if user in self.judges:
-            self.judges.remove(user)
+    @property
+    def debaters(self) -> List[discord.Member]:
+        """Queued debaters in FIFO order."""
+        return list(self._debaters.values())
 
-        if user not in self.debaters:
-            self.debaters.append(user)
-            return True
-        return False
+    @property
+    def judges(self) -> List[discord.Member]:
+        """Queued judges in FIFO order."""
+        return list(self._judges.values())
 
-    def add_judge(self, user: discord.Member) -> bool:
-        """Add a user to the judge queue."""
-        # Remove from debater queue if they're there
-        if user in self.debaters:
-            self.debaters.remove(user)
+    def _add(self, user: discord.Member, role: str) -> bool:
+        if self._roles.get(user.id) == role:
+            return False
+        # Switching roles moves the user to the back of the other line
+        self._judges.pop(user.id, None)
+        self._debaters.pop(user.id, None)
+        (self._debaters if role == "debater" else self._judges)[user.id] = user
+        self._roles[user.id] = role
+        if self.index is not None:
+            self.index[user.id] = self
+        if self.on_change:
+            self.on_change(user.id, True)
+        return True
 
-        if user not in self.judges:
-            self.judges.append(user)
-            return True
-        return False
+    def add_debater(self, user: discord.Member) -> bool:
+        """Add a user to the debater queue (moving them out of the judge queue)."""
+        return self._add(user, "debater")
+
+    def add_judge(self, user: discord.Member) -> bool:
+        """Add a user to the judge queue (moving them out of the debater queue)."""
+        return self._add(user, "judge")
 
     def remove_user(self, user: discord.Member) -> bool:
         """Remove a user from either queue."""
-        removed = False
-        if user in self.debaters:
-            self.debaters.remove(user)
-            removed = True
-        if user in self.judges:
-            self.judges.remove(user)
-            removed = True
-        return removed
+        if self._roles.pop(user.id, None) is None:
+            return False
+        self._debaters.pop(user.id, None)
+        self._judges.pop(user.id, None)
+        if self.index is not None and self.index.get(user.id) is self:
+            del self.index[user.id]
+        if self.on_change:
+            self.on_change(user.id, False)
+        return True
 
     def is_in_queue(self, user: discord.Member) -> bool:
         """Check if user is in any queue."""
-        return user in self.debaters or user in self.judges
+        return user.id in self._roles
+
+    def has_debater(self, user: discord.Member) -> bool:
+        """Check if user is queued as a debater."""
+        return user.id in self._debaters
 
     def get_user_role(self, user: discord.Member) -> Optional[str]:
         """Get the role of a user in the queue (debater or judge)."""
-        if user in self.debaters:
-            return "debater"
-        elif user in self.judges:
-            return "judge"
-        return None
+        return self._roles.get(user.id)
 
     def clear(self):
         """Clear both queues."""
-        self.debaters.clear()
-        self.judges.clear()
+        if self.index is not None:
+            for member_id in self._roles:
+                if self.index.get(member_id) is self:
+                    del self.index[member_id]
+        if self.on_change:
+            for member_id in self._roles:
+                self.on_change(member_id, False)
+        self._debaters.clear()
+        self._judges.clear()
+        self._roles.clear()
 
     def size(self) -> int:
         """Get the total queue size (debaters + judges)."""
-        return len(self.debaters) + len(self.judges)
+        return len(self._roles)
 
     def debater_count(self) -> int:
         """Get the number of debaters in queue."""
-        return len(self.debaters)
+        return len(self._debaters)
 
     def judge_count(self) -> int:
         """Get the number of judges in queue."""
-        return len(self.judges)
+        return len(self._judges)
 
     def get_threshold_type(self, max_party_size: int = 1) -> Optional[RoundType]:
         """Determine the round type based on current queue composition.
@@ -0,0 +1,158 @@
+"""Round snapshots for the live-state journal (see utils.database live_* tables).
+
+round_state() flattens a DebateRound into JSON-friendly data, with members
+stored by id; restore_round() rebuilds it, resolving ids back to members.
+Anything a restart can't carry over (open modals, ballot drafts, message
+objects) is left out; the cogs store the message ids they need under "extra".
+"""
+from typing import Callable, Optional
+
+from utils.models import (
+    Ballot, BPBallot, DebateRound, DebateTeam, FinalizedBallot, JudgePanel, JudgeRating,
+    RoundType, SpeakerScore, TeamType,
+)
+
+
+class UnresolvedMember(Exception):
+    """A snapshot refers to a member who is no longer in the guild."""
+
+
+def _team_state(team: Optional[DebateTeam]) -> Optional[dict]:
+    if team is None:
+        return None
+    return {"team_name": team.team_name, "team_type": team.team_type.value, "members": [m.id for m in team.members]}
+
+
+def _score_state(score: Optional[SpeakerScore]) -> Optional[list]:
+    return None if score is None else [score.member.id, score.position_name, score.score]
+
+
+def _ballot_state(ballot: Optional[FinalizedBallot]) -> Optional[dict]:
+    if ballot is None:
+        return None
+    return {
+        "judge": ballot.judge.id,
+        "winner": ballot.winner,
+        "gov_scores": [_score_state(s) for s in ballot.gov_scores],
+        "opp_scores": [_score_state(s) for s in ballot.opp_scores],
+        "gov_reply": _score_state(ballot.gov_reply),
+        "opp_reply": _score_state(ballot.opp_reply),
+    }
+
+
+def _bp_ballot_state(ballot: Optional[BPBallot]) -> Optional[dict]:
+    if ballot is None:
+        return None
+    return {
+        "judge": ballot.judge.id,
+        "rankings": ballot.rankings,
+        "team_scores": {key: [_score_state(s) for s in scores] for key, scores in ballot.team_scores.items()},
+    }
+
+
+def round_state(debate_round: DebateRound, pending: bool = False, extra: Optional[dict] = None) -> dict:
+    """Snapshot a round. pending marks a round still waiting on participant confirmation."""
+    return {
+        "round_id": debate_round.round_id,
+        "round_type": debate_round.round_type.value,
+        "format_label": debate_round.format_label,
+        "pending": pending,
+        "confirmed": debate_round.confirmed,
+        "government": _team_state(debate_round.government),
+        "opposition": _team_state(debate_round.opposition),
+        "cg": _team_state(debate_round.cg),
+        "co": _team_state(debate_round.co),
+        "chair": debate_round.judges.chair.id if debate_round.judges.chair else None,
+        "panelists": [m.id for m in debate_round.judges.panelists],
+        "motion": debate_round.motion,
+        "infoslide": debate_round.infoslide,
+        "motions": debate_round.motions,
+        "motion_infoslides": debate_round.motion_infoslides,
+        "gov_veto": debate_round.gov_veto,
+        "opp_veto": debate_round.opp_veto,
+        "debated_motion_index": debate_round.debated_motion_index,
+        "category_id": debate_round.category_id,
+        "channel_ids": debate_round.channel_ids,
+        "ballot": _ballot_state(debate_round.ballot),
+        "bp_ballot": _bp_ballot_state(debate_round.bp_ballot),
+        "judge_ratings": [[r.debater.id, r.score, r.feedback] for r in debate_round.judge_ratings],
+        "rated_debater_ids": sorted(debate_round.rated_debater_ids),
+        "observers": [m.id for m in debate_round.observers],
+        "db_round_id": debate_round.db_round_id,
+        "prep_end_timestamp": debate_round.prep_end_timestamp,
+        "prep_channel_id": debate_round.prep_channel_id,
+        "extra": extra or {},
+    }
+
+
+def restore_round(state: dict, get_member: Callable[[int], object]) -> DebateRound:
+    """Rebuild a round from round_state(); raises UnresolvedMember if a participant is gone.
+
+    Observers who left are dropped rather than failing the whole round.
+    """
+    def member(member_id: int):
+        found = get_member(member_id)
+        if found is None:
+            raise UnresolvedMember(member_id)
+        return found
+
+    def team(data: Optional[dict]) -> Optional[DebateTeam]:
+        if data is None:
+            return None
+        return DebateTeam(
+            team_name=data["team_name"], team_type=TeamType(data["team_type"]),
+            members=[member(i) for i in data["members"]]
+        )
+
+    def score(data: Optional[list]) -> Optional[SpeakerScore]:
+        return None if data is None else SpeakerScore(member=member(data[0]), position_name=data[1], score=data[2])
+
+    ballot = None
+    if state["ballot"]:
+        b = state["ballot"]
+        ballot = Ballot(
+            judge=member(b["judge"]), winner=b["winner"],
+            gov_scores=[score(s) for s in b["gov_scores"]], opp_scores=[score(s) for s in b["opp_scores"]],
+            gov_reply=score(b["gov_reply"]), opp_reply=score(b["opp_reply"]),
+        ).freeze()
+    bp_ballot = None
+    if state["bp_ballot"]:
+        b = state["bp_ballot"]
+        bp_ballot = BPBallot(
+            judge=member(b["judge"]), rankings=b["rankings"],
+            team_scores={key: [score(s) for s in scores] for key, scores in b["team_scores"].items()},
+        )
+
+    return DebateRound(
+        round_id=state["round_id"],
+        round_type=RoundType(state["round_type"]),
+        government=team(state["government"]),
+        opposition=team(state["opposition"]),
+        judges=JudgePanel(
+            chair=member(state["chair"]) if state["chair"] is not None else None,
+            panelists=[member(i) for i in state["panelists"]],
+        ),
+        motion=state["motion"],
+        infoslide=state["infoslide"],
+        motions=state["motions"],
+        motion_infoslides=state["motion_infoslides"],
+        gov_veto=state["gov_veto"],
+        opp_veto=state["opp_veto"],
+        debated_motion_index=state["debated_motion_index"],
+        confirmed=state["confirmed"],
+        format_label=state["format_label"],
+        category_id=state["category_id"],
+        channel_ids=state["channel_ids"],
+        ballot=ballot,
+        bp_ballot=bp_ballot,
+        cg=team(state["cg"]),
+        co=team(state["co"]),
+        judge_ratings=[
+            JudgeRating(debater=member(i), score=s, feedback=f) for i, s, f in state["judge_ratings"]
+        ],
+        rated_debater_ids=set(state["rated_debater_ids"]),
+        observers=[m for m in map(get_member, state["observers"]) if m is not None],
+        db_round_id=state["db_round_id"],
+        prep_end_timestamp=state["prep_end_timestamp"],
+        prep_channel_id=state.get("prep_channel_id"),
+    )
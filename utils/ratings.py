@@ -0,0 +1,98 @@
+"""Elo rating engine for debaters.
+
+Every result is treated as a ranking of teams: AP/1v1 is a two-team ranking
+taken from rounds.winner, BP a four-team ranking from bp_rankings. Each pair of
+teams plays a virtual Elo game on their team-averaged ratings and every member
+of a team receives the team's delta. With two teams this is plain team-averaged
+Elo; with more, K is split across the n-1 opponents so one BP round moves a
+rating about as far as one AP round.
+"""
+import json
+import logging
+from itertools import groupby
+from typing import Iterable, Optional, Tuple
+
+from config import Config
+
+logger = logging.getLogger('DebateBot.Ratings')
+
+
+def expected_score(rating: float, opponent: float) -> float:
+    """Probability that `rating` beats `opponent` under the Elo model."""
+    return 1.0 / (1.0 + 10 ** ((opponent - rating) / 400.0))
+
+
+def team_ranks(winner: Optional[str], bp_rankings: Optional[dict]) -> Optional[dict]:
+    """team_key → finishing place (1 = best) for a logged result, or None if there is no result."""
+    if bp_rankings:
+        ranks = {team: rank for team, rank in bp_rankings.items() if rank}
+        return ranks if len(ranks) >= 2 else None
+    if winner == "Government":
+        return {"gov": 1, "opp": 2}
+    if winner == "Opposition":
+        return {"gov": 2, "opp": 1}
+    return None
+
+
+def rating_deltas(teams: dict, ranks: dict, ratings: dict, k: float = None) -> dict:
+    """Rating change per participant for one result.
+
+    teams:   team_key → list of participant ids
+    ranks:   team_key → finishing place, as returned by team_ranks()
+    ratings: participant id → current rating (unknown ids start at Config.ELO_DEFAULT)
+    """
+    k = Config.ELO_K_FACTOR if k is None else k
+    ranked = [team for team, members in teams.items() if members and team in ranks]
+    if len(ranked) < 2:
+        return {}
+
+    average = {
+        team: sum(ratings.get(pid, Config.ELO_DEFAULT) for pid in teams[team]) / len(teams[team])
+        for team in ranked
+    }
+    k_pair = k / (len(ranked) - 1)
+
+    deltas = {}
+    for team in ranked:
+        change = 0.0
+        for other in ranked:
+            if other == team:
+                continue
+            if ranks[team] < ranks[other]:
+                actual = 1.0
+            elif ranks[team] == ranks[other]:
+                actual = 0.5
+            else:
+                actual = 0.0
+            change += k_pair * (actual - expected_score(average[team], average[other]))
+        for pid in teams[team]:
+            deltas[pid] = change
+    return deltas
+
+
+def replay(rows: Iterable[tuple], ratings: Optional[dict] = None) -> Tuple[dict, int]:
+    """Recompute ratings over a whole history in a single pass.
+
+    rows are (round_id, winner, bp_rankings_json, participant_id, team_key)
+    tuples ordered by round_id, one per substantive speech. Returns the final
+    ratings and the number of rounds that had a result to rate.
+    """
+    ratings = {} if ratings is None else ratings
+    rated = 0
+    for _, round_rows in groupby(rows, key=lambda row: row[0]):
+        round_rows = list(round_rows)
+        winner, bp_rankings = round_rows[0][1], round_rows[0][2]
+        ranks = team_ranks(winner, json.loads(bp_rankings) if bp_rankings else None)
+        if ranks is None:
+            continue
+
+        teams = {}
+        for *_, participant_id, team_key in round_rows:
+            members = teams.setdefault(team_key, [])
+            if participant_id not in members:
+                members.append(participant_id)
+
+        for participant_id, delta in rating_deltas(teams, ranks, ratings).items():
+            ratings[participant_id] = ratings.get(participant_id, Config.ELO_DEFAULT) + delta
+        rated += 1
+    return ratings, rated
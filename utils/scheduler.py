@@ -0,0 +1,162 @@
+"""A hashed timer wheel driving the bot's long-running timers.
+
+Queue expiry, prep timers and veto timers used to be one sleeping asyncio
+task each, recreated whenever a timer restarted. The wheel keeps every timer
+in one of a fixed ring of slots (by deadline tick) and a single task wakes
+once per tick to fire whatever is due, so scheduling, rescheduling and
+cancelling are dict operations. Timers are keyed (e.g. ("queue", member_id));
+scheduling an existing key replaces its timer. Resolution is one tick, so
+timers fire up to a tick late, never early.
+"""
+import asyncio
+import inspect
+import logging
+import math
+import time
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+from config import Config
+from utils import tracing
+from utils.metrics import TIMER_LATENESS, TIMERS_PENDING
+
+logger = logging.getLogger('DebateBot.Scheduler')
+
+
+class _Timer:
+    __slots__ = ("key", "deadline", "tick", "callback", "args")
+
+    def __init__(self, key: Hashable, deadline: float, tick: int, callback: Callable, args: tuple):
+        self.key = key
+        self.deadline = deadline
+        self.tick = tick
+        self.callback = callback
+        self.args = args
+
+
+class TimerWheel:
+    """Keyed one-shot timers with O(1) schedule/cancel and one wake-up per tick."""
+
+    def __init__(self, tick: Optional[float] = None, slots: Optional[int] = None):
+        self.tick = Config.TIMER_TICK if tick is None else tick
+        self._slots: List[Dict[Hashable, _Timer]] = [{} for _ in range(Config.TIMER_SLOTS if slots is None else slots)]
+        self._timers: Dict[Hashable, _Timer] = {}
+        self._origin = time.monotonic()
+        self._next_tick = 0  # first tick not yet processed
+        self._wakeup: Optional[asyncio.Event] = None
+        self._runner: Optional[asyncio.Task] = None
+        self._callbacks: set = set()  # running coroutine callbacks, kept referenced
+
+    def __len__(self) -> int:
+        return len(self._timers)
+
+    def _tick_of(self, deadline: float) -> int:
+        # Round up so a timer never fires before its deadline
+        return max(self._next_tick, math.ceil((deadline - self._origin) / self.tick))
+
+    def schedule(self, key: Hashable, delay: float, callback: Callable, *args) -> float:
+        """Call callback(*args) after delay seconds, replacing any timer under key.
+
+        callback may be a plain function or a coroutine function; coroutines
+        run as their own tasks so a slow one can't hold up the wheel. Returns
+        the deadline (time.monotonic() based).
+        """
+        self.cancel(key)
+        deadline = time.monotonic() + delay
+        timer = _Timer(key, deadline, self._tick_of(deadline), callback, args)
+        self._timers[key] = timer
+        self._slots[timer.tick % len(self._slots)][key] = timer
+        self._ensure_running()
+        return deadline
+
+    def cancel(self, key: Hashable) -> bool:
+        """Cancel the timer under key; False if there wasn't one."""
+        timer = self._timers.pop(key, None)
+        if timer is None:
+            return False
+        self._slots[timer.tick % len(self._slots)].pop(key, None)
+        return True
+
+    def deadline(self, key: Hashable) -> Optional[float]:
+        """The pending timer's deadline (time.monotonic() based), or None."""
+        timer = self._timers.get(key)
+        return timer.deadline if timer else None
+
+    def remaining(self, key: Hashable) -> Optional[float]:
+        """Seconds until the timer under key fires, or None if there isn't one."""
+        deadline = self.deadline(key)
+        return None if deadline is None else max(0.0, deadline - time.monotonic())
+
+    def pending(self, prefix: Optional[str] = None) -> List[Tuple[Hashable, float]]:
+        """(key, seconds remaining) for pending timers, soonest first.
+
+        With prefix, only tuple keys whose first element equals it (e.g. "queue").
+        """
+        now = time.monotonic()
+        timers = [
+            (timer.key, max(0.0, timer.deadline - now)) for timer in self._timers.values()
+            if prefix is None or (isinstance(timer.key, tuple) and timer.key[0] == prefix)
+        ]
+        return sorted(timers, key=lambda item: item[1])
+
+    def _ensure_running(self):
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+        self._wakeup.set()
+        if self._runner is None or self._runner.done():
+            self._runner = asyncio.create_task(self._run())
+
+    async def _run(self):
+        # Started by whichever interaction scheduled first; its timers aren't part of that trace
+        tracing.detach()
+        while True:
+            if not self._timers:
+                # Nothing scheduled: sleep until schedule() wakes us instead of ticking idly
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                self._next_tick = max(self._next_tick, int((time.monotonic() - self._origin) / self.tick))
+                continue
+            next_at = self._origin + self._next_tick * self.tick
+            delay = next_at - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            # Catch up on every tick that has passed (e.g. after the loop was blocked)
+            current = int((time.monotonic() - self._origin) / self.tick)
+            while self._next_tick <= current:
+                self._fire(self._next_tick)
+                self._next_tick += 1
+
+    def _fire(self, tick: int):
+        slot = self._slots[tick % len(self._slots)]
+        due = [timer for timer in slot.values() if timer.tick <= tick]
+        for timer in due:
+            del slot[timer.key]
+            del self._timers[timer.key]
+        now = time.monotonic()
+        for timer in due:
+            TIMER_LATENESS.observe(now - timer.deadline)
+            try:
+                result = timer.callback(*timer.args)
+                if inspect.isawaitable(result):
+                    name = timer.key[0] if isinstance(timer.key, tuple) else timer.key
+                    task = asyncio.ensure_future(tracing.traced_call(f"timer:{name}", result))
+                    self._callbacks.add(task)
+                    task.add_done_callback(self._callback_done)
+            except Exception as e:
+                logger.error(f"Timer {timer.key!r} failed: {e}", exc_info=True)
+
+    def _callback_done(self, task: asyncio.Task):
+        self._callbacks.discard(task)
+        if not task.cancelled() and task.exception():
+            logger.error(f"Timer callback failed: {task.exception()}", exc_info=task.exception())
+
+
+_scheduler: Optional[TimerWheel] = None
+
+
+def get_scheduler() -> TimerWheel:
+    """The process-wide timer wheel, shared by the cogs."""
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = TimerWheel()
+        TIMERS_PENDING.set_function(_scheduler.__len__)
+    return _scheduler
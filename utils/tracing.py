@@ -0,0 +1,220 @@
+"""Per-interaction tracing: where the time in one slash command or click went.
+
+trace() opens the root span for an interaction. span() and @traced open
+child spans under whichever span is current. That span lives in a
+contextvar, so spans follow awaits and the tasks gathered under them.
+Outside a trace they cost a contextvar lookup and nothing else.
+
+These are instrumented once at startup:
+- Discord API requests
+- utils.database calls
+- EmbedBuilder renders
+
+Slash commands are traced in DebateBot.invoke_application_command, and
+button, select and modal callbacks by @traced_interaction on each callback.
+
+A trace that takes at least Config.TRACE_SLOW_THRESHOLD is logged as one
+JSON line. The line holds the span tree, with start offsets and durations
+in ms, plus the total time per kind of span (discord, db, embed).
+Concurrent spans overlap, so those totals can exceed the wall time.
+"""
+import contextvars
+import functools
+import inspect
+import json
+import logging
+import time
+from typing import Optional
+
+from config import Config
+
+logger = logging.getLogger('DebateBot.Tracing')
+
+_current: contextvars.ContextVar[Optional['Span']] = contextvars.ContextVar("debatebot_span", default=None)
+
+
+class Span:
+    __slots__ = ("name", "kind", "root", "started", "duration", "error", "children", "attributes",
+                 "count", "dropped", "finished")
+
+    def __init__(self, name: str, kind: str = "", root: Optional['Span'] = None, attributes: Optional[dict] = None):
+        self.name = name
+        self.kind = kind
+        self.root = self if root is None else root
+        self.started = time.perf_counter()
+        self.duration: Optional[float] = None  # None while running
+        self.error: Optional[str] = None
+        self.children: list = []
+        self.attributes = attributes
+        # Kept on the root only: spans recorded, spans over the cap, and whether the trace has ended
+        self.count = 0
+        self.dropped = 0
+        self.finished = False
+
+    def to_dict(self, origin: float) -> dict:
+        data = {"name": self.name, "start_ms": round((self.started - origin) * 1000, 2),
+                "ms": None if self.duration is None else round(self.duration * 1000, 2)}
+        if self.kind:
+            data["kind"] = self.kind
+        if self.error:
+            data["error"] = self.error
+        if self.children:
+            data["children"] = [child.to_dict(origin) for child in self.children]
+        return data
+
+
+def _time_by_kind(span: Span, totals: dict, inside: frozenset = frozenset()) -> dict:
+    """Total ms per span kind, not counting spans nested in a span of the same kind."""
+    if span.kind and span.kind not in inside and span.duration is not None:
+        totals[span.kind] = totals.get(span.kind, 0.0) + span.duration * 1000
+        inside = inside | {span.kind}
+    for child in span.children:
+        _time_by_kind(child, totals, inside)
+    return totals
+
+
+def _finish(root: Span):
+    root.finished = True
+    if root.duration < Config.TRACE_SLOW_THRESHOLD:
+        return
+    record = {
+        "trace": root.name, "ms": round(root.duration * 1000, 2), **(root.attributes or {}),
+        "by_kind_ms": {kind: round(ms, 2) for kind, ms in _time_by_kind(root, {}).items()},
+        "spans": root.count, "dropped": root.dropped,
+        "children": [child.to_dict(root.started) for child in root.children],
+    }
+    logger.warning(f"Slow trace: {json.dumps(record, default=str)}")
+
+
+class _Scope:
+    """Context manager behind trace() and span(); a no-op when there's nothing to record into."""
+    __slots__ = ("name", "kind", "attributes", "is_root", "span", "token")
+
+    def __init__(self, name: str, kind: str, attributes: Optional[dict], is_root: bool):
+        self.name = name
+        self.kind = kind
+        self.attributes = attributes
+        self.is_root = is_root
+        self.span: Optional[Span] = None
+
+    def __enter__(self) -> Optional[Span]:
+        parent = _current.get()
+        if parent is None or parent.root.finished:
+            if not self.is_root:
+                return None
+            self.span = Span(self.name, self.kind, attributes=self.attributes)
+        else:
+            # A trace opened inside another (e.g. a command run from a traced callback) is one of its spans
+            root = parent.root
+            if root.count >= Config.TRACE_MAX_SPANS:
+                root.dropped += 1
+                return None
+            root.count += 1
+            self.span = Span(self.name, self.kind, root, self.attributes)
+            parent.children.append(self.span)
+        self.token = _current.set(self.span)
+        return self.span
+
+    def __exit__(self, exc_type, exc, tb):
+        span = self.span
+        if span is None:
+            return False
+        span.duration = time.perf_counter() - span.started
+        if exc_type is not None:
+            span.error = exc_type.__name__
+        _current.reset(self.token)
+        if span.root is span:
+            _finish(span)
+        return False
+
+
+def trace(name: str, **attributes) -> _Scope:
+    """Open the root span for an interaction: `with trace("/queue", user=member.id): ...`."""
+    return _Scope(name, "", attributes or None, True)
+
+
+def span(name: str, kind: str = "") -> _Scope:
+    """Time a block as a child of the current span, if there is one."""
+    return _Scope(name, kind, None, False)
+
+
+def traced(name: Optional[str] = None, kind: str = ""):
+    """Decorator: run each call (sync or async) in a span named after the function."""
+    def decorator(func):
+        label = name or func.__qualname__
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                with _Scope(label, kind, None, False):
+                    return await func(*args, **kwargs)
+        else:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with _Scope(label, kind, None, False):
+                    return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def traced_methods(prefix: str, kind: str = ""):
+    """Class decorator: trace every static method whose name starts with prefix."""
+    def decorator(cls):
+        for attr, value in list(vars(cls).items()):
+            if attr.startswith(prefix) and isinstance(value, staticmethod):
+                setattr(cls, attr, staticmethod(traced(f"{cls.__name__}.{attr}", kind)(value.__func__)))
+        return cls
+    return decorator
+
+
+def traced_interaction(name: Optional[str] = None):
+    """Decorator for a component or modal callback: run each call as its own trace.
+
+    The interaction is the callback's last argument. Goes under
+    @discord.ui.button, since py-cord then calls the wrapper.
+    """
+    def decorator(func):
+        label = name or func.__qualname__.replace(".<locals>", "")
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            interaction = kwargs.get("interaction", args[-1] if args else None)
+            user = getattr(getattr(interaction, "user", None), "id", None)
+            with trace(label, user=user):
+                return await func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+async def traced_call(name: str, awaitable, **attributes):
+    """Await awaitable as its own trace (e.g. a timer callback running as a task)."""
+    with trace(name, **attributes):
+        return await awaitable
+
+
+def detach():
+    """Stop recording into the inherited trace; for background tasks started from an interaction.
+
+    Tasks copy the context they were created in, so this only affects the
+    calling task.
+    """
+    _current.set(None)
+
+
+async def detached(awaitable):
+    """Await awaitable outside any trace; wrap a coroutine in this before create_task()."""
+    detach()
+    return await awaitable
+
+
+# ─── Instrumentation ─────────────────────────────────────────────
+
+def instrument_http(http):
+    """Trace every request a py-cord HTTPClient makes, by route template."""
+    request = http.request
+
+    async def traced_request(route, **kwargs):
+        with _Scope(f"{route.method} {route.path}", "discord", None, False):
+            return await request(route, **kwargs)
+
+    http.request = traced_request
+
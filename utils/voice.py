@@ -0,0 +1,69 @@
+"""Bulk voice moves: every member moved at once, within the guild's rate limit.
+
+Member moves all go through the guild's member-edit route, so they share one
+rate-limit bucket. move_members() runs them concurrently under a semaphore,
+retries 429s and Discord server errors with exponential backoff, and hands
+back the moves that still failed so the caller can tell the round about them.
+"""
+import asyncio
+import logging
+from typing import Iterable, List, Optional, Tuple
+
+import discord
+
+from config import Config
+from utils.concurrency import backoff_delay, is_retryable
+
+logger = logging.getLogger('DebateBot.Voice')
+
+
+def describe_move_error(error: Exception) -> str:
+    """Short, user-facing reason a move failed."""
+    if isinstance(error, discord.Forbidden):
+        return "the bot lacks the Move Members permission"
+    if isinstance(error, discord.HTTPException):
+        if error.status == 429:
+            return "Discord kept rate limiting the move"
+        if error.status == 400:
+            return "they left voice before they could be moved"
+        return f"Discord returned an error ({error.status})"
+    return str(error) or type(error).__name__
+
+
+async def _move(member: discord.Member, channel, semaphore: asyncio.Semaphore,
+                retries: int, backoff: float) -> Optional[Exception]:
+    for attempt in range(retries + 1):
+        # Not in voice (or already left): nothing to move
+        if not member.voice:
+            return None
+        try:
+            async with semaphore:
+                await member.move_to(channel)
+            return None
+        except Exception as e:
+            if attempt == retries or not is_retryable(e):
+                return e
+            delay = backoff_delay(attempt, backoff)
+            logger.debug(f"Retrying move of {member.display_name} in {delay:.2f}s ({e.status})")
+            await asyncio.sleep(delay)
+
+
+async def move_members(moves: Iterable[Tuple[discord.Member, discord.abc.Connectable]],
+                       limit: Optional[int] = None, retries: Optional[int] = None,
+                       backoff: Optional[float] = None) -> List[Tuple[discord.Member, object, Exception]]:
+    """Move each (member, channel) pair concurrently; members not in voice are skipped.
+
+    Returns (member, channel, error) for every move that failed after retries.
+    """
+    moves = list(moves)
+    semaphore = asyncio.Semaphore(max(1, Config.VOICE_MOVE_CONCURRENCY if limit is None else limit))
+    retries = Config.VOICE_MOVE_RETRIES if retries is None else retries
+    backoff = Config.VOICE_MOVE_BACKOFF if backoff is None else backoff
+
+    errors = await asyncio.gather(*(
+        _move(member, channel, semaphore, retries, backoff) for member, channel in moves
+    ))
+    failures = [(member, channel, error) for (member, channel), error in zip(moves, errors) if error]
+    for member, channel, error in failures:
+        logger.warning(f"Could not move {member.display_name} to {getattr(channel, 'name', channel)}: {error}")
+    return failures